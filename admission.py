@@ -0,0 +1,138 @@
+"""
+Cardano Career Navigator - Admission Control
+Load-aware job admission and runtime estimates for /availability
+"""
+
+import math
+import os
+from typing import Any, Dict, Optional
+
+# Seed runtimes (seconds) until real samples arrive: the midpoints of the advertised estimates
+DEFAULT_RUNTIMES = {
+    "assessment": 150,
+    "assessment:fast": 1,
+    "roadmap": 240,
+    "catalyst": 450,
+    "full_package": 450
+}
+
+
+class RuntimeTracker:
+    """Exponentially weighted moving average of job runtimes per service"""
+
+    def __init__(self, alpha: float = 0.2, defaults: Optional[Dict[str, float]] = None):
+        self.alpha = alpha
+        self._averages: Dict[str, float] = dict(DEFAULT_RUNTIMES if defaults is None else defaults)
+        self._samples: Dict[str, int] = {}
+
+    @staticmethod
+    def key(service_type: str, mode: Optional[str] = None) -> str:
+        return f"{service_type}:{mode}" if mode and mode != "crew" else service_type
+
+    def record(self, key: str, seconds: float):
+        previous = self._averages.get(key)
+        if previous is None or not self._samples.get(key):
+            self._averages[key] = seconds
+        else:
+            self._averages[key] = previous + self.alpha * (seconds - previous)
+        self._samples[key] = self._samples.get(key, 0) + 1
+
+    def estimate(self, key: str) -> float:
+        return self._averages.get(key, max(self._averages.values(), default=0))
+
+    def mean(self) -> float:
+        """Average runtime across services, used to size queue waits"""
+        sampled = [self._averages[key] for key in self._samples] or list(self._averages.values())
+        return sum(sampled) / len(sampled) if sampled else 0
+
+    def samples(self, key: str) -> int:
+        return self._samples.get(key, 0)
+
+
+class Rejection:
+    def __init__(self, status_code: int, reason: str, retry_after: int):
+        self.status_code = status_code
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Turns work away before it is queued once the agent is saturated.
+
+    ``max_in_flight`` bounds jobs that are queued or running (429: come back
+    shortly); ``max_queue_depth`` bounds jobs waiting for a worker (503: the
+    backlog is long). Both answer with a Retry-After sized from the EWMA of
+    recent runtimes.
+
+    In-flight jobs are at most workers + queue depth, so ``max_in_flight``
+    only bites when set below that sum, and a ``max_queue_depth`` above the
+    executor's queue size leaves the executor to reject first. Unset limits
+    default to the executor's own capacity: 503 exactly when its queue is
+    full, and no 429 until ``max_in_flight`` is configured lower.
+    """
+
+    def __init__(self, executor, runtimes: RuntimeTracker, max_in_flight: Optional[int] = None,
+                 max_queue_depth: Optional[int] = None):
+        self.executor = executor
+        self.runtimes = runtimes
+        stats = executor.stats()
+        self.max_queue_depth = min(max_queue_depth or stats["max_queue_size"], stats["max_queue_size"])
+        capacity = stats["workers"] + self.max_queue_depth
+        self.max_in_flight = max_in_flight or capacity
+        self.rejected = 0
+
+        if max_queue_depth and max_queue_depth > stats["max_queue_size"]:
+            print(f"ADMISSION_MAX_QUEUE_DEPTH={max_queue_depth} exceeds JOB_QUEUE_SIZE; "
+                  f"using {self.max_queue_depth}")
+        if max_in_flight and max_in_flight >= capacity:
+            print(f"ADMISSION_MAX_IN_FLIGHT={max_in_flight} is never reached with {stats['workers']} workers "
+                  f"and a queue depth limit of {self.max_queue_depth}; 429s are off")
+
+    def load(self) -> Dict[str, Any]:
+        stats = self.executor.stats()
+        in_flight = stats["busy_workers"] + stats["queue_depth"]
+        return dict(stats, in_flight=in_flight, max_in_flight=self.max_in_flight,
+                    max_queue_depth=self.max_queue_depth, rejected=self.rejected)
+
+    def estimated_wait(self, load: Optional[Dict[str, Any]] = None) -> float:
+        """Seconds until a newly queued job would reach a worker"""
+        load = load or self.load()
+        if load["busy_workers"] < load["workers"] and load["queue_depth"] == 0:
+            return 0.0
+        # Jobs ahead of us, drained by all workers in parallel
+        return (load["queue_depth"] + 1) / max(load["workers"], 1) * self.runtimes.mean()
+
+    def check(self) -> Optional[Rejection]:
+        """None if a new job may be queued, otherwise why not and when to retry"""
+        rejection = self.check_load(self.load())
+        if rejection is not None:
+            self.rejected += 1
+        return rejection
+
+    def check_load(self, load: Dict[str, Any]) -> Optional[Rejection]:
+        """Admission decision for a load snapshot, without counting it as a rejection"""
+        if load["queue_depth"] >= self.max_queue_depth:
+            reason = f"Job backlog is full ({load['queue_depth']} jobs waiting)"
+            return Rejection(503, reason, self._retry_after(load))
+        if load["in_flight"] >= self.max_in_flight:
+            return Rejection(429, f"Too many jobs in flight ({load['in_flight']})", self._retry_after(load))
+        return None
+
+    def _retry_after(self, load: Dict[str, Any]) -> int:
+        return max(1, math.ceil(self.estimated_wait(load)))
+
+
+def format_duration(seconds: float) -> str:
+    if seconds < 60:
+        seconds = max(1, round(seconds))
+        return f"{seconds} second{'s' if seconds != 1 else ''}"
+    return f"{round(seconds / 60, 1):g} minutes"
+
+
+def create_admission_controller(executor) -> AdmissionController:
+    return AdmissionController(
+        executor,
+        RuntimeTracker(alpha=float(os.getenv("ADMISSION_RUNTIME_ALPHA", 0.2))),
+        max_in_flight=int(os.getenv("ADMISSION_MAX_IN_FLIGHT") or 0) or None,
+        max_queue_depth=int(os.getenv("ADMISSION_MAX_QUEUE_DEPTH") or 0) or None
+    )
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Cardano Career Navigator - Benchmark
+Offline load test of /start_job + /status against a fake LLM, reported as JSON
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+# Service specs accepted by --services; "assessment:fast" selects the fast assessment mode and
+# "roadmap:cached" serves roadmaps from archetype skeletons (every benchmark wallet has the same one)
+DEFAULT_SERVICES = "assessment,assessment:fast,roadmap,roadmap:cached,catalyst,full_package"
+
+# Spec variants that change the benchmark setup rather than the request
+SETUP_VARIANTS = {"cached"}
+
+# Limits that would otherwise turn benchmark traffic away
+UNLIMITED = str(10 ** 6)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline throughput and latency benchmark")
+    parser.add_argument("--services", default=DEFAULT_SERVICES,
+                        help=f"Comma-separated service[:mode] list, one phase each (default: {DEFAULT_SERVICES})")
+    parser.add_argument("--jobs", type=int, default=20, help="Measured jobs per service")
+    parser.add_argument("--warmup", type=int, default=1, help="Unmeasured jobs per service run first")
+    parser.add_argument("--concurrency", type=int, default=8, help="Clients submitting jobs in parallel")
+    parser.add_argument("--workers", type=int, default=4, help="JOB_WORKERS for the executor")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="Seconds every fake LLM call takes")
+    parser.add_argument("--llm-jitter", type=float, default=0.0, help="Extra seconds (0..jitter) per call, seeded")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the fake LLM jitter")
+    parser.add_argument("--lag-interval", type=float, default=0.01, help="Event loop lag sampling interval (seconds)")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    parser.add_argument("--verbose", action="store_true", help="Keep crew console output")
+    return parser.parse_args(argv)
+
+
+def configure_environment(args: argparse.Namespace):
+    """Settings for an offline, unthrottled run; must happen before main is imported"""
+    # Never reach OpenAI, Blockfrost, remote Catalyst snapshots or telemetry endpoints
+    os.environ.update({
+        "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY") or "offline-benchmark",
+        "BLOCKFROST_PROJECT_ID": "",
+        "CATALYST_SNAPSHOT_SOURCE": "",
+        "CREWAI_DISABLE_TELEMETRY": "true",
+        "OTEL_SDK_DISABLED": "true",
+        "JOB_EXECUTOR_MODE": "thread",
+        "JOB_WORKERS": str(args.workers),
+        "TRACE_EXPORT_PATH": ""
+    })
+    for name, value in {
+        "JOB_QUEUE_SIZE": UNLIMITED,
+        "RATE_LIMIT_PURCHASER_BURST": "0",
+        "RATE_LIMIT_WALLET_BURST": "0",
+        "RATE_LIMIT_BACKEND": "memory",
+        "JOB_STORE_BACKEND": "memory",
+        "RESULT_CACHE_DIR": "",
+        # Every roadmap runs the full crew; the roadmap:cached phase measures skeleton hits
+        "ROADMAP_SKELETON_TTL": "0"
+    }.items():
+        os.environ.setdefault(name, value)
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize_ms(values: List[float]) -> Dict[str, Optional[float]]:
+    def ms(value: Optional[float]) -> Optional[float]:
+        return None if value is None else round(value * 1000, 3)
+
+    return {
+        "p50": ms(percentile(values, 50)),
+        "p95": ms(percentile(values, 95)),
+        "p99": ms(percentile(values, 99)),
+        "max": ms(max(values, default=None)),
+        "mean": ms(sum(values) / len(values) if values else None)
+    }
+
+
+class LoopLagMonitor:
+    """Samples how late the event loop wakes a sleeping task"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - started - self.interval))
+
+    def start(self):
+        self.samples = []
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> List[float]:
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        return self.samples
+
+
+async def run_job(client, service_type: str, mode: Optional[str], wallet: str,
+                  terminal: set) -> Tuple[float, str]:
+    """Submit one job and long-poll /status until it finishes; returns (seconds, outcome)"""
+    input_data = {"type": service_type, "user_address": wallet}
+    if mode:
+        input_data["mode"] = mode
+
+    started = time.perf_counter()
+    response = await client.post("/start_job", json={
+        "identifier_from_purchaser": f"benchmark-{wallet}",
+        "input_data": input_data
+    })
+    if response.status_code != 200:
+        return time.perf_counter() - started, f"rejected_{response.status_code}"
+
+    job_id = response.json()["job_id"]
+    while True:
+        status = await client.get("/status", params={"job_id": job_id, "wait": 30, "fields": "status"})
+        outcome = status.json()["status"]
+        if outcome in terminal:
+            return time.perf_counter() - started, outcome
+
+
+async def run_phase(client, spec: str, jobs: int, concurrency: int, terminal: set, run_id: str,
+                    lag: Optional[LoopLagMonitor] = None) -> Dict[str, Any]:
+    """Closed-loop load: `concurrency` clients each submit their next job as soon as one finishes"""
+    service_type, _, mode = spec.partition(":")
+    if mode in SETUP_VARIANTS:
+        mode = ""
+    latencies: List[float] = []
+    outcomes: Dict[str, int] = {}
+    next_index = iter(range(jobs))
+
+    async def client_loop():
+        for index in next_index:
+            # A fresh wallet per job so neither the result cache nor coalescing short-circuits it
+            wallet = f"addr_bench_{run_id}_{spec.replace(':', '_')}_{index}"
+            seconds, outcome = await run_job(client, service_type, mode or None, wallet, terminal)
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+            if outcome == "completed":
+                latencies.append(seconds)
+
+    if lag is not None:
+        lag.start()
+    started = time.perf_counter()
+    await asyncio.gather(*(client_loop() for _ in range(min(concurrency, jobs))))
+    elapsed = time.perf_counter() - started
+    lag_samples = await lag.stop() if lag is not None else []
+
+    return {
+        "jobs": jobs,
+        "outcomes": outcomes,
+        "elapsed_seconds": round(elapsed, 3),
+        "jobs_per_second": round(outcomes.get("completed", 0) / elapsed, 3) if elapsed else None,
+        "latency_ms": summarize_ms(latencies),
+        "event_loop_lag_ms": summarize_ms(lag_samples)
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+async def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    import httpx
+    import crew_definition
+    import main
+    from fake_llm import FakeLLM
+    from job_store import TERMINAL_STATUSES
+    from roadmap_cache import RoadmapSkeletonCache
+
+    # Every agent and the fast-mode narrative writer answer from the fake LLM
+    crew = crew_definition.CareerNavigatorCrew(
+        llm_factory=lambda route, stream: FakeLLM(
+            model=f"fake/{route.service_type}", latency=args.llm_latency, jitter=args.llm_jitter, seed=args.seed
+        )
+    )
+    crew_definition.career_navigator_crew = crew
+    default_skeletons = crew.roadmap_skeletons
+
+    services = [spec.strip() for spec in args.services.split(",") if spec.strip()]
+    run_id = f"{int(time.time())}"
+    results: Dict[str, Any] = {}
+
+    async with main.lifespan(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+            for spec in services:
+                # A fresh skeleton cache per cached phase, seeded by its warmup jobs
+                crew.roadmap_skeletons = RoadmapSkeletonCache() if spec == "roadmap:cached" else default_skeletons
+                if args.warmup:
+                    await run_phase(client, spec, args.warmup, args.concurrency, TERMINAL_STATUSES,
+                                    f"{run_id}w")
+                lag = LoopLagMonitor(args.lag_interval)
+                results[spec] = await run_phase(client, spec, args.jobs, args.concurrency, TERMINAL_STATUSES,
+                                                run_id, lag)
+
+    return {
+        "benchmark": "cardano-career-navigator",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "jobs": args.jobs,
+            "warmup": args.warmup,
+            "concurrency": args.concurrency,
+            "workers": args.workers,
+            "llm_latency": args.llm_latency,
+            "llm_jitter": args.llm_jitter,
+            "seed": args.seed,
+            "roadmap_skeleton_ttl": float(os.environ["ROADMAP_SKELETON_TTL"])
+        },
+        "services": results
+    }
+
+
+def main_cli(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    configure_environment(args)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    if args.verbose:
+        report = asyncio.run(run_benchmark(args))
+    else:
+        # Agents are verbose; keep stdout for the report
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            report = asyncio.run(run_benchmark(args))
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(output + "\n")
+    print(output)
+
+    # Non-zero when any measured job did not complete, so CI notices
+    failed = any(set(phase["outcomes"]) - {"completed"} for phase in report["services"].values())
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
@@ -0,0 +1,252 @@
+"""
+Cardano Career Navigator - Catalyst Opportunity Index
+In-memory inverted index over a snapshot of Catalyst rounds, categories and bounties
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import requests
+
+DEFAULT_SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "catalyst_snapshot.json")
+
+EXPERIENCE_RANK = {"beginner": 0, "intermediate": 1, "advanced": 2}
+
+# Relevance weights, following DataIntegration._calculateBountyRelevance
+EXACT_MATCH_SCORE = 10
+PARTIAL_MATCH_SCORE = 5
+MAX_BUDGET_BONUS = 5
+URGENT_DEADLINE_DAYS = 30
+URGENT_DEADLINE_PENALTY = 2
+ABOVE_LEVEL_PENALTY = 3
+
+# Skill expansions memoised per index; skills come from LLM output, so the memo is an LRU
+MAX_EXPANSIONS = 2048
+
+
+def _parse_deadline(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def normalize_snapshot(snapshot: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Flatten rounds/categories and bounties into one opportunity list"""
+    opportunities = []
+
+    for round_ in snapshot.get("rounds", []):
+        deadline = round_.get("timeline", {}).get("proposalSubmission")
+        min_experience = round_.get("requirements", {}).get("minExperience", "beginner")
+        for category in round_.get("categories", []):
+            opportunities.append({
+                "id": f"{round_['id']}:{category['id']}",
+                "kind": "catalyst-category",
+                "round": round_.get("name", round_["id"]),
+                "title": category["name"],
+                "description": category.get("description", ""),
+                # Most a single proposal can request; falls back to the category budget
+                "budget": category.get("maxProposalBudget", category.get("budget", 0)),
+                "min_budget": category.get("minProposalBudget", 0),
+                "deadline": deadline,
+                "difficulty": min_experience,
+                "tags": sorted({tag.lower() for tag in category.get("requiredSkills", [])})
+            })
+
+    for bounty in snapshot.get("bounties", []):
+        if bounty.get("status", "open") != "open":
+            continue
+        opportunities.append({
+            "id": f"bounty:{bounty['id']}",
+            "kind": "bounty",
+            "round": bounty.get("organization", "Bounty"),
+            "title": bounty["title"],
+            "description": bounty.get("description", ""),
+            "budget": bounty.get("reward", 0),
+            "min_budget": bounty.get("reward", 0),
+            "deadline": bounty.get("deadline"),
+            "difficulty": bounty.get("difficulty", "beginner"),
+            "tags": sorted({tag.lower() for tag in bounty.get("requiredSkills", []) + bounty.get("tags", [])})
+        })
+
+    return opportunities
+
+
+class OpportunityIndex:
+    """Immutable index answering skill-matching queries from memory.
+
+    ``by_tag`` maps each skill/interest tag to the opportunities carrying
+    it, so a query only scores opportunities that share at least one term
+    with the user instead of scanning the whole snapshot.
+    """
+
+    def __init__(self, snapshot: Dict[str, Any]):
+        self.opportunities = normalize_snapshot(snapshot)
+        self.version = snapshot.get("version") or hashlib.sha256(
+            json.dumps(snapshot, sort_keys=True).encode()
+        ).hexdigest()[:16]
+        self.loaded_at = time.time()
+
+        self.by_tag: Dict[str, List[int]] = {}
+        for position, opportunity in enumerate(self.opportunities):
+            opportunity["deadline_ts"] = _parse_deadline(opportunity["deadline"])
+            for tag in opportunity["tags"]:
+                self.by_tag.setdefault(tag, []).append(position)
+
+        # A refresh builds a new index, so the memo never outlives its snapshot
+        self._expansions: "OrderedDict[str, Dict[str, int]]" = OrderedDict()
+        self._expansions_lock = threading.Lock()
+
+    def _expand(self, skill: str) -> Dict[str, int]:
+        """Tags matched by a skill with their score (exact or substring)"""
+        with self._expansions_lock:
+            expansion = self._expansions.get(skill)
+            if expansion is not None:
+                self._expansions.move_to_end(skill)
+                return expansion
+
+        expansion = {}
+        for tag in self.by_tag:
+            if tag == skill:
+                expansion[tag] = EXACT_MATCH_SCORE
+            elif tag in skill or skill in tag:
+                expansion[tag] = PARTIAL_MATCH_SCORE
+
+        with self._expansions_lock:
+            self._expansions[skill] = expansion
+            while len(self._expansions) > MAX_EXPANSIONS:
+                self._expansions.popitem(last=False)
+        return expansion
+
+    def match(self, skills: Iterable[str], experience_level: Optional[str] = None, top_k: int = 5,
+              min_budget: Optional[float] = None, max_budget: Optional[float] = None,
+              deadline_after: Optional[float] = None, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Rank opportunities for a skill set; open ones come before closed ones"""
+        now = now if now is not None else time.time()
+        user_rank = EXPERIENCE_RANK.get((experience_level or "").lower())
+
+        scores: Dict[int, float] = {}
+        matched: Dict[int, Set[str]] = {}
+        for skill in {skill.strip().lower() for skill in skills if skill and skill.strip()}:
+            for tag, score in self._expand(skill).items():
+                for position in self.by_tag[tag]:
+                    scores[position] = scores.get(position, 0) + score
+                    matched.setdefault(position, set()).add(skill)
+
+        ranked = []
+        for position, score in scores.items():
+            opportunity = self.opportunities[position]
+            deadline_ts = opportunity["deadline_ts"]
+
+            if min_budget is not None and opportunity["budget"] < min_budget:
+                continue
+            if max_budget is not None and opportunity["min_budget"] > max_budget:
+                continue
+            if deadline_after is not None and (deadline_ts is None or deadline_ts < deadline_after):
+                continue
+
+            score += min(opportunity["budget"] / 1000, MAX_BUDGET_BONUS)
+            days_left = (deadline_ts - now) / 86400 if deadline_ts is not None else None
+            if days_left is not None and days_left < URGENT_DEADLINE_DAYS:
+                score -= URGENT_DEADLINE_PENALTY
+            if user_rank is not None and EXPERIENCE_RANK.get(opportunity["difficulty"], 0) > user_rank:
+                score -= ABOVE_LEVEL_PENALTY
+
+            is_open = days_left is None or days_left >= 0
+            ranked.append((is_open, score, position, days_left))
+
+        ranked.sort(key=lambda item: (item[0], item[1], -item[2]), reverse=True)
+
+        results = []
+        for is_open, score, position, days_left in ranked[:top_k]:
+            opportunity = self.opportunities[position]
+            results.append({
+                "id": opportunity["id"],
+                "kind": opportunity["kind"],
+                "round": opportunity["round"],
+                "category": opportunity["title"],
+                "budget": f"{opportunity['budget']} ADA",
+                "deadline": opportunity["deadline"],
+                "days_until_deadline": int(days_left) if days_left is not None else None,
+                "is_open": is_open,
+                "difficulty": opportunity["difficulty"],
+                "score": round(float(score), 2),
+                "match_reason": f"{', '.join(sorted(matched[position]))} skills"
+            })
+        return results
+
+
+def load_snapshot(source: str) -> Dict[str, Any]:
+    """Load a snapshot from a file path or an http(s) URL"""
+    if source.startswith(("http://", "https://")):
+        response = requests.get(source, timeout=10)
+        response.raise_for_status()
+        return response.json()
+    with open(source) as f:
+        return json.load(f)
+
+
+class CatalystIndexManager:
+    """Holds the current index and swaps in a fresh one on a schedule.
+
+    Queries read ``self.index`` without locking; a refresh builds a new
+    index off to the side and replaces the reference in one assignment.
+    """
+
+    def __init__(self, source: str = DEFAULT_SNAPSHOT_PATH, refresh_seconds: float = 3600):
+        self.source = source
+        self.refresh_seconds = refresh_seconds
+        self.index = OpportunityIndex(load_snapshot(source))
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def refresh(self) -> bool:
+        """Reload the snapshot; returns True when its version changed"""
+        try:
+            index = OpportunityIndex(load_snapshot(self.source))
+        except (OSError, ValueError, requests.RequestException) as e:
+            print(f"Catalyst snapshot refresh failed, keeping version {self.index.version}: {e}")
+            return False
+        changed = index.version != self.index.version
+        self.index = index
+        return changed
+
+    def start(self):
+        """Refresh in a daemon thread every refresh_seconds"""
+        if self._thread is not None or self.refresh_seconds <= 0:
+            return
+        self._thread = threading.Thread(target=self._run, name="catalyst-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.refresh_seconds):
+            self.refresh()
+
+
+_manager: Optional[CatalystIndexManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_catalyst_index_manager() -> CatalystIndexManager:
+    """Shared manager built from the environment on first use"""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = CatalystIndexManager(
+                source=os.getenv("CATALYST_SNAPSHOT_SOURCE") or DEFAULT_SNAPSHOT_PATH,
+                refresh_seconds=float(os.getenv("CATALYST_REFRESH_SECONDS", 3600))
+            )
+            _manager.start()
+        return _manager
+
+
+def get_catalyst_index() -> OpportunityIndex:
+    return get_catalyst_index_manager().index
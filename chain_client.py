@@ -0,0 +1,148 @@
+"""
+Cardano Career Navigator - Chain Data Client
+Pooled, paginated client for Blockfrost-compatible HTTP APIs
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Blockfrost's maximum page size
+PAGE_SIZE = 100
+
+
+class ChainDataError(RuntimeError):
+    """Raised when the chain API returns an unexpected response"""
+
+
+class BlockfrostClient:
+    """Blockfrost API client with connection pooling and bounded fan-out.
+
+    A single ``requests.Session`` keeps up to ``max_concurrency`` connections
+    alive, and per-transaction lookups run on a thread pool of the same size
+    instead of one sequential round-trip per transaction.
+    """
+
+    def __init__(self, base_url: str, project_id: str, max_concurrency: int = 10,
+                 timeout: float = 10, max_retries: int = 3):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",)
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"project_id": project_id, "Accept": "application/json"})
+
+        self._pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="chain-fetch")
+
+    def close(self):
+        self._pool.shutdown(wait=False)
+        self.session.close()
+
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """GET a JSON resource; returns None when the API answers 404"""
+        response = self.session.get(f"{self.base_url}{path}", params=params, timeout=self.timeout)
+        if response.status_code == 404:
+            return None
+        if response.status_code >= 400:
+            raise ChainDataError(f"GET {path} failed with {response.status_code}: {response.text[:200]}")
+        return response.json()
+
+    def paginate(self, path: str, params: Optional[Dict[str, Any]] = None,
+                 max_items: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yield items from a paged list endpoint until it runs out or max_items is reached"""
+        page = 1
+        yielded = 0
+        while True:
+            items = self.get(path, dict(params or {}, page=page, count=PAGE_SIZE)) or []
+            for item in items:
+                if max_items is not None and yielded >= max_items:
+                    return
+                yield item
+                yielded += 1
+            if len(items) < PAGE_SIZE:
+                return
+            page += 1
+
+    def address_transactions(self, address: str, max_items: Optional[int] = None,
+                             order: str = "desc") -> List[Dict[str, Any]]:
+        """List transactions touching an address (tx_hash, tx_index, block_height, block_time)"""
+        return list(self.iter_address_transactions(address, max_items, order))
+
+    def iter_address_transactions(self, address: str, max_items: Optional[int] = None, order: str = "desc",
+                                  from_block: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Lazily page through an address's transactions; stop early to skip later pages.
+
+        ``from_block`` ("height" or "height:index", inclusive) starts the listing at that block.
+        """
+        params = {"order": order}
+        if from_block is not None:
+            params["from"] = from_block
+        return self.paginate(f"/addresses/{address}/transactions", params, max_items)
+
+    def transaction_details(self, tx_hashes: List[str]) -> List[Dict[str, Any]]:
+        """Fetch content and metadata for many transactions concurrently.
+
+        Transactions whose lookup fails are skipped, mirroring the analyzer's
+        behaviour of warning and moving on.
+        """
+        return self.fetch_transaction_details(tx_hashes)[0]
+
+    def fetch_transaction_details(self, tx_hashes: List[str]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Like transaction_details, but also return the hashes whose lookup failed (in input order)"""
+        futures = [self._pool.submit(self._transaction_detail, tx_hash) for tx_hash in tx_hashes]
+        details = []
+        failed = []
+        for tx_hash, future in zip(tx_hashes, futures):
+            try:
+                detail = future.result()
+            except (requests.RequestException, ChainDataError) as e:
+                print(f"Could not fetch details for tx {tx_hash}: {e}")
+                failed.append(tx_hash)
+                continue
+            if detail is not None:
+                details.append(detail)
+        return details, failed
+
+    def _transaction_detail(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        tx = self.get(f"/txs/{tx_hash}")
+        if tx is None:
+            return None
+        metadata = self.get(f"/txs/{tx_hash}/metadata") or []
+
+        return {
+            "hash": tx_hash,
+            "block_time": tx.get("block_time"),
+            "block_height": tx.get("block_height"),
+            "slot": tx.get("slot"),
+            "assets": tx.get("output_amount", []),
+            "metadata": {str(entry["label"]): entry.get("json_metadata") for entry in metadata},
+            "certificate_count": tx.get("delegation_count", 0) + tx.get("stake_cert_count", 0)
+        }
+
+
+def create_chain_client() -> Optional[BlockfrostClient]:
+    """Build a client from the environment, or None when no project id is set"""
+    project_id = os.getenv("BLOCKFROST_PROJECT_ID")
+    if not project_id:
+        return None
+
+    return BlockfrostClient(
+        base_url=os.getenv("BLOCKFROST_URL", "https://cardano-preprod.blockfrost.io/api/v0"),
+        project_id=project_id,
+        max_concurrency=int(os.getenv("BLOCKFROST_MAX_CONCURRENCY", 10)),
+        timeout=float(os.getenv("BLOCKFROST_TIMEOUT", 10))
+    )
@@ -5,57 +5,103 @@ A specialized AI agent for personalized Cardano ecosystem career guidance
 
 from crewai import Agent, Task, Crew, Process
 from crewai.tools import BaseTool
-from typing import Dict, Any, List
+from crewai.events import (
+    crewai_event_bus, LLMCallCompletedEvent, LLMCallFailedEvent, LLMCallStartedEvent, LLMStreamChunkEvent
+)
+from typing import Dict, Any, List, Callable, Optional, Tuple
 import json
 import asyncio
+import os
+import threading
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from catalyst_index import get_catalyst_index
+from crew_runtime import ASSESSMENT_MODES, SERVICE_TYPES
+from fast_assessment import build_assessment, create_narrative_writer
+from job_cancel import CancelToken, cancel_scope, checkpoint
+from model_routing import LLMPool, ServiceRoute, create_service_routes, llm_usage, sum_usage, usage_since
+from roadmap_cache import (
+    RoadmapSkeletonCache, archetype_key, create_roadmap_personaliser, make_skeleton, personalise_roadmap,
+    roadmap_skeleton_cache
+)
+from result_models import RESULT_MODELS, AssessmentResult, FullPackageResult, parse_crew_output
+from tool_cache import memoized_run, tool_cache_scope
+from tracing import JobTrace, current_span, current_trace, span, trace_scope
+from wallet_scoring import score_many
+
+# Receives progress events ({"type": "step" | "task" | "token", ...}) for one job
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+# Builds the LLM for a service route (route, stream tokens); defaults to ServiceRoute.build_llm
+LLMFactory = Callable[[ServiceRoute, bool], Any]
+
+# Longest text kept from a single agent step in a progress event
+MAX_STEP_CHARS = 2000
+
+# Per-job agent copies streaming tokens, keyed by agent id
+_token_sinks: Dict[str, ProgressCallback] = {}
+_token_sinks_lock = threading.Lock()
+
+@crewai_event_bus.on(LLMStreamChunkEvent)
+def _route_stream_chunk(source, event):
+    """Forward streamed LLM tokens to the job that owns the agent"""
+    with _token_sinks_lock:
+        sink = _token_sinks.get(event.agent_id)
+    if sink is not None:
+        sink({"type": "token", "agent": event.agent_role, "chunk": event.chunk})
+
+# Handlers run in a copy of the emitting context, so the job's trace is visible here
+@crewai_event_bus.on(LLMCallStartedEvent)
+def _trace_llm_started(source, event):
+    trace = current_trace()
+    if trace is not None and event.call_id:
+        trace.llm_call(event.call_id, "started", event.timestamp.timestamp(), parent=current_span(),
+                       agent=event.agent_role, model=event.model)
+
+@crewai_event_bus.on(LLMCallCompletedEvent)
+def _trace_llm_completed(source, event):
+    trace = current_trace()
+    if trace is not None and event.call_id:
+        usage = event.usage or {}
+        trace.llm_call(event.call_id, "completed", event.timestamp.timestamp(),
+                       prompt_tokens=usage.get("prompt_tokens"), completion_tokens=usage.get("completion_tokens"))
+
+@crewai_event_bus.on(LLMCallFailedEvent)
+def _trace_llm_failed(source, event):
+    trace = current_trace()
+    if trace is not None and event.call_id:
+        trace.llm_call(event.call_id, "failed", event.timestamp.timestamp(), error=str(event.error)[:200])
+
 class CardanoAnalysisTool(BaseTool):
     name: str = "cardano_analysis_tool"
     description: str = "Analyzes Cardano wallet transactions to determine user skills and experience"
     
+    @memoized_run
     def _run(self, wallet_address: str) -> str:
         """Analyze Cardano wallet for career insights"""
-        # Mock analysis for demo - in production, integrate with your existing analyzer.js
-        analysis = {
-            "experience_level": "intermediate",
-            "transaction_count": 45,
-            "technical_skills": ["staking", "defi", "nft-trading", "begin-wallet"],
-            "interests": ["real-world-utility", "travel", "governance"],
-            "preferred_path": "development",
-            "learning_style": "hands-on"
-        }
+        # Demo profile unless BLOCKFROST_PROJECT_ID is configured
+        analysis = score_many([wallet_address])[0]
         return json.dumps(analysis)
 
 class CatalystOpportunityTool(BaseTool):
     name: str = "catalyst_opportunity_tool"
-    description: str = "Fetches current Project Catalyst opportunities matching user profile"
+    description: str = "Finds current Project Catalyst rounds and bounties matching the user's skills and experience level"
     
+    @memoized_run(version=lambda: get_catalyst_index().version)
     def _run(self, user_skills: str, experience_level: str) -> str:
         """Get relevant Catalyst opportunities"""
-        # Mock opportunities - integrate with your dataIntegration.js
-        opportunities = [
-            {
-                "round": "Fund 12",
-                "category": "Developer Tools",
-                "budget": "50000 ADA",
-                "deadline": "2025-02-15",
-                "match_reason": "development skills"
-            },
-            {
-                "round": "Fund 12", 
-                "category": "Real World Adoption",
-                "budget": "75000 ADA",
-                "deadline": "2025-02-15",
-                "match_reason": "begin-wallet integration"
-            }
-        ]
+        # Answered from the in-memory snapshot index; no network call per request
+        opportunities = get_catalyst_index().match(parse_skill_list(user_skills), experience_level)
         return json.dumps(opportunities)
 
 class BeginWalletIntegrationTool(BaseTool):
     name: str = "begin_wallet_tool"
     description: str = "Generates Begin Wallet specific integration tips and eSIM rewards"
     
+    @memoized_run
     def _run(self, user_profile: str) -> str:
         """Generate Begin Wallet integration recommendations"""
         tips = [
@@ -74,14 +120,68 @@ class BeginWalletIntegrationTool(BaseTool):
         ]
         return json.dumps(tips)
 
+def parse_skill_list(value: str) -> List[str]:
+    """Accept skills as a JSON list or a comma-separated string"""
+    try:
+        parsed = json.loads(value)
+        if isinstance(parsed, list):
+            return [str(item) for item in parsed]
+    except (TypeError, ValueError):
+        pass
+    return [item.strip() for item in str(value).split(",") if item.strip()]
+
+def _describe_step(agent_role: str, step: Any) -> Dict[str, Any]:
+    """Summarise an AgentAction / AgentFinish / ToolResult for progress output"""
+    event = {"type": "step", "agent": agent_role, "kind": type(step).__name__}
+    for field in ("thought", "tool", "tool_input", "result", "output", "text"):
+        value = getattr(step, field, None)
+        if value:
+            event[field] = str(value)[:MAX_STEP_CHARS]
+    return event
+
 class CareerNavigatorCrew:
-    def __init__(self):
-        # Initialize tools
+    """Builds agents and tools once and runs every request on its own Crew.
+
+    The agents defined here are templates: each request works on copies of
+    them, so concurrent requests never share task lists or executor state.
+    """
+
+    def __init__(self, llm_factory: Optional[LLMFactory] = None,
+                 roadmap_skeletons: Optional[RoadmapSkeletonCache] = roadmap_skeleton_cache):
+        # Stream LLM tokens to progress listeners when enabled
+        self.stream_tokens = os.getenv("CREW_STREAM_TOKENS", "false").lower() == "true"
+        
+        # Model and token/step/time budget per service (CREW_MODEL_<SERVICE> etc.)
+        self.routes = create_service_routes()
+        
+        # Initialize tools (stateless, shared by every agent copy)
         self.cardano_tool = CardanoAnalysisTool()
         self.catalyst_tool = CatalystOpportunityTool()
         self.begin_wallet_tool = BeginWalletIntegrationTool()
         
-        # Define agents
+        # LLMs come from the routes unless a factory (e.g. fake_llm for benchmarks) is plugged in
+        build_llm = llm_factory or (lambda route, stream: route.build_llm(stream))
+        
+        # Each run leases an LLM of its own so its token usage is not mixed with other runs'
+        self.llm_pools = {
+            name: LLMPool(lambda route=route: build_llm(route, self.stream_tokens))
+            for name, route in self.routes.items()
+        }
+        
+        # Summary writer for fast-mode assessments
+        self.narrative_writer = create_narrative_writer(
+            self.routes["assessment"].model,
+            llm_factory=(lambda: llm_factory(self.routes["assessment"], False)) if llm_factory else None
+        )
+        
+        # Roadmaps for a known archetype reuse its skeleton and only get a short personalised intro
+        self.roadmap_skeletons = roadmap_skeletons
+        self.roadmap_personaliser = create_roadmap_personaliser(
+            self.routes["roadmap"].model,
+            llm_factory=(lambda: llm_factory(self.routes["roadmap"], False)) if llm_factory else None
+        )
+        
+        # Define agent templates
         self.career_analyst = Agent(
             role='Cardano Career Analyst',
             goal='Analyze user on-chain activity to determine career readiness and skills',
@@ -89,6 +189,8 @@ class CareerNavigatorCrew:
             to understand user behavior, skills, and experience levels. You specialize in 
             identifying patterns that indicate technical proficiency and career interests.""",
             tools=[self.cardano_tool],
+            llm=build_llm(self.routes["assessment"], self.stream_tokens),
+            **self.routes["assessment"].agent_limits(),
             verbose=True
         )
         
@@ -99,6 +201,8 @@ class CareerNavigatorCrew:
             You create detailed, timeline-based learning paths that help users progress from 
             their current level to their career goals.""",
             tools=[self.catalyst_tool, self.begin_wallet_tool],
+            llm=build_llm(self.routes["roadmap"], self.stream_tokens),
+            **self.routes["roadmap"].agent_limits(),
             verbose=True
         )
         
@@ -109,17 +213,72 @@ class CareerNavigatorCrew:
             multiple funded proposals. You understand the nuances of proposal writing, 
             community engagement, and the funding process.""",
             tools=[self.catalyst_tool],
+            llm=build_llm(self.routes["catalyst"], self.stream_tokens),
+            **self.routes["catalyst"].agent_limits(),
             verbose=True
         )
         
-        # Define the crew
-        self.crew = Crew(
-            agents=[self.career_analyst, self.roadmap_generator, self.catalyst_advisor],
-            tasks=[],  # Tasks will be created dynamically based on service type
+        # Service whose route (and LLM pool) each agent role uses
+        self.agent_services = {
+            self.career_analyst.role: "assessment",
+            self.roadmap_generator.role: "roadmap",
+            self.catalyst_advisor.role: "catalyst"
+        }
+    
+    def build_crew(self, task: Task, on_progress: Optional[ProgressCallback] = None) -> Crew:
+        """Create a lightweight single-task crew for one request"""
+        role = task.agent.role
+        
+        # Steps are traced as the time since the previous step finished
+        trace, parent = current_trace(), current_span()
+        last_step = [time.time()]
+        
+        # Every agent step is a cancellation checkpoint
+        def step_callback(step):
+            if trace is not None:
+                now = time.time()
+                trace.add("agent_step", "step", last_step[0], now, parent=parent, agent=role,
+                          step=type(step).__name__, tool=getattr(step, "tool", None))
+                last_step[0] = now
+            checkpoint()
+            if on_progress is not None:
+                on_progress(_describe_step(role, step))
+        
+        def task_callback(output):
+            if on_progress is not None:
+                on_progress({"type": "task", "agent": role, "output": str(output)})
+        
+        return Crew(
+            agents=[task.agent],
+            tasks=[task],
             process=Process.sequential,
-            verbose=True
+            verbose=True,
+            step_callback=step_callback,
+            task_callback=task_callback
         )
     
+    @staticmethod
+    def _profile_context(profile: Optional[Dict[str, Any]]) -> str:
+        """Prompt section carrying an already computed wallet profile"""
+        if profile is None:
+            return ""
+        return f"""
+            The wallet has already been analysed; use this profile instead of
+            re-analysing it:
+            {json.dumps(profile)}
+            """
+    
+    @staticmethod
+    def _assessment_context(assessment: Optional[Dict[str, Any]]) -> str:
+        """Prompt section carrying the skills assessment this task builds on"""
+        if assessment is None:
+            return ""
+        return f"""
+            Build on this skills assessment of the wallet rather than
+            assessing it again:
+            {json.dumps(assessment)}
+            """
+    
     def create_assessment_task(self, user_address: str) -> Task:
         """Create task for skills assessment service"""
         return Task(
@@ -136,11 +295,13 @@ class CareerNavigatorCrew:
             Provide actionable insights that help the user understand their current 
             position in the Cardano ecosystem and potential career directions.
             """,
-            agent=self.career_analyst,
-            expected_output="Detailed JSON assessment with experience level, skills, interests, and recommendations"
+            agent=self.career_analyst.copy(),
+            expected_output="Detailed JSON assessment with experience level, skills, interests, and recommendations",
+            output_pydantic=RESULT_MODELS["assessment"]
         )
     
-    def create_roadmap_task(self, user_address: str, timeline: str) -> Task:
+    def create_roadmap_task(self, user_address: str, timeline: str, profile: Optional[Dict[str, Any]] = None,
+                            assessment: Optional[Dict[str, Any]] = None) -> Task:
         """Create task for career roadmap generation"""
         return Task(
             description=f"""
@@ -156,12 +317,14 @@ class CareerNavigatorCrew:
             
             Create a practical, actionable plan that guides the user step-by-step 
             toward their career goals in the Cardano ecosystem.
-            """,
-            agent=self.roadmap_generator,
-            expected_output="Detailed roadmap with milestones, resources, opportunities, and Begin Wallet integration"
+            """ + self._profile_context(profile) + self._assessment_context(assessment),
+            agent=self.roadmap_generator.copy(),
+            expected_output="Detailed roadmap with milestones, resources, opportunities, and Begin Wallet integration",
+            output_pydantic=RESULT_MODELS["roadmap"]
         )
     
-    def create_catalyst_task(self, user_address: str) -> Task:
+    def create_catalyst_task(self, user_address: str, profile: Optional[Dict[str, Any]] = None,
+                             assessment: Optional[Dict[str, Any]] = None) -> Task:
         """Create task for Catalyst guidance service"""
         return Task(
             description=f"""
@@ -177,31 +340,149 @@ class CareerNavigatorCrew:
             
             Focus on practical, actionable advice that increases the likelihood 
             of successful proposal submission and funding.
-            """,
-            agent=self.catalyst_advisor,
-            expected_output="Comprehensive Catalyst guidance with proposal strategy and current opportunities"
+            """ + self._profile_context(profile) + self._assessment_context(assessment),
+            agent=self.catalyst_advisor.copy(),
+            expected_output="Comprehensive Catalyst guidance with proposal strategy and current opportunities",
+            output_pydantic=RESULT_MODELS["catalyst"]
         )
     
-    def process_request(self, service_type: str, user_address: str, timeline: str = None) -> Dict[str, Any]:
-        """Process different types of service requests"""
-        
-        # Create appropriate task based on service type
-        if service_type == "assessment":
-            task = self.create_assessment_task(user_address)
-        elif service_type == "roadmap":
-            if not timeline:
-                timeline = "6-months"  # Default timeline
-            task = self.create_roadmap_task(user_address, timeline)
-        elif service_type == "catalyst":
-            task = self.create_catalyst_task(user_address)
-        else:
+    def run_task(self, task: Task, on_progress: Optional[ProgressCallback] = None) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        """Execute one task on a crew owned by this request only; returns (typed output, token usage)"""
+        with span("task", "task", agent=task.agent.role):
+            return self._kickoff(task, on_progress)
+    
+    def _kickoff(self, task: Task, on_progress: Optional[ProgressCallback] = None) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        stream_tokens = self.stream_tokens and on_progress is not None
+        if stream_tokens:
+            with _token_sinks_lock:
+                _token_sinks[str(task.agent.id)] = on_progress
+        try:
+            # The crew's own token_usage is the LLM instance's lifetime total, so diff two snapshots instead
+            with self.llm_pools[self.agent_services[task.agent.role]].lease() as llm:
+                task.agent.llm = llm
+                crew = self.build_crew(task, on_progress)
+                before = llm_usage(llm)
+                try:
+                    output = crew.kickoff()
+                finally:
+                    usage = usage_since(before, llm_usage(llm))
+            return parse_crew_output(output, task.output_pydantic), usage
+        finally:
+            if stream_tokens:
+                with _token_sinks_lock:
+                    _token_sinks.pop(str(task.agent.id), None)
+    
+    def run_full_package(self, user_address: str, timeline: str,
+                         on_progress: Optional[ProgressCallback] = None,
+                         token_usage: Optional[Dict[str, Dict[str, int]]] = None) -> Dict[str, Any]:
+        """Analyse the wallet and assess it once, then run roadmap and catalyst concurrently from that assessment"""
+        # Goes through the job's tool cache, so the assessment agent's own
+        # wallet lookup is answered without a second analysis
+        profile = json.loads(self.cardano_tool.run(wallet_address=user_address))
+        checkpoint()
+        
+        results = {}
+        results["assessment"], usage = self.run_task(self.create_assessment_task(user_address), on_progress)
+        if token_usage is not None:
+            token_usage["assessment"] = usage
+        checkpoint()
+        
+        assessment = results["assessment"]
+        runs = {
+            "roadmap": (self.run_roadmap, user_address, timeline, profile, on_progress, assessment),
+            "catalyst": (self.run_task, self.create_catalyst_task(user_address, profile, assessment), on_progress)
+        }
+        
+        # Each thread runs in a copy of this context to share the job's tool cache
+        with ThreadPoolExecutor(max_workers=len(runs), thread_name_prefix="full-package") as pool:
+            futures = {
+                name: pool.submit(contextvars.copy_context().run, *run)
+                for name, run in runs.items()
+            }
+            for name, future in futures.items():
+                results[name], usage = future.result()
+                if token_usage is not None:
+                    token_usage[name] = usage
+        
+        return FullPackageResult(profile=profile, **results).model_dump()
+    
+    def run_roadmap(self, user_address: str, timeline: str, profile: Optional[Dict[str, Any]] = None,
+                    on_progress: Optional[ProgressCallback] = None,
+                    assessment: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        """Roadmap from the archetype's cached skeleton, or a full crew run that seeds the cache"""
+        if profile is None:
+            profile = json.loads(self.cardano_tool.run(wallet_address=user_address))
+            checkpoint()
+        
+        key = archetype_key(profile, timeline)
+        catalyst_version = get_catalyst_index().version
+        skeleton = self.roadmap_skeletons.get(key, catalyst_version) if self.roadmap_skeletons else None
+        
+        if skeleton is None:
+            roadmap, usage = self.run_task(self.create_roadmap_task(user_address, timeline, profile, assessment),
+                                          on_progress)
+            if self.roadmap_skeletons is not None and roadmap.get("milestones"):
+                self.roadmap_skeletons.put(key, catalyst_version, make_skeleton(roadmap))
+            return roadmap, usage
+        
+        with span("personalise_roadmap", "task", archetype="/".join(key)):
+            opportunities = json.loads(self.catalyst_tool.run(
+                user_skills=json.dumps(profile["technical_skills"]),
+                experience_level=profile["experience_level"]
+            ))
+            checkpoint()
+            intro, usage = self.roadmap_personaliser.write(
+                profile,
+                timeline=key[2],
+                milestones="; ".join(m["title"] for m in skeleton["milestones"][:3]),
+                opportunities="; ".join(o.get("category", "") for o in opportunities[:3])
+            )
+        if on_progress is not None:
+            on_progress({"type": "task", "agent": self.roadmap_generator.role,
+                         "output": f"Personalised the cached {'/'.join(key)} roadmap"})
+        return personalise_roadmap(skeleton, profile, opportunities, intro["text"]), usage
+    
+    def run_fast_assessment(self, user_address: str) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        """Structured assessment from the wallet profile without an agent crew; returns (result, token usage)"""
+        profile = json.loads(self.cardano_tool.run(wallet_address=user_address))
+        checkpoint()
+        narrative, usage = self.narrative_writer.write(profile)
+        assessment = build_assessment(profile, narrative)
+        return AssessmentResult(summary=assessment["narrative"]["text"], **assessment).model_dump(), usage
+    
+    def process_request(self, service_type: str, user_address: str, timeline: str = None,
+                        on_progress: Optional[ProgressCallback] = None, mode: str = None,
+                        cancel_token: Optional[CancelToken] = None, trace: Optional[JobTrace] = None) -> Dict[str, Any]:
+        """Process different types of service requests, reporting progress as it happens.
+        
+        A cancelled cancel_token stops the run with JobCancelled at the next checkpoint;
+        task, agent step, tool and LLM call timings are recorded into trace.
+        """
+        if service_type not in SERVICE_TYPES:
             raise ValueError(f"Unknown service type: {service_type}")
+        if mode is not None and mode not in ASSESSMENT_MODES:
+            raise ValueError(f"Unknown assessment mode: {mode}")
+        if service_type in ("roadmap", "full_package") and not timeline:
+            timeline = "6-months"  # Default timeline
         
-        # Update crew with the specific task
-        self.crew.tasks = [task]
+        # Token usage per crew service run for this job
+        token_usage: Dict[str, Dict[str, int]] = {}
         
-        # Execute the crew
-        result = self.crew.kickoff()
+        # Identical tool calls within this job are answered once
+        with cancel_scope(cancel_token), trace_scope(trace), tool_cache_scope() as tool_cache, \
+                span("process_request", "service", service=service_type, mode=mode):
+            if service_type == "full_package":
+                result = self.run_full_package(user_address, timeline, on_progress, token_usage)
+            elif service_type == "assessment" and mode == "fast":
+                result, token_usage[service_type] = self.run_fast_assessment(user_address)
+            elif service_type == "roadmap":
+                result, token_usage[service_type] = self.run_roadmap(user_address, timeline, on_progress=on_progress)
+            else:
+                if service_type == "assessment":
+                    task = self.create_assessment_task(user_address)
+                else:
+                    task = self.create_catalyst_task(user_address)
+                result, token_usage[service_type] = self.run_task(task, on_progress)
         
         # Format response
         return {
@@ -209,10 +490,32 @@ class CareerNavigatorCrew:
             "service": service_type,
             "user_address": user_address,
             "timeline": timeline,
-            "result": str(result),
+            "mode": mode,
+            "result": result,
             "timestamp": datetime.now().isoformat(),
-            "agent_id": "cardano-career-navigator"
+            "agent_id": "cardano-career-navigator",
+            "metrics": {
+                "tool_calls": tool_cache.stats(),
+                "token_usage": dict(token_usage, total=sum_usage(token_usage.values())),
+                "routes": {name: self.routes[name].to_dict() for name in token_usage}
+            }
         }
 
-# Create the crew instance
-career_navigator_crew = CareerNavigatorCrew()
\ No newline at end of file
+# Crew instance, built on first use (see crew_runtime for the background warmup)
+career_navigator_crew: Optional[CareerNavigatorCrew] = None
+_crew_lock = threading.Lock()
+
+def get_career_navigator_crew() -> CareerNavigatorCrew:
+    global career_navigator_crew
+    with _crew_lock:
+        if career_navigator_crew is None:
+            career_navigator_crew = CareerNavigatorCrew()
+        return career_navigator_crew
+
+def run_service_request(service_type: str, user_address: str, timeline: str = None,
+                        on_progress: Optional[ProgressCallback] = None, mode: str = None,
+                        cancel_token: Optional[CancelToken] = None, trace: Optional[JobTrace] = None) -> Dict[str, Any]:
+    """Module-level entry point so worker processes can run jobs by reference"""
+    return get_career_navigator_crew().process_request(
+        service_type, user_address, timeline, on_progress, mode, cancel_token, trace
+    )
@@ -0,0 +1,187 @@
+"""
+Cardano Career Navigator - Crew Runtime
+Lazy crew initialisation, background warmup and the startup-time report
+"""
+
+import importlib
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+# Service types accepted by the API and the crew
+SERVICE_TYPES = ["assessment", "roadmap", "catalyst", "full_package"]
+
+# Price per service in ADA; the one table /availability, results and registrations quote
+SERVICE_PRICES = {
+    "assessment": 0.5,
+    "roadmap": 1.5,
+    "catalyst": 3.0,
+    "full_package": 5.0
+}
+PRICE_CURRENCY = "ADA"
+
+# How an assessment is produced: a full agent crew, or rule tables plus one short LLM call
+ASSESSMENT_MODES = ["crew", "fast"]
+
+
+def format_price(service_type: str) -> str:
+    """'1.5 ADA'"""
+    return f"{SERVICE_PRICES[service_type]} {PRICE_CURRENCY}"
+
+
+def process_uptime() -> Optional[float]:
+    """Seconds since this process started (interpreter start-up included); None off Linux"""
+    try:
+        with open("/proc/self/stat") as f:
+            # Field 22 (starttime, in clock ticks since boot) follows the parenthesised command name
+            started_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            system_uptime = float(f.read().split()[0])
+        return system_uptime - started_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class CrewWarmup:
+    """Builds the crew subsystem once, in the background or on first use.
+
+    Importing crewai and building the agents takes seconds, so the API starts
+    serving without them: ``start`` warms up on a daemon thread (retrying
+    failures with a growing delay) and ``ensure_ready`` blocks a job until
+    the crew exists, loading it inline if nothing else is. Phase timings are
+    kept for the startup report.
+    """
+
+    def __init__(self, max_attempts: int = 5, retry_seconds: float = 10):
+        self.max_attempts = max_attempts
+        self.retry_seconds = retry_seconds
+        self.state = "cold"
+        # Loading waits for the first job instead of happening at startup
+        self.deferred = False
+        self.error: Optional[str] = None
+        self.attempts = 0
+        self.phases: Dict[str, float] = {}
+        self.events: Dict[str, Optional[float]] = {"imported": process_uptime()}
+
+        self._crew: Any = None
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._crew is not None
+
+    def mark(self, event: str):
+        """Record when a startup milestone was reached, in seconds since process start"""
+        self.events[event] = process_uptime()
+
+    def start(self):
+        """Warm up on a daemon thread; a no-op once started or ready"""
+        with self._lock:
+            if self._thread is not None or self.ready:
+                return
+            self.state = "warming"
+            self._thread = threading.Thread(target=self._run, name="crew-warmup", daemon=True)
+            self._thread.start()
+
+    def defer(self):
+        """Leave loading to the first job; readiness no longer waits for it"""
+        with self._lock:
+            if self._thread is None and not self.ready:
+                self.deferred = True
+                self.state = "deferred"
+
+    @property
+    def serving(self) -> bool:
+        """Whether the API should take traffic: warmed up, or warmup deferred and not failed"""
+        return self.ready or (self.deferred and self.state != "failed")
+
+    def ensure_ready(self) -> Any:
+        """Return the crew, building it now if warmup has not finished (or failed)"""
+        if self._crew is not None:
+            return self._crew
+        with self._lock:
+            if self._crew is None:
+                self._load_locked()
+            return self._crew
+
+    def _run(self):
+        delay = self.retry_seconds
+        while True:
+            try:
+                self.ensure_ready()
+                return
+            except Exception as e:
+                if self.attempts >= self.max_attempts:
+                    print(f"Crew warmup gave up after {self.attempts} attempts: {e}")
+                    return
+                print(f"Crew warmup attempt {self.attempts} failed, retrying in {delay:g}s: {e}")
+                self.state = "retrying"
+                time.sleep(delay)
+                delay = min(delay * 2, 300)
+
+    def _load_locked(self):
+        self.attempts += 1
+        self.state = "warming"
+        try:
+            started = time.perf_counter()
+            crew_definition = self._timed("crewai_import", lambda: importlib.import_module("crew_definition"))
+            crew = self._timed("crew_build", crew_definition.get_career_navigator_crew)
+            self._timed("catalyst_index", crew_definition.get_catalyst_index)
+            self.phases["total"] = round(time.perf_counter() - started, 3)
+        except Exception as e:
+            self.state = "failed"
+            self.error = f"{type(e).__name__}: {e}"
+            raise
+
+        self._crew = crew
+        self.state = "ready"
+        self.error = None
+        self.mark("ready")
+        print(f"Crew ready {self.events['ready'] or 0:.2f}s after process start (warmup {self.phases})")
+
+    def _timed(self, phase: str, step: Callable[[], Any]) -> Any:
+        started = time.perf_counter()
+        result = step()
+        self.phases[phase] = round(time.perf_counter() - started, 3)
+        return result
+
+    def report(self) -> Dict[str, Any]:
+        """Startup-time report: milestones since process start and warmup phase durations"""
+        return {
+            "state": self.state,
+            "ready": self.ready,
+            "deferred": self.deferred,
+            "attempts": self.attempts,
+            "error": self.error,
+            "seconds_since_process_start": {
+                event: round(value, 3) if value is not None else None for event, value in self.events.items()
+            },
+            "warmup_phases": dict(self.phases),
+            "uptime": round(process_uptime() or 0, 3)
+        }
+
+
+def create_crew_warmup() -> CrewWarmup:
+    return CrewWarmup(
+        max_attempts=int(os.getenv("WARMUP_MAX_ATTEMPTS", 5)),
+        retry_seconds=float(os.getenv("WARMUP_RETRY_SECONDS", 10))
+    )
+
+
+warmup = create_crew_warmup()
+
+
+def run_service_request(service_type: str, user_address: str, timeline: str = None,
+                        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None, mode: str = None,
+                        cancel_token: Any = None, trace: Any = None) -> Dict[str, Any]:
+    """Entry point for job workers; waits for (or performs) crew initialisation first.
+
+    Module-level and crewai-free at import, so process pools can run jobs by reference.
+    """
+    warmup.ensure_ready()
+    import crew_definition
+    return crew_definition.run_service_request(
+        service_type, user_address, timeline, on_progress, mode, cancel_token, trace
+    )
@@ -6,8 +6,12 @@ Prepares and deploys the Cardano Career Navigator CrewAI agent
 
 import os
 import json
+import socket
 import subprocess
 import sys
+import time
+import urllib.error
+import urllib.request
 from datetime import datetime
 
 class CrewAIMasumiDeployer:
@@ -70,26 +74,60 @@ class CrewAIMasumiDeployer:
         print("✅ Environment validation completed")
     
     def test_agent(self):
-        """Test the CrewAI agent locally"""
+        """Start the API locally and wait for /readyz (no paid LLM job is run)"""
         print("🧪 Testing CrewAI agent...")
         
+        timeout = float(os.getenv('READINESS_TIMEOUT', 120))
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        base_url = f"http://127.0.0.1:{port}"
+        
+        # Warm up at startup even if deployments defer it, so the crew build is what gets checked
+        server = subprocess.Popen(
+            [sys.executable, 'main.py', 'api'], env=dict(os.environ, PORT=str(port), WARMUP_ON_START='true'),
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+        )
         try:
-            # Run a quick test
-            result = subprocess.run([
-                sys.executable, 'main.py'
-            ], capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0:
-                print("✅ Agent test completed successfully")
-            else:
-                print("⚠️ Agent test had issues:")
-                print(result.stderr)
-                
-        except subprocess.TimeoutExpired:
-            print("⚠️ Agent test timed out - this is normal for complex processing")
+            deadline = time.time() + timeout
+            while time.time() < deadline:
+                if server.poll() is not None:
+                    print("⚠️ Agent exited during startup:")
+                    print(server.stderr.read())
+                    return
+                status = self._get_json(f"{base_url}/readyz")
+                if status and status.get("status") == "ready":
+                    report = self._get_json(f"{base_url}/startup") or {}
+                    seconds = report.get("seconds_since_process_start", {})
+                    print(f"✅ Agent ready (serving after {seconds.get('serving')}s, "
+                          f"ready after {seconds.get('ready')}s)")
+                    print(f"   Warmup phases: {report.get('warmup_phases')}")
+                    return
+                if status and status.get("status") == "failed":
+                    print(f"⚠️ Agent warmup failed: {status.get('error')}")
+                    return
+                time.sleep(0.5)
+            print(f"⚠️ Agent not ready after {timeout:g}s - check /startup once deployed")
         except Exception as e:
             print(f"⚠️ Agent test failed: {str(e)}")
             print("💡 Ensure dependencies are installed: pip install -r requirements.txt")
+        finally:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+    
+    @staticmethod
+    def _get_json(url):
+        """GET a JSON body, including 503 readiness replies; None while the server is not listening"""
+        try:
+            with urllib.request.urlopen(url, timeout=5) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return json.loads(e.read() or b"null")
+        except (urllib.error.URLError, OSError, ValueError):
+            return None
     
     def generate_deployment_files(self):
         """Generate deployment configuration files"""
@@ -117,7 +155,7 @@ EXPOSE 8000
 
 # Health check
 HEALTHCHECK --interval=30s --timeout=10s --start-period=5s --retries=3 \\
-    CMD curl -f http://localhost:8000/availability || exit 1
+    CMD curl -f http://localhost:8000/livez || exit 1
 
 # Start command
 CMD ["python", "main.py", "api"]
@@ -133,7 +171,7 @@ CMD ["python", "main.py", "api"]
             },
             "deploy": {
                 "startCommand": "python main.py api",
-                "healthcheckPath": "/availability"
+                "healthcheckPath": "/readyz"
             }
         }
         
@@ -149,7 +187,7 @@ CMD ["python", "main.py", "api"]
                     "env": "python",
                     "buildCommand": "pip install -r requirements.txt",
                     "startCommand": "python main.py api",
-                    "healthCheckPath": "/availability",
+                    "healthCheckPath": "/readyz",
                     "envVars": [
                         {"key": "OPENAI_API_KEY", "sync": False},
                         {"key": "MASUMI_API_KEY", "sync": False},
@@ -184,7 +222,8 @@ CMD ["python", "main.py", "api"]
             "services": {
                 "assessment": "0.5 ADA - Wallet activity analysis for skills assessment",
                 "roadmap": "1.5 ADA - Personalized career roadmap generation",
-                "catalyst": "3.0 ADA - Project Catalyst proposal guidance"
+                "catalyst": "3.0 ADA - Project Catalyst proposal guidance",
+                "full_package": "5.0 ADA - Assessment, roadmap and Catalyst guidance in one run"
             },
             "unique_features": [
                 "Begin Wallet integration for progress tracking",
@@ -196,6 +235,7 @@ CMD ["python", "main.py", "api"]
             "api_endpoints": [
                 "GET /input_schema - Input requirements",
                 "GET /availability - Service availability",
+                "GET /readyz - Readiness (crew warmed up)",
                 "POST /start_job - Start AI task",
                 "GET /status - Job status"
             ],
@@ -290,6 +330,7 @@ docker run -p 8000:8000 cardano-career-navigator
 | Skills Assessment | 0.5 ADA | Analyze wallet activity for career insights |
 | Career Roadmap | 1.5 ADA | Personalized learning path with milestones |
 | Catalyst Guidance | 3.0 ADA | Project proposal creation assistance |
+| Full Career Package | 5.0 ADA | Assessment, roadmap and Catalyst guidance in one run |
 
 ## 🔗 API Endpoints
 
@@ -0,0 +1,101 @@
+"""
+Cardano Career Navigator - Fake LLM
+Deterministic, latency-configurable stand-in for the crew's LLMs (benchmarks, offline runs)
+"""
+
+import hashlib
+import json
+import time
+from typing import Any, Dict, List, Optional, Union, get_args, get_origin
+
+from crewai.llms.base_llm import BaseLLM, llm_call_context
+from pydantic import BaseModel
+
+# Items generated for every list field of a fake result
+SAMPLE_ITEMS = 3
+
+
+class FakeLLM(BaseLLM):
+    """Answers every call after a fixed, seeded delay without touching the network.
+
+    Agent calls get a ReAct final answer holding the task's result model as
+    JSON, so crews finish in one step and typed results parse as in
+    production; plain calls (the fast assessment narrative) get a short
+    sentence. ``jitter`` adds up to that many seconds, derived from the
+    prompt and ``seed`` so reruns sleep exactly the same.
+    """
+
+    model: str = "fake"
+    latency: float = 0.05
+    jitter: float = 0.0
+    seed: int = 0
+    completion_tokens: int = 120
+
+    def __init__(self, **data: Any):
+        # crewai validates the model name before field defaults apply
+        data.setdefault("model", "fake")
+        super().__init__(**data)
+
+    def call(self, messages: Union[str, List[Dict[str, Any]]], tools: Optional[List[Dict[str, Any]]] = None,
+             callbacks: Optional[List[Any]] = None, available_functions: Optional[Dict[str, Any]] = None,
+             from_task: Optional[Any] = None, from_agent: Optional[Any] = None,
+             response_model: Optional[Any] = None) -> str:
+        # One call id shared by the started and completed events, as real LLM calls do
+        with llm_call_context():
+            prompt = messages if isinstance(messages, str) else json.dumps(messages, default=str)
+            self._emit_call_started_event(messages=messages, from_task=from_task, from_agent=from_agent)
+
+            time.sleep(self.delay(prompt))
+            response = self._respond(from_task)
+
+            usage = {
+                "prompt_tokens": len(prompt) // 4,
+                "completion_tokens": self.completion_tokens,
+                "total_tokens": len(prompt) // 4 + self.completion_tokens
+            }
+            self._track_token_usage_internal(usage)
+            self._emit_call_completed_event(response=response, call_type="llm_call", from_task=from_task,
+                                            from_agent=from_agent, messages=messages, usage=usage)
+            return response
+
+    def delay(self, prompt: str) -> float:
+        if self.jitter <= 0:
+            return self.latency
+        digest = hashlib.sha256(f"{self.seed}:{prompt}".encode()).digest()
+        return self.latency + self.jitter * int.from_bytes(digest[:4], "big") / 0xFFFFFFFF
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+    def supports_stop_words(self) -> bool:
+        return False
+
+    def get_context_window_size(self) -> int:
+        return 128000
+
+    @staticmethod
+    def _respond(from_task: Optional[Any]) -> str:
+        model = getattr(from_task, "output_pydantic", None)
+        if model is None:
+            return "Your on-chain history shows steady Cardano activity; keep building and share your work."
+        answer = model(**dict(sample_fields(model), summary=f"Benchmark {model.__name__} generated offline"))
+        answer = answer.model_dump_json()
+        return f"Thought: I now know the final answer\nFinal Answer: {answer}"
+
+
+def sample_fields(model: type, index: int = 1) -> Dict[str, Any]:
+    """Placeholder values for a result model's string and list fields, so results have realistic shape"""
+    values: Dict[str, Any] = {}
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        if get_origin(annotation) is Union:
+            annotation = next((arg for arg in get_args(annotation) if arg is not type(None)), annotation)
+        if get_origin(annotation) in (list, List):
+            item = (get_args(annotation) or (str,))[0]
+            if isinstance(item, type) and issubclass(item, BaseModel):
+                values[name] = [sample_fields(item, i) for i in range(1, SAMPLE_ITEMS + 1)]
+            elif item is str:
+                values[name] = [f"{name} {i}" for i in range(1, SAMPLE_ITEMS + 1)]
+        elif annotation is str:
+            values[name] = f"{name.replace('_', ' ')} {index}"
+    return values
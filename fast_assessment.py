@@ -0,0 +1,299 @@
+"""
+Cardano Career Navigator - Fast Assessment
+Structured skills assessment built from the wallet profile and rule tables
+"""
+
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from crew_runtime import PRICE_CURRENCY, SERVICE_PRICES
+from model_routing import LLMPool, empty_usage, llm_usage, usage_since
+
+# Rule tables ported from CardanoCareerNavigator._generateProfileInsights / _generateNextSteps
+EXPERIENCE_INSIGHTS = {
+    "beginner": (
+        "You're at the beginning of your Cardano journey with {count} transactions",
+        "Focus on learning fundamentals and building your first dApp interactions"
+    ),
+    "intermediate": (
+        "You have solid Cardano experience with {count} transactions",
+        "Ready to dive deeper into specialized areas and contribute to the ecosystem"
+    ),
+    "advanced": (
+        "You're an experienced Cardano user with {count}+ transactions",
+        "Consider mentoring others and contributing to major ecosystem projects"
+    )
+}
+
+PATH_INSIGHTS = {
+    "development": (
+        "Your transaction patterns suggest strong interest in technical development",
+        "Focus on MeshJS, Aiken, and smart contract development"
+    ),
+    "design": (
+        "Your NFT interactions indicate interest in design and user experience",
+        "Explore UI/UX design for dApps and NFT marketplace development"
+    ),
+    "community": (
+        "Your governance participation shows community leadership potential",
+        "Consider roles in community management, education, or governance"
+    ),
+    "research": (
+        "Your learning-focused approach suggests research and analysis strengths",
+        "Explore technical writing, protocol research, or educational content creation"
+    )
+}
+
+BEGINNER_STEPS = [
+    {
+        "priority": "high",
+        "action": "Start with Cardano Fundamentals",
+        "description": "Learn basic concepts: UTXOs, addresses, transactions, and native tokens",
+        "resource": "Cardano Developer Portal - Getting Started",
+        "estimated_time": "2-3 weeks"
+    },
+    {
+        "priority": "medium",
+        "action": "Set Up Development Environment",
+        "description": "Install and configure tools for Cardano development",
+        "resource": "MeshJS Documentation",
+        "estimated_time": "1-2 days"
+    }
+]
+
+PATH_STEPS = {
+    "development": {
+        "priority": "medium",
+        "action": "Build Your First dApp",
+        "description": "Create a simple decentralized application using MeshJS",
+        "resource": "MeshJS Tutorials",
+        "estimated_time": "1-2 weeks"
+    },
+    "design": {
+        "priority": "medium",
+        "action": "Study Cardano dApp UX Patterns",
+        "description": "Analyze successful Cardano applications for design patterns",
+        "resource": "Cardano dApp Gallery",
+        "estimated_time": "1 week"
+    },
+    "community": {
+        "priority": "medium",
+        "action": "Join Cardano Community Channels",
+        "description": "Participate in Discord, Telegram, and governance discussions",
+        "resource": "Cardano Community Hub",
+        "estimated_time": "Ongoing"
+    },
+    "research": {
+        "priority": "medium",
+        "action": "Read Cardano Research Papers",
+        "description": "Study the academic foundations of Cardano protocols",
+        "resource": "IOHK Research Library",
+        "estimated_time": "2-4 weeks"
+    }
+}
+
+# Begin Wallet tips with the profile condition that unlocks each one
+BEGIN_WALLET_TIPS = [
+    (lambda profile: True, {
+        "category": "progress-tracking",
+        "title": "Track Your Learning Progress On-Chain",
+        "description": "Use Begin Wallet to store your learning milestones as on-chain metadata",
+        "action": "Enable metadata tracking in Begin Wallet settings",
+        "benefit": "Verifiable proof of your Cardano learning journey"
+    }),
+    (lambda profile: profile["experience_level"] == "beginner", {
+        "category": "getting-started",
+        "title": "Start with Begin Wallet Basics",
+        "description": "Begin Wallet offers unique features like eSIM integration and metadata storage",
+        "action": "Explore Begin Wallet's educational resources and tutorials",
+        "benefit": "Learn Cardano fundamentals while using real-world utility features"
+    }),
+    (lambda profile: "real-world-utility" in profile["interests"], {
+        "category": "esim-rewards",
+        "title": "Earn eSIM Data Rewards",
+        "description": "Complete learning milestones to earn mobile data through Begin Wallet",
+        "action": "Set up eSIM functionality in Begin Wallet",
+        "benefit": "Get real-world value from your learning achievements"
+    }),
+    (lambda profile: "travel" in profile["interests"], {
+        "category": "travel-integration",
+        "title": "Use Begin Wallet for Travel",
+        "description": "Begin Wallet's eSIM feature provides global connectivity",
+        "action": "Explore Begin Wallet's travel and connectivity features",
+        "benefit": "Stay connected worldwide while building your Cardano skills"
+    }),
+    (lambda profile: "begin-wallet" in profile["technical_skills"], {
+        "category": "advanced-features",
+        "title": "Leverage Advanced Begin Wallet Features",
+        "description": "You're already using Begin Wallet - explore advanced metadata and dApp features",
+        "action": "Try Begin Wallet's dApp discovery and metadata management tools",
+        "benefit": "Maximize your Begin Wallet experience for career development"
+    })
+]
+
+NARRATIVE_PROMPT = """Write a short, encouraging skills assessment (at most {words} words, plain text)
+for a Cardano user with this profile. Mention their level, strongest skills and the suggested path.
+Profile: experience={experience_level}; skills={skills}; interests={interests}; path={preferred_path};
+transactions={transaction_count}."""
+
+
+def profile_insights(profile: Dict[str, Any]) -> List[Dict[str, str]]:
+    message, recommendation = EXPERIENCE_INSIGHTS[profile["experience_level"]]
+    insights = [{
+        "type": "experience",
+        "message": message.format(count=profile["transaction_count"]),
+        "recommendation": recommendation
+    }]
+
+    skills = profile["technical_skills"]
+    if len(skills) > 3:
+        insights.append({
+            "type": "skills",
+            "message": f"You have diverse technical skills: {', '.join(skills[:3])} and more",
+            "recommendation": "Your broad skill set makes you well-suited for cross-functional roles"
+        })
+
+    message, recommendation = PATH_INSIGHTS[profile["preferred_path"]]
+    insights.append({"type": "path", "message": message, "recommendation": recommendation})
+    return insights
+
+
+def next_steps(profile: Dict[str, Any]) -> List[Dict[str, Any]]:
+    path = profile["preferred_path"]
+    steps = [{
+        "priority": "high",
+        "action": "Get Personalized Roadmap",
+        "description": f"Generate a detailed {path} learning path with milestones",
+        "service": "roadmap",
+        "price": SERVICE_PRICES["roadmap"],
+        "estimated_time": "3-5 minutes"
+    }]
+
+    if profile["experience_level"] == "beginner":
+        steps += [dict(step) for step in BEGINNER_STEPS]
+    else:
+        steps.append({
+            "priority": "medium",
+            "action": "Explore Advanced Topics",
+            "description": f"Dive deeper into {path}-specific advanced concepts",
+            "resource": "Cardano Developer Portal - Advanced Guides",
+            "estimated_time": "1-2 months"
+        })
+
+    steps.append(dict(PATH_STEPS[path]))
+
+    if profile["experience_level"] != "beginner":
+        steps.append({
+            "priority": "low",
+            "action": "Consider Project Catalyst",
+            "description": "Get specialized guidance for participating in Cardano governance and funding",
+            "service": "catalyst",
+            "price": SERVICE_PRICES["catalyst"],
+            "estimated_time": "5-10 minutes"
+        })
+    return steps
+
+
+def begin_wallet_tips(profile: Dict[str, Any]) -> List[Dict[str, str]]:
+    return [dict(tip) for applies, tip in BEGIN_WALLET_TIPS if applies(profile)]
+
+
+def template_narrative(profile: Dict[str, Any]) -> str:
+    """Narrative used when the LLM is disabled or unavailable"""
+    skills = ", ".join(profile["technical_skills"][:3]) or "wallet basics"
+    return (
+        f"Your wallet shows {profile['experience_level']}-level Cardano activity across "
+        f"{profile['transaction_count']} transactions. Your on-chain activity shows skills in {skills}, which points towards a "
+        f"{profile['preferred_path']} career path. {PATH_INSIGHTS[profile['preferred_path']][1]}."
+    )
+
+
+class NarrativeWriter:
+    """Writes a profile summary with one short, capped LLM call.
+
+    ``prompt`` is formatted with the profile fields plus any details passed
+    to ``write``; ``fallback`` builds the text from the same arguments.
+    ``llm_factory`` builds the LLMs (crewai's LLM for ``model`` by default).
+    """
+
+    def __init__(self, model: str, max_tokens: int = 200, enabled: bool = True,
+                 llm_factory: Optional[Callable[[], Any]] = None, prompt: str = NARRATIVE_PROMPT,
+                 fallback: Callable[..., str] = template_narrative):
+        self.model = model
+        self.max_tokens = max_tokens
+        self.enabled = enabled
+        self.prompt = prompt
+        self.fallback = fallback
+        self.llms = LLMPool(llm_factory or self._build_llm)
+
+    def _build_llm(self):
+        from crewai import LLM
+        return LLM(model=self.model, max_tokens=self.max_tokens, temperature=0.3)
+
+    def write(self, profile: Dict[str, Any], **details: Any) -> Tuple[Dict[str, str], Dict[str, int]]:
+        """Return ({"text", "source"}, token usage); falls back to the template on any LLM failure"""
+        usage = empty_usage()
+        if self.enabled:
+            prompt = self.prompt.format(
+                words=self.max_tokens // 2,
+                experience_level=profile["experience_level"],
+                skills=", ".join(profile["technical_skills"]),
+                interests=", ".join(profile["interests"]),
+                preferred_path=profile["preferred_path"],
+                transaction_count=profile["transaction_count"],
+                **details
+            )
+            try:
+                with self.llms.lease() as llm:
+                    before = llm_usage(llm)
+                    try:
+                        text = llm.call([{"role": "user", "content": prompt}])
+                    finally:
+                        usage = usage_since(before, llm_usage(llm))
+                if text:
+                    return {"text": str(text).strip(), "source": "llm"}, usage
+            except Exception as e:
+                print(f"Narrative LLM call failed, using template: {e}")
+        return {"text": self.fallback(profile, **details), "source": "template"}, usage
+
+
+def build_assessment(profile: Dict[str, Any], narrative: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Assemble the structured assessment for one wallet profile"""
+    return {
+        "profile": {
+            field: profile.get(field)
+            for field in ("experience_level", "technical_skills", "interests", "learning_style",
+                          "preferred_path", "transaction_count", "analysis_timestamp")
+        },
+        "insights": profile_insights(profile),
+        "next_steps": next_steps(profile),
+        "begin_wallet_integration": begin_wallet_tips(profile),
+        "recommendations": {
+            "roadmap_service": {
+                "recommended": True,
+                "reason": f"Based on your {profile['experience_level']} level and "
+                          f"{profile['preferred_path']} path preference",
+                "price": SERVICE_PRICES["roadmap"],
+                "currency": PRICE_CURRENCY
+            },
+            "catalyst_service": {
+                "recommended": profile["experience_level"] != "beginner",
+                "reason": "Complete a learning roadmap first to build foundational skills"
+                          if profile["experience_level"] == "beginner"
+                          else f"Your {profile['experience_level']} level makes you ready for Catalyst participation",
+                "price": SERVICE_PRICES["catalyst"],
+                "currency": PRICE_CURRENCY
+            }
+        },
+        "narrative": narrative or {"text": template_narrative(profile), "source": "template"}
+    }
+
+
+def create_narrative_writer(default_model: Optional[str] = None,
+                            llm_factory: Optional[Callable[[], Any]] = None) -> NarrativeWriter:
+    return NarrativeWriter(
+        model=os.getenv("ASSESSMENT_NARRATIVE_MODEL") or default_model or os.getenv("OPENAI_MODEL_NAME", "gpt-4o-mini"),
+        max_tokens=int(os.getenv("ASSESSMENT_NARRATIVE_MAX_TOKENS", 200)),
+        enabled=os.getenv("ASSESSMENT_NARRATIVE_LLM", "true").lower() == "true",
+        llm_factory=llm_factory
+    )
@@ -0,0 +1,53 @@
+"""
+Cardano Career Navigator - Fast JSON
+orjson-backed responses (stdlib json fallback) and field selection for job payloads
+"""
+
+import json
+from typing import Any, Dict, Iterable, Optional
+
+from fastapi.responses import Response
+
+# orjson is in requirements.txt; the stdlib fallback only keeps stripped-down installs working
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def parse_fields(fields: Optional[str]) -> Optional[list]:
+    """Split a comma-separated ``fields`` query value into dotted paths"""
+    if not fields:
+        return None
+    return [field.strip() for field in fields.split(",") if field.strip()]
+
+
+def select_fields(data: Dict[str, Any], paths: Iterable[str]) -> Dict[str, Any]:
+    """Keep only the given dotted paths (e.g. ``result.result.milestones``); missing paths are skipped"""
+    selected: Dict[str, Any] = {}
+    for path in paths:
+        keys = path.split(".")
+        value: Any = data
+        for key in keys:
+            if not isinstance(value, dict) or key not in value:
+                break
+            value = value[key]
+        else:
+            target = selected
+            for key in keys[:-1]:
+                target = target.setdefault(key, {})
+            target[keys[-1]] = value
+    return selected
@@ -0,0 +1,89 @@
+"""
+Cardano Career Navigator - Job Cancellation
+Cancel tokens, cooperative checkpoints and per-service timeouts
+"""
+
+import asyncio
+import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Hashable, Iterator, Optional
+
+# Wall-clock limit per service (seconds) before a job is failed and its worker released
+DEFAULT_JOB_TIMEOUTS = {
+    "assessment": 300,
+    "roadmap": 600,
+    "catalyst": 900,
+    "full_package": 900
+}
+
+
+class JobCancelled(BaseException):
+    """Raised at a checkpoint once the job's token is cancelled.
+
+    A BaseException so crewai's retry and tool-error handling, which catch
+    Exception, cannot swallow it and keep the run going.
+    """
+
+
+class CancelToken:
+    """Cancellation flag shared between the event loop and a job's worker thread"""
+
+    def __init__(self, flight_key: Optional[Hashable] = None):
+        self.flight_key = flight_key
+        self.reason: Optional[str] = None
+        self._event = threading.Event()
+        self._waiter: Optional[asyncio.Event] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "Job cancelled"):
+        """Cancel the job; call from the event loop thread"""
+        if self._event.is_set():
+            return
+        self.reason = reason
+        self._event.set()
+        if self._waiter is not None:
+            self._waiter.set()
+
+    def check(self):
+        """Checkpoint: raise JobCancelled if the job has been cancelled"""
+        if self._event.is_set():
+            raise JobCancelled(self.reason)
+
+    async def wait(self):
+        """Wait on the event loop until the token is cancelled"""
+        if self._waiter is None:
+            self._waiter = asyncio.Event()
+            if self._event.is_set():
+                self._waiter.set()
+        await self._waiter.wait()
+
+
+_current_token: ContextVar[Optional[CancelToken]] = ContextVar("cancel_token", default=None)
+
+
+@contextmanager
+def cancel_scope(token: Optional[CancelToken]) -> Iterator[None]:
+    """Make token the one checked by checkpoint() inside the block"""
+    reset = _current_token.set(token)
+    try:
+        yield
+    finally:
+        _current_token.reset(reset)
+
+
+def checkpoint():
+    """Stop the current job here if it was cancelled or timed out"""
+    token = _current_token.get()
+    if token is not None:
+        token.check()
+
+
+def job_timeout(service_type: str) -> float:
+    """JOB_TIMEOUT_<SERVICE> seconds, falling back to DEFAULT_JOB_TIMEOUTS; 0 disables"""
+    value = os.getenv(f"JOB_TIMEOUT_{service_type.upper()}")
+    return float(value) if value is not None else DEFAULT_JOB_TIMEOUTS.get(service_type, 0)
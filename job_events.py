@@ -0,0 +1,181 @@
+"""
+Cardano Career Navigator - Job Events
+Per-job publish/subscribe of status transitions and partial output
+"""
+
+import asyncio
+import ipaddress
+import json
+import os
+import socket
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Set
+from urllib.parse import urlsplit
+
+import requests
+
+
+class JobEventBus:
+    """Fans job events out to per-job asyncio queues.
+
+    Subscribers only see events published after they subscribe, so callers
+    read the current record from the job store first and then wait here.
+    Events are only delivered within the process that runs the job.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def bind(self, loop: asyncio.AbstractEventLoop):
+        """Remember the loop so worker threads can publish into it"""
+        self._loop = loop
+
+    def subscribe(self, job_id: str) -> asyncio.Queue:
+        queue = asyncio.Queue()
+        self._subscribers.setdefault(job_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, job_id: str, queue: asyncio.Queue):
+        queues = self._subscribers.get(job_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[job_id]
+
+    def publish(self, job_id: str, event: str, data: Dict[str, Any]):
+        """Deliver an (event, data) pair to every subscriber of job_id (event loop only)"""
+        for queue in self._subscribers.get(job_id, ()):
+            queue.put_nowait((event, data))
+
+    def publish_threadsafe(self, job_id: str, event: str, data: Dict[str, Any]):
+        """Deliver an event from a worker thread"""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self.publish, job_id, event, data)
+
+
+class JobProgress:
+    """Collects partial output for one job from its worker thread.
+
+    Every progress event is streamed to subscribers straight away; the
+    job record's ``partial`` field is refreshed at most every
+    ``flush_interval`` seconds (and on every completed step) so token
+    streaming does not turn into a store write per token.
+    """
+
+    def __init__(self, job_id: str, job_store, events: JobEventBus, flush_interval: float = 1.0,
+                 max_steps: int = 50, max_output_chars: int = 20000):
+        self.job_id = job_id
+        self.job_store = job_store
+        self.events = events
+        self.flush_interval = flush_interval
+        self.max_steps = max_steps
+        self.max_output_chars = max_output_chars
+
+        self._steps: List[Dict[str, Any]] = []
+        self._output: List[str] = []
+        self._output_chars = 0
+        self._last_flush = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, event: Dict[str, Any]):
+        self.events.publish_threadsafe(self.job_id, "partial", event)
+
+        with self._lock:
+            if event.get("type") == "token":
+                self._output.append(event.get("chunk", ""))
+                self._output_chars += len(event.get("chunk", ""))
+                flush = time.monotonic() - self._last_flush >= self.flush_interval
+            else:
+                self._steps.append(event)
+                del self._steps[:-self.max_steps]
+                flush = True
+
+            if not flush:
+                return
+            self._last_flush = time.monotonic()
+            partial = self._snapshot_locked()
+
+        self.job_store.update(self.job_id, partial=partial)
+
+    def flush(self):
+        """Write the latest partial output to the job record"""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            partial = self._snapshot_locked()
+        self.job_store.update(self.job_id, partial=partial)
+
+    def _snapshot_locked(self) -> Dict[str, Any]:
+        if self._output_chars > self.max_output_chars:
+            text = "".join(self._output)[-self.max_output_chars:]
+            self._output = [text]
+            self._output_chars = len(text)
+        return {
+            "steps": list(self._steps),
+            "output": "".join(self._output),
+            "updated_at": time.time()
+        }
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """Encode one Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def callback_allowed_hosts() -> List[str]:
+    """CALLBACK_ALLOWED_HOSTS: comma-separated host names, '.example.com' also matches subdomains"""
+    return [host.strip().lower() for host in os.getenv("CALLBACK_ALLOWED_HOSTS", "").split(",") if host.strip()]
+
+
+def _host_allowed(host: str, allowed_hosts: Sequence[str]) -> bool:
+    return any(host == entry or (entry.startswith(".") and (host.endswith(entry) or host == entry[1:]))
+               for entry in allowed_hosts)
+
+
+def validate_callback_url(callback_url: str, allowed_hosts: Optional[Sequence[str]] = None) -> str:
+    """Reject callback URLs the server must not reach on a caller's behalf.
+
+    Only http(s) is accepted. With an allowlist the host must be on it;
+    without one, every address the host resolves to must be public (no
+    private, loopback, link-local, metadata or other reserved ranges).
+    Raises ValueError; returns the URL unchanged.
+    """
+    allowed_hosts = callback_allowed_hosts() if allowed_hosts is None else allowed_hosts
+    parts = urlsplit(callback_url)
+    if parts.scheme not in ("http", "https"):
+        raise ValueError("callback_url must use http or https")
+    host = (parts.hostname or "").lower()
+    if not host:
+        raise ValueError("callback_url has no host")
+    if parts.username or parts.password:
+        raise ValueError("callback_url must not contain credentials")
+
+    if allowed_hosts:
+        if not _host_allowed(host, allowed_hosts):
+            raise ValueError(f"callback_url host {host} is not in CALLBACK_ALLOWED_HOSTS")
+        return callback_url
+
+    try:
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, parts.port or 443, proto=socket.IPPROTO_TCP)}
+    except (socket.gaierror, UnicodeError):
+        raise ValueError(f"callback_url host {host} does not resolve")
+    for address in addresses:
+        ip = ipaddress.ip_address(address.split("%", 1)[0])
+        if not ip.is_global or ip.is_multicast:
+            raise ValueError(f"callback_url host {host} resolves to a non-public address")
+    return callback_url
+
+
+def post_callback(callback_url: str, payload: Dict[str, Any], timeout: float = 10) -> bool:
+    """POST a finished job to its callback URL; failures are logged, not raised"""
+    try:
+        # Checked again at send time: DNS may have changed since the job was created
+        validate_callback_url(callback_url)
+        response = requests.post(callback_url, json=payload, timeout=timeout, allow_redirects=False)
+        response.raise_for_status()
+        return True
+    except (requests.RequestException, ValueError) as e:
+        print(f"Callback to {callback_url} failed: {e}")
+        return False
@@ -0,0 +1,321 @@
+"""
+Cardano Career Navigator - Job Execution Engine
+Bounded worker pool that runs crew executions off the event loop
+"""
+
+import asyncio
+import itertools
+import os
+import time
+import traceback
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from metrics import job_queue_wait
+
+# Scheduling class per service type; lower runs first
+DEFAULT_SERVICE_PRIORITIES = {
+    "catalyst": 0,
+    "full_package": 0,
+    "roadmap": 1,
+    "assessment": 2
+}
+
+
+class QueueFullError(RuntimeError):
+    """Raised when a job is submitted while the queue is at capacity"""
+
+
+class _QueuedJob:
+    __slots__ = ("job_id", "job", "args", "service_type", "priority", "flow", "start", "finish", "seq",
+                 "enqueued_at")
+
+    def __init__(self, job_id, job, args, service_type, priority, flow, start, finish, seq, enqueued_at):
+        self.job_id = job_id
+        self.job = job
+        self.args = args
+        self.service_type = service_type
+        self.priority = priority
+        self.flow = flow
+        self.start = start
+        self.finish = finish
+        self.seq = seq
+        self.enqueued_at = enqueued_at
+
+
+class PriorityScheduler:
+    """Orders queued jobs by service class, purchaser fairness and age.
+
+    Each service type maps to a priority class. Inside a class, purchasers
+    share the workers through weighted fair queuing: every job starts at
+    its purchaser's previous finish tag (or the class clock, if later) and
+    finishes one unit after, so a purchaser with a burst of jobs interleaves
+    with everyone else instead of running them all first. Waiting
+    ``aging_seconds`` promotes a job by one class, so low-priority work is
+    never starved.
+    """
+
+    def __init__(self, priorities: Optional[Dict[str, int]] = None, aging_seconds: float = 60,
+                 default_priority: Optional[int] = None):
+        self.priorities = dict(DEFAULT_SERVICE_PRIORITIES if priorities is None else priorities)
+        self.aging_seconds = aging_seconds
+        self.default_priority = (max(self.priorities.values(), default=0)
+                                 if default_priority is None else default_priority)
+
+        self._jobs: List[_QueuedJob] = []
+        self._clock: Dict[int, float] = {}
+        self._flow_finish: Dict[Tuple[int, Hashable], float] = {}
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def push(self, job_id: str, job: Callable[..., Awaitable[Any]], args: Tuple,
+             service_type: Optional[str] = None, purchaser: Optional[Hashable] = None, weight: float = 1.0):
+        priority = self.priorities.get(service_type, self.default_priority)
+        start = max(self._clock.get(priority, 0.0), self._flow_finish.get((priority, purchaser), 0.0))
+        finish = start + 1.0 / weight
+        self._flow_finish[(priority, purchaser)] = finish
+        self._jobs.append(_QueuedJob(
+            job_id, job, args, service_type, priority, purchaser, start, finish, next(self._seq), time.monotonic()
+        ))
+
+    def pop(self) -> _QueuedJob:
+        """Remove and return the job that should run next"""
+        now = time.monotonic()
+
+        def rank(entry: _QueuedJob):
+            promotions = int((now - entry.enqueued_at) // self.aging_seconds) if self.aging_seconds > 0 else 0
+            return (entry.priority - promotions, entry.priority, entry.finish, entry.seq)
+
+        # Queues are bounded (JOB_QUEUE_SIZE), so a scan is cheaper than keeping aged heaps in sync
+        entry = min(self._jobs, key=rank)
+        self._jobs.remove(entry)
+
+        # Start-time fair queuing: the class clock follows the start tag of the job being served
+        self._clock[entry.priority] = max(self._clock.get(entry.priority, 0.0), entry.start)
+        if not self._jobs:
+            # Idle: nobody has backlog left to be fair about
+            self._flow_finish.clear()
+            self._clock.clear()
+        else:
+            # Purchasers with nothing left beyond the class clock need no state
+            self._flow_finish = {key: finish for key, finish in self._flow_finish.items()
+                                 if finish > self._clock.get(key[0], 0.0)}
+        return entry
+
+    def remove(self, job_id: str) -> bool:
+        """Drop a queued job; False if it is not (or no longer) queued"""
+        for entry in self._jobs:
+            if entry.job_id == job_id:
+                self._jobs.remove(entry)
+                return True
+        return False
+
+    def depth_by_priority(self) -> Dict[int, int]:
+        depths: Dict[int, int] = {}
+        for entry in self._jobs:
+            depths[entry.priority] = depths.get(entry.priority, 0) + 1
+        return depths
+
+
+class JobExecutor:
+    """Runs queued jobs on a fixed number of workers.
+
+    Jobs are coroutine functions that are awaited by one of ``max_workers``
+    dispatcher tasks in the order chosen by a ``PriorityScheduler``; blocking
+    work inside a job is handed to the backing thread or process pool via
+    ``run_blocking`` so the event loop stays free.
+    """
+
+    def __init__(self, max_workers: int = 2, max_queue_size: int = 50, mode: str = "thread",
+                 scheduler: Optional[PriorityScheduler] = None, spare_threads: Optional[int] = None):
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unknown executor mode: {mode}")
+
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.mode = mode
+
+        self.scheduler = scheduler or PriorityScheduler()
+        # Extra pool threads so runs abandoned on timeout/cancel don't block new jobs
+        self.spare_threads = max_workers if spare_threads is None else spare_threads
+
+        self._pool: Optional[Executor] = None
+        self._ready: Optional[asyncio.Semaphore] = None
+        self._dispatchers = []
+        self._in_flight = 0
+        self._abandoned = 0
+
+    async def start(self):
+        """Create the worker pool and start the dispatcher tasks"""
+        if self._pool is not None:
+            return
+
+        pool_size = self.max_workers + self.spare_threads
+        if self.mode == "process":
+            self._pool = ProcessPoolExecutor(max_workers=pool_size)
+        else:
+            self._pool = ThreadPoolExecutor(
+                max_workers=pool_size,
+                thread_name_prefix="crew-worker"
+            )
+
+        self._ready = asyncio.Semaphore(0)
+        self._dispatchers = [
+            asyncio.create_task(self._dispatch(), name=f"job-dispatcher-{i}")
+            for i in range(self.max_workers)
+        ]
+
+    async def shutdown(self):
+        """Stop dispatching and release the worker pool"""
+        for dispatcher in self._dispatchers:
+            dispatcher.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        self._dispatchers = []
+
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        self._ready = None
+
+    def submit(self, job_id: str, job: Callable[..., Awaitable[Any]], *args: Any,
+               service_type: Optional[str] = None, purchaser: Optional[Hashable] = None):
+        """Queue a job coroutine function; raises QueueFullError when saturated"""
+        if self._ready is None:
+            raise RuntimeError("JobExecutor has not been started")
+        if len(self.scheduler) >= self.max_queue_size:
+            raise QueueFullError(f"Job queue is full ({self.max_queue_size} jobs waiting)")
+
+        self.scheduler.push(job_id, job, args, service_type, purchaser)
+        self._ready.release()
+
+    def cancel(self, job_id: str) -> bool:
+        """Remove a job that has not started yet; True if it was still queued"""
+        return self.scheduler.remove(job_id)
+
+    def abandon(self, run: "asyncio.Future"):
+        """Stop waiting for a run_blocking call whose job has given up its worker slot.
+
+        The call keeps its pool thread until it returns or reaches a
+        cancellation checkpoint; its outcome is discarded.
+        """
+        if run.done():
+            return
+        self._abandoned += 1
+
+        def discard(future):
+            self._abandoned -= 1
+            if not future.cancelled():
+                future.exception()
+
+        run.add_done_callback(discard)
+
+    async def run_blocking(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking callable on the worker pool without blocking the loop"""
+        if self._pool is None:
+            raise RuntimeError("JobExecutor has not been started")
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, func, *args)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of pool configuration and current load"""
+        return {
+            "mode": self.mode,
+            "workers": self.max_workers,
+            "busy_workers": self._in_flight,
+            "queue_depth": len(self.scheduler),
+            "queue_depth_by_priority": self.scheduler.depth_by_priority(),
+            "max_queue_size": self.max_queue_size,
+            "abandoned_runs": self._abandoned
+        }
+
+    async def _dispatch(self):
+        """Pull jobs off the queue and run them one at a time"""
+        while True:
+            await self._ready.acquire()
+            if not len(self.scheduler):
+                # The job this permit was for was cancelled while queued
+                continue
+            entry = self.scheduler.pop()
+            job_id = entry.job_id
+            job_queue_wait.observe(time.monotonic() - entry.enqueued_at, entry.service_type or "other")
+            self._in_flight += 1
+            try:
+                await entry.job(*entry.args)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Jobs record their own failures; never let one kill the dispatcher
+                print(f"Job {job_id} raised outside its handler: {e}")
+                traceback.print_exc()
+            finally:
+                self._in_flight -= 1
+
+
+class SingleFlight:
+    """Coalesces identical in-flight jobs onto one execution.
+
+    The first job for a key becomes the leader and runs normally; jobs that
+    arrive while it is queued or running receive the leader's future and
+    complete from its result instead of launching their own run. Every job
+    counts as attached until the flight resolves or the job detaches.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Hashable, asyncio.Future] = {}
+        self._attached: Dict[Hashable, int] = {}
+
+    def acquire(self, key: Hashable) -> Tuple[asyncio.Future, bool]:
+        """Return the future for key and whether the caller is its leader"""
+        future = self._flights.get(key)
+        if future is not None:
+            self._attached[key] += 1
+            return future, False
+
+        future = asyncio.get_running_loop().create_future()
+        # Consume the exception so a failed flight without followers stays quiet
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._flights[key] = future
+        self._attached[key] = 1
+        return future, True
+
+    def detach(self, key: Hashable) -> bool:
+        """A job stops waiting on the flight; True when no job is attached any more"""
+        if key not in self._attached:
+            return False
+        self._attached[key] -= 1
+        return self._attached[key] <= 0
+
+    def attached(self, key: Hashable) -> int:
+        return self._attached.get(key, 0)
+
+    def resolve(self, key: Hashable, result: Any = None, error: Optional[BaseException] = None):
+        """Finish the flight for key, waking every attached follower"""
+        future = self._flights.pop(key, None)
+        self._attached.pop(key, None)
+        if future is None or future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+
+def create_job_executor() -> JobExecutor:
+    """Build the executor from environment configuration"""
+    priorities = {
+        service_type: int(os.getenv(f"JOB_PRIORITY_{service_type.upper()}", priority))
+        for service_type, priority in DEFAULT_SERVICE_PRIORITIES.items()
+    }
+    return JobExecutor(
+        max_workers=int(os.getenv("JOB_WORKERS", 2)),
+        max_queue_size=int(os.getenv("JOB_QUEUE_SIZE", 50)),
+        mode=os.getenv("JOB_EXECUTOR_MODE", "thread"),
+        spare_threads=int(os.environ["JOB_SPARE_THREADS"]) if os.getenv("JOB_SPARE_THREADS") else None,
+        scheduler=PriorityScheduler(priorities, aging_seconds=float(os.getenv("JOB_AGING_SECONDS", 60)))
+    )
@@ -0,0 +1,287 @@
+"""
+Cardano Career Navigator - Job Store
+Pluggable, bounded storage for job records shared by the API and workers
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Job states after which a record only waits for its retention period
+TERMINAL_STATUSES = {"completed", "failed", "cancelled"}
+
+
+class JobStore:
+    """Interface for job record storage; records are plain JSON-able dicts.
+
+    Async handlers use the ``*_async`` variants, which run a blocking
+    backend's calls on a worker thread so a busy database never stalls the
+    event loop. A finished job's status is final: later non-terminal
+    status changes are ignored.
+    """
+
+    # Whether calls can block on I/O (and so must stay off the event loop)
+    blocking = True
+
+    def create(self, job_id: str, record: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def update(self, job_id: str, **changes: Any) -> Optional[Dict[str, Any]]:
+        """Merge changes into a record and return it, or None if it is gone"""
+        raise NotImplementedError
+
+    def set_trace(self, job_id: str, trace: Dict[str, Any]) -> None:
+        """Attach a finished job's trace; kept apart from the record so status reads skip it"""
+        raise NotImplementedError
+
+    def get_trace(self, job_id: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def evict_expired(self) -> int:
+        """Drop finished jobs past their retention period; returns the count"""
+        raise NotImplementedError
+
+    def __contains__(self, job_id: str) -> bool:
+        return self.get(job_id) is not None
+
+    async def create_async(self, job_id: str, record: Dict[str, Any]) -> None:
+        await self._offload(self.create, job_id, record)
+
+    async def get_async(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return await self._offload(self.get, job_id)
+
+    async def update_async(self, job_id: str, **changes: Any) -> Optional[Dict[str, Any]]:
+        return await self._offload(self.update, job_id, **changes)
+
+    async def set_trace_async(self, job_id: str, trace: Dict[str, Any]) -> None:
+        await self._offload(self.set_trace, job_id, trace)
+
+    async def get_trace_async(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return await self._offload(self.get_trace, job_id)
+
+    async def evict_expired_async(self) -> int:
+        return await self._offload(self.evict_expired)
+
+    async def _offload(self, call, *args: Any, **kwargs: Any) -> Any:
+        if not self.blocking:
+            return call(*args, **kwargs)
+        return await asyncio.to_thread(call, *args, **kwargs)
+
+
+def _merge(record: Dict[str, Any], changes: Dict[str, Any]):
+    """Apply changes to a record in place, keeping a finished job's status"""
+    if record.get("status") in TERMINAL_STATUSES and changes.get("status") not in TERMINAL_STATUSES:
+        changes = {key: value for key, value in changes.items() if key != "status"}
+    record.update(changes)
+
+
+class InMemoryJobStore(JobStore):
+    """Process-local store bounded by retention time and job count"""
+
+    blocking = False
+
+    def __init__(self, retention_seconds: float = 86400, max_jobs: int = 10000):
+        self.retention_seconds = retention_seconds
+        self.max_jobs = max_jobs
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._traces: Dict[str, Dict[str, Any]] = {}
+        # Finished job ids in completion order, so eviction pops from the front
+        self._finished: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, job_id: str, record: Dict[str, Any]) -> None:
+        with self._lock:
+            # Leave room for the new record
+            self._evict_locked(time.time(), room=1)
+            self._records[job_id] = dict(record)
+            if record.get("status") in TERMINAL_STATUSES:
+                self._finished[job_id] = time.time()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            record = self._records.get(job_id)
+            return dict(record) if record is not None else None
+
+    def update(self, job_id: str, **changes: Any) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            record = self._records.get(job_id)
+            if record is None:
+                return None
+            _merge(record, changes)
+            if record.get("status") in TERMINAL_STATUSES and job_id not in self._finished:
+                self._finished[job_id] = time.time()
+            return dict(record)
+
+    def set_trace(self, job_id: str, trace: Dict[str, Any]) -> None:
+        with self._lock:
+            if job_id in self._records:
+                self._traces[job_id] = trace
+
+    def get_trace(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._traces.get(job_id)
+
+    def evict_expired(self) -> int:
+        with self._lock:
+            return self._evict_locked(time.time())
+
+    def _evict_locked(self, now: float, room: int = 0) -> int:
+        evicted = 0
+        cutoff = now - self.retention_seconds
+        while self._finished:
+            job_id, finished_at = next(iter(self._finished.items()))
+            # Expired by age, or the oldest finished job when over capacity
+            if finished_at > cutoff and len(self._records) + room <= self.max_jobs:
+                break
+            self._finished.popitem(last=False)
+            self._records.pop(job_id, None)
+            self._traces.pop(job_id, None)
+            evicted += 1
+        return evicted
+
+
+class SQLiteJobStore(JobStore):
+    """SQLite (WAL) store that several worker processes can share"""
+
+    # Run the retention sweep at most this often (seconds)
+    EVICTION_INTERVAL = 60
+
+    def __init__(self, path: str = "jobs.db", retention_seconds: float = 86400,
+                 max_jobs: int = 100000):
+        self.path = path
+        self.retention_seconds = retention_seconds
+        self.max_jobs = max_jobs
+        self._local = threading.local()
+        self._last_eviction = 0.0
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                record TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                finished_at REAL,
+                trace TEXT
+            )
+        """)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+        if "trace" not in columns:
+            # Databases created before traces moved out of the record
+            conn.execute("ALTER TABLE jobs ADD COLUMN trace TEXT")
+        conn.execute("CREATE INDEX IF NOT EXISTS jobs_finished_at ON jobs (finished_at)")
+        conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread; sqlite3 connections are not thread-safe"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def create(self, job_id: str, record: Dict[str, Any]) -> None:
+        now = time.time()
+        finished_at = now if record.get("status") in TERMINAL_STATUSES else None
+        self._connection().execute(
+            "INSERT OR REPLACE INTO jobs (job_id, record, created_at, finished_at) VALUES (?, ?, ?, ?)",
+            (job_id, json.dumps(record), now, finished_at)
+        )
+        self._maybe_evict(now)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connection().execute(
+            "SELECT record FROM jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def update(self, job_id: str, **changes: Any) -> Optional[Dict[str, Any]]:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT record, finished_at FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+
+            record = json.loads(row[0])
+            _merge(record, changes)
+            finished_at = row[1]
+            if finished_at is None and record.get("status") in TERMINAL_STATUSES:
+                finished_at = time.time()
+
+            conn.execute(
+                "UPDATE jobs SET record = ?, finished_at = ? WHERE job_id = ?",
+                (json.dumps(record), finished_at, job_id)
+            )
+            conn.execute("COMMIT")
+            return record
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def set_trace(self, job_id: str, trace: Dict[str, Any]) -> None:
+        self._connection().execute(
+            "UPDATE jobs SET trace = ? WHERE job_id = ?", (json.dumps(trace), job_id)
+        )
+
+    def get_trace(self, job_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connection().execute(
+            "SELECT trace FROM jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row and row[0] else None
+
+    def evict_expired(self) -> int:
+        conn = self._connection()
+        now = time.time()
+        self._last_eviction = now
+        evicted = conn.execute(
+            "DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?",
+            (now - self.retention_seconds,)
+        ).rowcount
+
+        # Enforce the size cap by dropping the oldest finished jobs
+        overflow = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] - self.max_jobs
+        if overflow > 0:
+            evicted += conn.execute(
+                """DELETE FROM jobs WHERE job_id IN (
+                    SELECT job_id FROM jobs WHERE finished_at IS NOT NULL
+                    ORDER BY finished_at LIMIT ?
+                )""",
+                (overflow,)
+            ).rowcount
+        return evicted
+
+    def _maybe_evict(self, now: float):
+        if now - self._last_eviction >= self.EVICTION_INTERVAL:
+            self.evict_expired()
+
+
+def create_job_store() -> JobStore:
+    """Build the configured job store backend"""
+    backend = os.getenv("JOB_STORE_BACKEND", "memory")
+    retention = float(os.getenv("JOB_RETENTION_SECONDS", 86400))
+
+    if backend == "sqlite":
+        return SQLiteJobStore(
+            path=os.getenv("JOB_STORE_PATH", "jobs.db"),
+            retention_seconds=retention,
+            max_jobs=int(os.getenv("JOB_STORE_MAX_JOBS", 100000))
+        )
+    if backend == "memory":
+        return InMemoryJobStore(
+            retention_seconds=retention,
+            max_jobs=int(os.getenv("JOB_STORE_MAX_JOBS", 10000))
+        )
+    raise ValueError(f"Unknown job store backend: {backend}")
@@ -3,12 +3,15 @@ Cardano Career Navigator - Masumi AI Agent
 FastAPI application following MIP-003 standard
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+from contextlib import asynccontextmanager
 import uuid
 import asyncio
+import time
 from datetime import datetime
 import os
 import sys
@@ -17,33 +20,144 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
-# Import our CrewAI agent
-from crew_definition import career_navigator_crew
+# The CrewAI agents load lazily (crewai alone takes seconds to import); see crew_runtime
+from crew_runtime import ASSESSMENT_MODES, SERVICE_TYPES, format_price, run_service_request, warmup
+from job_executor import QueueFullError, SingleFlight, create_job_executor
+from job_events import JobEventBus, JobProgress, format_sse, post_callback, validate_callback_url
+from job_store import TERMINAL_STATUSES, create_job_store
+from result_cache import create_result_cache
+from fast_json import FastJSONResponse, parse_fields, select_fields
+from admission import create_admission_controller, format_duration
+from rate_limit import create_rate_limit_policy
+from job_cancel import CancelToken, JobCancelled, job_timeout
+import roadmap_cache
+from tracing import JobTrace, export_trace, trace_to_jsonl
+from metrics import admission_rejections, hit_ratio, jobs_finished, jobs_started, record_crew_run, registry, tool_cache_hit_ratio
 
 # Pydantic models for API
 class ServiceRequest(BaseModel):
     identifier_from_purchaser: str = Field(..., description="Purchaser identifier")
     input_data: Dict[str, Any] = Field(..., description="Service input data")
+    callback_url: Optional[str] = Field(None, description="URL to POST the final job status to")
 
 class JobStatus(BaseModel):
     job_id: str
     status: str
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
+    cached: bool = False
+    partial: Optional[Dict[str, Any]] = None
+    # Only filled in when /status asks for it through ``fields``
+    trace: Optional[Dict[str, Any]] = None
 
 class InputSchema(BaseModel):
-    type: str = Field(..., description="Service type: assessment, roadmap, or catalyst")
+    type: str = Field(..., description="Service type: assessment, roadmap, catalyst, or full_package")
     user_address: str = Field(..., description="Cardano wallet address")
-    timeline: Optional[str] = Field(None, description="Timeline for roadmap: 3-months, 6-months, 12-months")
+    timeline: Optional[str] = Field(None, description="Timeline for roadmap and full_package: 3-months, 6-months, 12-months")
+    mode: Optional[str] = Field(None, description="Assessment mode: crew (full agent run) or fast (rule-based)")
 
-# Global job storage (use database in production)
-jobs: Dict[str, JobStatus] = {}
+# Job storage (JOB_STORE_BACKEND=sqlite to share jobs across workers)
+job_store = create_job_store()
+
+# Finished results reused for repeat requests from the same wallet
+result_cache = create_result_cache()
+
+# Worker pool that runs crew executions off the event loop
+executor = create_job_executor()
+
+# Token buckets per purchaser and wallet (shared through SQLite with JOB_STORE_BACKEND=sqlite)
+rate_limits = create_rate_limit_policy()
+
+# Rejects new work with 429/503 once the executor is saturated
+admission = create_admission_controller(executor)
+
+# Identical jobs that arrive while one is in flight share its execution
+inflight = SingleFlight()
+
+# Status transitions pushed to long-poll, SSE and webhook clients
+job_events = JobEventBus()
+callback_urls: Dict[str, str] = {}
+
+# Cancel tokens for jobs queued or running in this process
+cancel_tokens: Dict[str, CancelToken] = {}
+
+# Leader job and run token per in-flight crew run. A run is shared by every job coalesced
+# onto it, so it is only cancelled once none of them is still waiting for its result.
+flight_runs: Dict[Tuple, Tuple[str, CancelToken]] = {}
+
+# Load and cache gauges are read from live state when /metrics is scraped
+registry.gauge("career_job_queue_depth", "Jobs waiting for a worker", lambda: executor.stats()["queue_depth"])
+registry.gauge("career_crews_in_flight", "Crew executions holding a worker", lambda: executor.stats()["busy_workers"])
+registry.gauge("career_abandoned_runs", "Timed-out or cancelled runs still winding down",
+               lambda: executor.stats()["abandoned_runs"])
+registry.gauge("career_cache_hit_ratio", "Share of lookups answered from cache",
+               lambda: {("result",): hit_ratio(result_cache.hits, result_cache.misses),
+                        ("tool",): tool_cache_hit_ratio(),
+                        ("roadmap_skeleton",): roadmap_skeleton_hit_ratio()},
+               ("cache",))
+registry.gauge("career_crew_ready", "1 once the crew subsystem has finished warming up",
+               lambda: 1 if warmup.ready else 0)
+
+def roadmap_skeleton_hit_ratio() -> Optional[float]:
+    cache = roadmap_cache.roadmap_skeleton_cache
+    return hit_ratio(cache.hits, cache.misses) if cache is not None else None
+
+# Append finished job traces to this file as JSON lines (unset disables)
+TRACE_EXPORT_PATH = os.getenv("TRACE_EXPORT_PATH")
+
+# Assessment mode used when a request does not pick one
+ASSESSMENT_DEFAULT_MODE = os.getenv("ASSESSMENT_DEFAULT_MODE", "crew")
+
+# Build the crew in the background at startup; false defers it to the first job
+WARMUP_ON_START = os.getenv("WARMUP_ON_START", "true").lower() == "true"
+
+# Longest a /status long-poll may hold the connection (seconds)
+MAX_STATUS_WAIT = 60
+
+# How often long-polls and SSE streams re-read the job store for jobs run by other workers (seconds)
+STATUS_POLL_INTERVAL = float(os.getenv("STATUS_POLL_INTERVAL", 1.0))
+
+# How often finished jobs past their retention period are swept from the job store (seconds)
+JOB_EVICTION_INTERVAL = 60
+
+# Strong references to fire-and-forget tasks so they are not garbage collected
+pending_tasks = set()
+
+def spawn(coro):
+    task = asyncio.create_task(coro)
+    pending_tasks.add(task)
+    task.add_done_callback(pending_tasks.discard)
+    return task
+
+async def evict_jobs_periodically():
+    """Drop expired jobs even while no new job arrives to trigger the store's own sweep"""
+    while True:
+        await asyncio.sleep(JOB_EVICTION_INTERVAL)
+        try:
+            await job_store.evict_expired_async()
+        except Exception as e:
+            print(f"Job store eviction failed: {e}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    job_events.bind(asyncio.get_running_loop())
+    await executor.start()
+    evictor = spawn(evict_jobs_periodically())
+    if WARMUP_ON_START:
+        warmup.start()
+    else:
+        warmup.defer()
+    warmup.mark("serving")
+    yield
+    evictor.cancel()
+    await executor.shutdown()
 
 # FastAPI app
 app = FastAPI(
     title="Cardano Career Navigator",
     description="AI agent providing personalized Cardano ecosystem career guidance",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -60,7 +174,7 @@ async def root():
     return {
         "message": "Cardano Career Navigator AI Agent",
         "version": "1.0.0",
-        "services": ["assessment", "roadmap", "catalyst"],
+        "services": SERVICE_TYPES,
         "status": "active"
     }
 
@@ -72,7 +186,7 @@ async def get_input_schema():
         "properties": {
             "type": {
                 "type": "string",
-                "enum": ["assessment", "roadmap", "catalyst"],
+                "enum": SERVICE_TYPES,
                 "description": "Type of service requested"
             },
             "user_address": {
@@ -82,7 +196,12 @@ async def get_input_schema():
             "timeline": {
                 "type": "string",
                 "enum": ["3-months", "6-months", "12-months"],
-                "description": "Timeline for roadmap service (optional for other services)"
+                "description": "Timeline for roadmap and full_package services (optional for other services)"
+            },
+            "mode": {
+                "type": "string",
+                "enum": ASSESSMENT_MODES,
+                "description": "Assessment only: 'fast' builds the assessment from rule tables in under a second, 'crew' runs the full agent crew"
             }
         },
         "required": ["type", "user_address"]
@@ -90,19 +209,61 @@ async def get_input_schema():
 
 @app.get("/availability")
 async def check_availability():
-    """Check if the agent is available to process requests"""
-    return {
-        "available": True,
-        "status": "ready",
-        "services": {
-            "assessment": {"price": "0.5 ADA", "estimated_time": "2-3 minutes"},
-            "roadmap": {"price": "1.5 ADA", "estimated_time": "3-5 minutes"},
-            "catalyst": {"price": "3.0 ADA", "estimated_time": "5-10 minutes"}
+    """Report live capacity and per-service time estimates from recent runtimes"""
+    load = admission.load()
+    rejection = admission.check_load(load)
+    wait = admission.estimated_wait(load)
+    
+    services = {}
+    for service_type in SERVICE_TYPES:
+        runtime = admission.runtimes.estimate(service_type)
+        services[service_type] = {
+            "price": format_price(service_type),
+            "estimated_time": format_duration(wait + runtime),
+            "estimated_seconds": round(wait + runtime, 1),
+            "runtime_samples": admission.runtimes.samples(service_type)
         }
+    fast_runtime = admission.runtimes.estimate(admission.runtimes.key("assessment", "fast"))
+    services["assessment"]["modes"] = {"fast": {"estimated_time": format_duration(wait + fast_runtime)}}
+    
+    return {
+        "available": rejection is None,
+        "ready": warmup.ready,
+        "status": "saturated" if rejection else ("busy" if load["in_flight"] >= load["workers"] else "ready"),
+        "capacity": load,
+        "estimated_wait_seconds": round(wait, 1),
+        "retry_after": rejection.retry_after if rejection else None,
+        "services": services
     }
 
+@app.get("/livez")
+async def liveness():
+    """Liveness: the process is up and serving; never waits on the crew"""
+    return {"status": "alive"}
+
+@app.get("/readyz")
+async def readiness(response: Response):
+    """Readiness: 200 once the crew has warmed up (or at once when warmup is deferred), 503 (with Retry-After) until then"""
+    if warmup.serving:
+        return {"status": "ready" if warmup.ready else warmup.state}
+    response.status_code = 503
+    if warmup.state != "failed":
+        # Still warming (or between retries); a failed warmup needs an operator, not a retry
+        response.headers["Retry-After"] = "5"
+    return {"status": warmup.state, "error": warmup.error}
+
+@app.get("/startup")
+async def startup_report():
+    """Startup-time report: when the API started serving and became ready, and warmup phase durations"""
+    return warmup.report()
+
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus metrics for this worker process"""
+    return Response(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 @app.post("/start_job")
-async def start_job(request: ServiceRequest, background_tasks: BackgroundTasks):
+async def start_job(request: ServiceRequest, response: Response):
     """Start a new AI task"""
     job_id = str(uuid.uuid4())
     
@@ -112,29 +273,110 @@ async def start_job(request: ServiceRequest, background_tasks: BackgroundTasks):
         service_type = input_data.get("type")
         user_address = input_data.get("user_address")
         timeline = input_data.get("timeline")
+        mode = input_data.get("mode")
         
-        if not service_type or service_type not in ["assessment", "roadmap", "catalyst"]:
+        if not service_type or service_type not in SERVICE_TYPES:
             raise HTTPException(status_code=400, detail="Invalid service type")
         
         if not user_address:
             raise HTTPException(status_code=400, detail="user_address is required")
             
-        if service_type == "roadmap" and not timeline:
+        if service_type in ("roadmap", "full_package") and not timeline:
             timeline = "6-months"  # Default timeline
+        
+        if service_type == "assessment":
+            mode = mode or ASSESSMENT_DEFAULT_MODE
+            if mode not in ASSESSMENT_MODES:
+                raise HTTPException(status_code=400, detail=f"mode must be one of {ASSESSMENT_MODES}")
+        else:
+            mode = None
             
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Invalid input data: {str(e)}")
     
-    # Create job entry
-    jobs[job_id] = JobStatus(
+    # Per-purchaser and per-wallet quotas
+    quota = await rate_limits.check_async(request.identifier_from_purchaser, user_address)
+    if quota is not None:
+        if not quota.allowed:
+            raise HTTPException(status_code=429, detail=f"Rate limit exceeded for {quota.key}",
+                                headers=quota.headers())
+        response.headers.update(quota.headers())
+    
+    # Callback URLs are fetched by this server, so only public http(s) endpoints are accepted
+    if request.callback_url:
+        try:
+            await asyncio.to_thread(validate_callback_url, request.callback_url)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid callback_url: {e}")
+        callback_urls[job_id] = request.callback_url
+    
+    # Repeat requests complete immediately from the result cache
+    
+    cached_result = await result_cache.get_async(service_type, user_address, timeline, mode)
+    if cached_result is not None:
+        record = JobStatus(
+            job_id=job_id,
+            status="completed",
+            result=cached_result,
+            cached=True
+        ).model_dump(exclude={"trace"})
+        await job_store.create_async(job_id, record)
+        notify_job(job_id, record)
+        jobs_started.inc(service_type)
+        jobs_finished.inc(service_type, "completed")
+        return {
+            "job_id": job_id,
+            "status": "completed",
+            "message": f"Returning cached {service_type} result for {user_address}"
+        }
+    
+    # Attach to an identical job that is already queued or running
+    flight_key = result_cache.make_key(service_type, user_address, timeline, mode)
+    flight, is_leader = inflight.acquire(flight_key)
+    
+    if is_leader:
+        # Turn the job away before queueing it when the agent is saturated
+        rejection = admission.check()
+        if rejection is not None:
+            admission_rejections.inc(rejection.status_code)
+            inflight.resolve(flight_key, error=RuntimeError(rejection.reason))
+            callback_urls.pop(job_id, None)
+            raise HTTPException(
+                status_code=rejection.status_code,
+                detail=rejection.reason,
+                headers={"Retry-After": str(rejection.retry_after)}
+            )
+    
+    # Create job entry before a worker can update it
+    await job_store.create_async(job_id, JobStatus(
         job_id=job_id,
         status="pending",
         result=None,
         error=None
-    )
+    ).model_dump(exclude={"trace"}))
     
-    # Start background processing
-    background_tasks.add_task(process_job, job_id, service_type, user_address, timeline)
+    if is_leader:
+        # Queue processing on the worker pool
+        cancel_tokens[job_id] = CancelToken(flight_key)
+        flight_runs[flight_key] = (job_id, CancelToken(flight_key))
+        try:
+            executor.submit(
+                job_id, process_job, job_id, service_type, user_address, timeline, mode, time.time(),
+                service_type=service_type, purchaser=request.identifier_from_purchaser
+            )
+        except QueueFullError as e:
+            inflight.resolve(flight_key, error=e)
+            callback_urls.pop(job_id, None)
+            cancel_tokens.pop(job_id, None)
+            flight_runs.pop(flight_key, None)
+            # Never returned to the client; finish it so retention can evict it
+            await job_store.update_async(job_id, status="failed", error=str(e))
+            retry_after = max(1, round(admission.estimated_wait()))
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(retry_after)})
+    else:
+        cancel_tokens[job_id] = CancelToken(flight_key)
+        spawn(follow_job(job_id, flight, cancel_tokens[job_id]))
+    jobs_started.inc(service_type)
     
     return {
         "job_id": job_id,
@@ -143,41 +385,289 @@ async def start_job(request: ServiceRequest, background_tasks: BackgroundTasks):
     }
 
 @app.get("/status")
-async def get_job_status(job_id: str):
-    """Check job status"""
-    if job_id not in jobs:
+async def get_job_status(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=MAX_STATUS_WAIT, description="Seconds to long-poll for completion"),
+    fields: Optional[str] = Query(None, description="Comma-separated dotted paths to return, e.g. status,result.result.milestones")
+):
+    """Check job status, optionally waiting until the job finishes"""
+    record = await job_store.get_async(job_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    if wait > 0 and record["status"] not in TERMINAL_STATUSES:
+        record = await wait_for_job(job_id, wait)
+        if record is None:
+            # Evicted while we waited
+            raise HTTPException(status_code=404, detail="Job not found")
+    
+    paths = parse_fields(fields)
+    if paths and any(path.split(".")[0] == "trace" for path in paths):
+        record["trace"] = await job_store.get_trace_async(job_id)
+    payload = JobStatus(**record).model_dump()
+    if paths:
+        payload = dict(select_fields(payload, paths), job_id=job_id)
+    else:
+        del payload["trace"]
+    return FastJSONResponse(payload)
+
+@app.get("/trace")
+async def get_job_trace(job_id: str):
+    """Export a finished job's latency breakdown as JSON lines, one span per line"""
+    record = await job_store.get_async(job_id)
+    if record is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    return jobs[job_id]
+    trace = await job_store.get_trace_async(job_id)
+    if not trace:
+        raise HTTPException(status_code=404, detail="No trace recorded for this job")
+    return Response(trace_to_jsonl(trace), media_type="application/x-ndjson")
+
+@app.get("/status/stream")
+async def stream_job_status(
+    job_id: str,
+    partial: bool = Query(True, description="Also stream agent steps and LLM tokens as they are produced")
+):
+    """Stream job status transitions and partial output as Server-Sent Events"""
+    if await job_store.get_async(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    queue = job_events.subscribe(job_id)
+    
+    async def events():
+        try:
+            record = await job_store.get_async(job_id)
+            if record is None:
+                # Evicted since the 404 check above
+                yield format_sse("error", {"job_id": job_id, "error": "Job not found"})
+                return
+            yield format_sse("status", JobStatus(**record).model_dump(exclude={"trace"}))
+            idle_since = asyncio.get_running_loop().time()
+            
+            while record["status"] not in TERMINAL_STATUSES:
+                try:
+                    event, data = await asyncio.wait_for(queue.get(), timeout=STATUS_POLL_INTERVAL)
+                except asyncio.TimeoutError:
+                    # A job run by another worker only shows up in the store
+                    stored = await job_store.get_async(job_id) or record
+                    if stored["status"] != record["status"]:
+                        record = stored
+                        yield format_sse("status", JobStatus(**record).model_dump(exclude={"trace"}))
+                    elif asyncio.get_running_loop().time() - idle_since >= 15:
+                        # Keep proxies from closing an idle stream
+                        idle_since = asyncio.get_running_loop().time()
+                        yield ": keep-alive\n\n"
+                    continue
+                
+                if event == "status":
+                    record = data
+                    yield format_sse("status", JobStatus(**record).model_dump(exclude={"trace"}))
+                elif partial:
+                    yield format_sse(event, data)
+        finally:
+            job_events.unsubscribe(job_id, queue)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @app.post("/provide_input")
 async def provide_additional_input(job_id: str, additional_data: Dict[str, Any]):
     """Provide additional input for a running job"""
-    if job_id not in jobs:
+    record = await job_store.get_async(job_id)
+    if record is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    job = jobs[job_id]
-    if job.status != "waiting_for_input":
+    if record["status"] != "waiting_for_input":
         raise HTTPException(status_code=400, detail="Job is not waiting for input")
     
     # Update job with additional data and resume processing
-    job.status = "processing"
+    await update_job(job_id, status="processing")
     return {"message": "Additional input provided, resuming processing"}
 
-async def process_job(job_id: str, service_type: str, user_address: str, timeline: str = None):
+@app.post("/cancel_job")
+async def cancel_job(job_id: str):
+    """Cancel a queued or running job and free its worker slot"""
+    record = await job_store.get_async(job_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    if record["status"] in TERMINAL_STATUSES:
+        raise HTTPException(status_code=400, detail=f"Job already {record['status']}")
+    
+    token = cancel_tokens.pop(job_id, None)
+    if token is None:
+        # Queued or running in another worker process sharing the job store
+        raise HTTPException(status_code=409, detail="Job is not running in this worker")
+    
+    token.cancel("Cancelled by request")
+    if inflight.detach(token.flight_key):
+        # No other job is waiting for this run any more, so stop it and free its slot
+        cancel_flight(token.flight_key)
+    await update_job(job_id, status="cancelled", error="Cancelled by request")
+    jobs_finished.inc(token.flight_key[0], "cancelled")
+    return {"job_id": job_id, "status": "cancelled"}
+
+def cancel_flight(flight_key: Tuple):
+    """Stop a crew run that no job is attached to any more"""
+    leader_id, run_token = flight_runs.pop(flight_key, (None, None))
+    if run_token is None:
+        return
+    run_token.cancel("Cancelled by request")
+    if executor.cancel(leader_id):
+        # Never started, so process_job will not resolve the flight
+        inflight.resolve(flight_key, error=RuntimeError("Cancelled by request"))
+
+async def update_job(job_id: str, **changes: Any) -> Optional[Dict[str, Any]]:
+    """Apply a status change and push it to everyone waiting on the job"""
+    record = await job_store.update_async(job_id, **changes)
+    if record is not None:
+        notify_job(job_id, record)
+    return record
+
+def notify_job(job_id: str, record: Dict[str, Any]):
+    """Publish a job record; finished jobs also fire their callback URL"""
+    job_events.publish(job_id, "status", record)
+    
+    if record["status"] in TERMINAL_STATUSES:
+        callback_url = callback_urls.pop(job_id, None)
+        if callback_url:
+            payload = JobStatus(**record).model_dump(exclude={"trace"})
+            spawn(asyncio.to_thread(post_callback, callback_url, payload))
+
+async def wait_for_job(job_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+    """Wait up to timeout seconds for a job to finish and return its record (None once it is gone)"""
+    queue = job_events.subscribe(job_id)
+    try:
+        # Re-read after subscribing so a transition in between is not missed
+        record = await job_store.get_async(job_id)
+        if record is None:
+            return None
+        deadline = asyncio.get_running_loop().time() + timeout
+        
+        while record["status"] not in TERMINAL_STATUSES:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                event, data = await asyncio.wait_for(queue.get(), timeout=min(remaining, STATUS_POLL_INTERVAL))
+                if event == "status":
+                    record = data
+            except asyncio.TimeoutError:
+                # Events only reach this process; a job run by another worker shows up in the store
+                record = await job_store.get_async(job_id) or record
+        return record
+    finally:
+        job_events.unsubscribe(job_id, queue)
+
+async def await_run(run: asyncio.Future, token: CancelToken, timeout: float) -> Any:
+    """Wait for a worker run; on timeout or cancellation give up its slot right away.
+    
+    The abandoned run stops at its next cancellation checkpoint.
+    """
+    waiter = asyncio.ensure_future(token.wait())
+    try:
+        done, _ = await asyncio.wait({run, waiter}, timeout=timeout or None, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        waiter.cancel()
+    
+    if run in done:
+        return run.result()
+    
+    executor.abandon(run)
+    if token.cancelled:
+        raise JobCancelled(token.reason)
+    token.cancel(f"Job timed out after {timeout:g} seconds")
+    raise TimeoutError(token.reason)
+
+async def finish_trace(job_id: str, trace: JobTrace, run_started: float):
+    """Close the job's run span and store the trace for /trace, apart from the job record"""
+    trace.add("run", "run", run_started, time.time())
+    data = trace.to_dict()
+    await job_store.set_trace_async(job_id, data)
+    if TRACE_EXPORT_PATH:
+        spawn(asyncio.to_thread(export_trace, data, TRACE_EXPORT_PATH))
+
+async def process_job(job_id: str, service_type: str, user_address: str, timeline: str = None,
+                      mode: str = None, submitted_at: Optional[float] = None):
     """Background task to process the job"""
+    flight_key = result_cache.make_key(service_type, user_address, timeline, mode)
+    # The job's own token, and the run's: cancelling the leader job leaves the run going for its followers
+    token = cancel_tokens.get(job_id) or CancelToken(flight_key)
+    run_token = flight_runs.get(flight_key, (job_id, token))[1]
+    trace = JobTrace(job_id, started_at=submitted_at)
+    started = time.time()
+    trace.add("queue_wait", "queue", trace.started_at, started, service=service_type)
     try:
-        jobs[job_id].status = "processing"
+        if run_token.cancelled:
+            inflight.resolve(flight_key, error=RuntimeError("Cancelled by request"))
+            return
+        if not token.cancelled:
+            await update_job(job_id, status="processing")
         
-        # Process with CrewAI
-        result = career_navigator_crew.process_request(service_type, user_address, timeline)
+        # Partial output, cancel checkpoints and crew spans only reach threads in this process
+        in_process = executor.mode == "thread"
+        progress = JobProgress(job_id, job_store, job_events) if in_process else None
         
-        jobs[job_id].status = "completed"
-        jobs[job_id].result = result
+        # Process with CrewAI on the worker pool
+        run = asyncio.ensure_future(executor.run_blocking(
+            run_service_request, service_type, user_address, timeline, progress, mode,
+            run_token if in_process else None, trace if in_process else None
+        ))
+        result = await await_run(run, run_token, job_timeout(service_type))
+        runtime = time.time() - started
+        admission.runtimes.record(admission.runtimes.key(service_type, mode), runtime)
+        record_crew_run(service_type, mode, runtime, result)
+        if progress is not None:
+            await asyncio.to_thread(progress.flush)
         
+        await result_cache.put_async(service_type, user_address, timeline, result, mode)
+        if not token.cancelled:
+            await finish_trace(job_id, trace, started)
+            await update_job(job_id, status="completed", result=result)
+            jobs_finished.inc(service_type, "completed")
+        inflight.resolve(flight_key, result=result)
+        
+    except JobCancelled as e:
+        # Only /cancel_job cancels a run, once no job is attached, and it counts the cancellation
+        await finish_trace(job_id, trace, started)
+        await update_job(job_id, status="cancelled", error=str(e))
+        inflight.resolve(flight_key, error=RuntimeError("Cancelled by request"))
+    
+    except Exception as e:
+        if not token.cancelled:
+            await finish_trace(job_id, trace, started)
+            await update_job(job_id, status="failed", error=str(e))
+            jobs_finished.inc(service_type, "failed")
+        inflight.resolve(flight_key, error=e)
+    
+    finally:
+        cancel_tokens.pop(job_id, None)
+        if flight_runs.get(flight_key, (None,))[0] == job_id:
+            del flight_runs[flight_key]
+
+async def follow_job(job_id: str, flight: asyncio.Future, token: CancelToken):
+    """Complete a coalesced job from the result of the job it attached to"""
+    waiter = asyncio.ensure_future(token.wait())
+    # Waiting on a shield leaves the flight running for other jobs when this one stops waiting
+    shared = asyncio.shield(flight)
+    try:
+        await update_job(job_id, status="processing")
+        done, _ = await asyncio.wait({shared, waiter}, return_when=asyncio.FIRST_COMPLETED)
+        if shared in done:
+            await update_job(job_id, status="completed", result=shared.result())
+            jobs_finished.inc(token.flight_key[0], "completed")
+        # Otherwise /cancel_job recorded the cancellation; the leader keeps running
     except Exception as e:
-        jobs[job_id].status = "failed"
-        jobs[job_id].error = str(e)
+        await update_job(job_id, status="failed", error=str(e))
+        jobs_finished.inc(token.flight_key[0], "failed")
+    finally:
+        waiter.cancel()
+        # A cancelled job never reads the shield, so it must not hold the flight's result or error
+        shared.cancel()
+        cancel_tokens.pop(job_id, None)
 
 if __name__ == "__main__":
     import uvicorn
@@ -193,7 +683,7 @@ if __name__ == "__main__":
             "type": "assessment",
             "user_address": "addr_test1qz2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzer3jcu5d8ps7zex2k2xt6ll2qzqf2d8swcyc2lqzqcqqqqqq"
         }
-        result = career_navigator_crew.process_request(
+        result = run_service_request(
             test_input["type"], 
             test_input["user_address"]
         )
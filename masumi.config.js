@@ -96,6 +96,27 @@ export const masumiConfig = {
         },
         required: ["type", "userAddress"]
       }
+    },
+    
+    full_package: {
+      name: "Full Career Package",
+      description: "Skills assessment, career roadmap and Catalyst guidance in one run",
+      price: 5.0,
+      currency: "ADA",
+      estimatedTime: "5-10 minutes",
+      requirements: ["Valid Cardano wallet address", "Timeline preference"],
+      endpoint: "/api/process",
+      method: "POST",
+      inputSchema: {
+        type: "object",
+        properties: {
+          type: { type: "string", enum: ["full_package"] },
+          userAddress: { type: "string", description: "Cardano wallet address" },
+          timeline: { type: "string", enum: ["3-months", "6-months", "12-months"] },
+          paymentTxHash: { type: "string", description: "Payment transaction hash" }
+        },
+        required: ["type", "userAddress"]
+      }
     }
   },
 
@@ -0,0 +1,226 @@
+"""
+Cardano Career Navigator - Metrics
+In-process counters, gauges and histograms exposed in Prometheus text format at /metrics
+"""
+
+import bisect
+import math
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+# Bucket upper bounds (seconds)
+JOB_SECONDS_BUCKETS = (0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 900)
+TOOL_SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+Labels = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        # Held only for a dict update; recording never blocks on a scrape
+        self._lock = threading.Lock()
+
+    def _labels(self, labels: Sequence[str]) -> Labels:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        return tuple(str(label) for label in labels)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonic count; exported as <name>_total"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def header(self) -> List[str]:
+        # The text format types samples by their exact name, so the family is <name>_total too
+        return [f"# HELP {self.name}_total {self.documentation}", f"# TYPE {self.name}_total {self.kind}"]
+
+    def inc(self, *labels: str, amount: float = 1):
+        key = self._labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(self._labels(labels), 0)
+
+    def values(self) -> Dict[Labels, float]:
+        with self._lock:
+            return dict(self._values)
+
+    def samples(self) -> List[str]:
+        values = self.values().items()
+        return [f"{self.name}_total{_label_text(self.labelnames, key)} {_format_value(value)}"
+                for key, value in values]
+
+
+class CallbackGauge(_Metric):
+    """Gauge read at scrape time, so the hot path records nothing.
+
+    ``read`` returns a number, or a mapping of label tuples to numbers for
+    labelled gauges.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, read: Callable[[], Union[float, Dict[Labels, float]]],
+                 labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self.read = read
+
+    def samples(self) -> List[str]:
+        value = self.read()
+        values = value.items() if isinstance(value, dict) else [((), value)]
+        return [f"{self.name}{_label_text(self.labelnames, key)} {_format_value(v)}"
+                for key, v in values if v is not None]
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram with sum and count"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Iterable[float] = JOB_SECONDS_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (+Inf last)], sum
+        self._series: Dict[Labels, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *labels: str):
+        key = self._labels(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            series = [(key, list(counts), total[0]) for key, (counts, total) in self._series.items()]
+        lines = []
+        for key, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                labels = _label_text(self.labelnames + ("le",), key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _label_text(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Iterable[float] = JOB_SECONDS_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(self, name: str, documentation: str, read: Callable[[], Union[float, Dict[Labels, float]]],
+              labelnames: Sequence[str] = ()) -> CallbackGauge:
+        return self.register(CallbackGauge(name, documentation, read, labelnames))
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+def hit_ratio(hits: float, misses: float) -> Optional[float]:
+    """Hits over lookups, or None before the first lookup"""
+    lookups = hits + misses
+    return hits / lookups if lookups else None
+
+
+registry = MetricsRegistry()
+
+jobs_started = registry.counter(
+    "career_jobs_started", "Jobs accepted by /start_job", ("service",))
+jobs_finished = registry.counter(
+    "career_jobs_finished", "Jobs that reached a terminal status", ("service", "status"))
+admission_rejections = registry.counter(
+    "career_admission_rejections", "Jobs turned away by admission control", ("status",))
+job_queue_wait = registry.histogram(
+    "career_job_queue_wait_seconds", "Time jobs spent queued before a worker picked them up", ("service",))
+crew_runtime = registry.histogram(
+    "career_crew_runtime_seconds", "Wall time of crew executions that completed", ("service", "mode"))
+tool_latency = registry.histogram(
+    "career_tool_call_seconds", "Latency of tool executions (cache misses)", ("tool",), TOOL_SECONDS_BUCKETS)
+tool_cache_lookups = registry.counter(
+    "career_tool_cache_lookups", "Tool calls by cache outcome (hits, shared_hits, misses)", ("tool", "outcome"))
+llm_tokens = registry.counter(
+    "career_llm_tokens", "LLM tokens used by crew runs", ("service", "kind"))
+
+
+def record_crew_run(service_type: str, mode: Optional[str], seconds: float, result: Dict):
+    """Runtime, token usage and tool cache outcomes of one finished crew execution"""
+    crew_runtime.observe(seconds, service_type, mode or "crew")
+    run_metrics = result.get("metrics") or {}
+    for service, usage in (run_metrics.get("token_usage") or {}).items():
+        if service == "total":
+            continue
+        for kind in ("prompt", "completion"):
+            tokens = usage.get(f"{kind}_tokens", 0)
+            if tokens:
+                llm_tokens.inc(service, kind, amount=tokens)
+    for tool, counts in (run_metrics.get("tool_calls") or {}).items():
+        for outcome, count in counts.items():
+            if count:
+                tool_cache_lookups.inc(tool, outcome, amount=count)
+
+
+def tool_cache_hit_ratio() -> Optional[float]:
+    hits = misses = 0
+    for (_, outcome), count in tool_cache_lookups.values().items():
+        if outcome == "misses":
+            misses += count
+        else:
+            hits += count
+    return hit_ratio(hits, misses)
@@ -0,0 +1,125 @@
+"""
+Cardano Career Navigator - Model Routing
+Per-service LLM selection and execution budgets
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Defaults per crew service; cheaper services get smaller budgets
+DEFAULT_ROUTES = {
+    "assessment": {"max_tokens": 1000, "max_iter": 5, "max_seconds": 180},
+    "roadmap": {"max_tokens": 3000, "max_iter": 10, "max_seconds": 300},
+    "catalyst": {"max_tokens": 3000, "max_iter": 15, "max_seconds": 600}
+}
+
+
+class ServiceRoute:
+    """Model and hard limits used by the agent that serves one service.
+
+    ``max_tokens`` caps every LLM completion and ``max_iter`` caps the
+    number of LLM round-trips, so a job's completion tokens are bounded by
+    their product; ``max_seconds`` is the agent's wall-clock limit.
+    """
+
+    def __init__(self, service_type: str, model: str, max_tokens: int, max_iter: int, max_seconds: float):
+        self.service_type = service_type
+        self.model = model
+        self.max_tokens = max_tokens
+        self.max_iter = max_iter
+        self.max_seconds = max_seconds
+
+    def build_llm(self, stream: bool = False):
+        from crewai import LLM
+        return LLM(model=self.model, max_tokens=self.max_tokens, stream=stream)
+
+    def agent_limits(self) -> Dict[str, Any]:
+        """Keyword arguments applying this route's limits to a crewai Agent"""
+        return {"max_iter": self.max_iter, "max_execution_time": int(self.max_seconds)}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "max_iter": self.max_iter,
+            "max_seconds": self.max_seconds
+        }
+
+
+class LLMPool:
+    """Idle LLM instances for one route, each leased to one run at a time.
+
+    crewai LLMs count token usage per instance, and agent copies share
+    their template's instance (and its counter). A run that holds an
+    instance exclusively reports its own usage as the difference between
+    two snapshots, without building a new client per run.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        self.factory = factory
+        self._idle: List[Any] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def lease(self) -> Iterator[Any]:
+        with self._lock:
+            llm = self._idle.pop() if self._idle else None
+        if llm is None:
+            llm = self.factory()
+        try:
+            yield llm
+        finally:
+            with self._lock:
+                self._idle.append(llm)
+
+
+def llm_usage(llm: Any) -> Dict[str, int]:
+    """Lifetime token usage of an LLM instance"""
+    summary = getattr(llm, "get_token_usage_summary", None)
+    return usage_to_dict(summary()) if summary is not None else empty_usage()
+
+
+def usage_since(before: Dict[str, int], after: Dict[str, int]) -> Dict[str, int]:
+    return {field: max(after.get(field, 0) - before.get(field, 0), 0) for field in empty_usage()}
+
+
+def _env(name: str, service_type: str) -> Optional[str]:
+    return os.getenv(f"{name}_{service_type.upper()}")
+
+
+def create_service_routes() -> Dict[str, ServiceRoute]:
+    """Routes from CREW_MODEL_<SERVICE>, CREW_MAX_TOKENS_<SERVICE>, CREW_MAX_ITER_<SERVICE>
+    and CREW_MAX_SECONDS_<SERVICE>, falling back to OPENAI_MODEL_NAME and DEFAULT_ROUTES"""
+    default_model = os.getenv("OPENAI_MODEL_NAME", "gpt-4o-mini")
+    routes = {}
+    for service_type, defaults in DEFAULT_ROUTES.items():
+        routes[service_type] = ServiceRoute(
+            service_type,
+            model=_env("CREW_MODEL", service_type) or default_model,
+            max_tokens=int(_env("CREW_MAX_TOKENS", service_type) or defaults["max_tokens"]),
+            max_iter=int(_env("CREW_MAX_ITER", service_type) or defaults["max_iter"]),
+            max_seconds=float(_env("CREW_MAX_SECONDS", service_type) or defaults["max_seconds"])
+        )
+    return routes
+
+
+def usage_to_dict(usage: Any) -> Dict[str, int]:
+    """Token counts from a crewai UsageMetrics (or a plain dict)"""
+    if usage is None:
+        return empty_usage()
+    data = usage if isinstance(usage, dict) else usage.model_dump()
+    return {field: int(data.get(field) or 0) for field in empty_usage()}
+
+
+def empty_usage() -> Dict[str, int]:
+    return {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0, "successful_requests": 0}
+
+
+def sum_usage(usages) -> Dict[str, int]:
+    total = empty_usage()
+    for usage in usages:
+        for field in total:
+            total[field] += usage.get(field, 0)
+    return total
@@ -0,0 +1,207 @@
+"""
+Cardano Career Navigator - Rate Limiting
+Token buckets per purchaser and wallet, in memory or shared through SQLite
+"""
+
+import asyncio
+import math
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class BucketSpec:
+    """One bucket to draw from: ``capacity`` tokens refilled at ``rate`` per second"""
+
+    def __init__(self, key: str, capacity: float, rate: float):
+        self.key = key
+        self.capacity = capacity
+        self.rate = rate
+
+
+class RateLimitDecision:
+    def __init__(self, allowed: bool, limit: int, remaining: int, reset_after: float, retry_after: float,
+                 key: Optional[str] = None):
+        self.allowed = allowed
+        self.limit = limit
+        self.remaining = remaining
+        self.reset_after = reset_after
+        self.retry_after = retry_after
+        self.key = key
+
+    def headers(self) -> Dict[str, str]:
+        headers = {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(math.ceil(self.reset_after))
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(max(1, math.ceil(self.retry_after)))
+        return headers
+
+
+class RateLimiter:
+    """Atomically takes one token from every bucket, or from none of them"""
+
+    # Whether acquire can block on I/O (and so must stay off the event loop)
+    blocking = True
+
+    def acquire(self, buckets: List[BucketSpec], now: Optional[float] = None) -> RateLimitDecision:
+        raise NotImplementedError
+
+    @staticmethod
+    def _decide(buckets: List[BucketSpec], levels: List[float]) -> Tuple[RateLimitDecision, List[float]]:
+        """Decision for refilled token levels plus the levels to store back"""
+        allowed = all(level >= 1 for level in levels)
+        stored = [level - 1 for level in levels] if allowed else levels
+
+        # Report the bucket closest to running out
+        tightest = min(range(len(buckets)), key=lambda i: stored[i] / buckets[i].capacity)
+        spec, level = buckets[tightest], stored[tightest]
+        retry_after = max(
+            ((1 - lvl) / b.rate for b, lvl in zip(buckets, levels) if lvl < 1), default=0.0
+        )
+        decision = RateLimitDecision(
+            allowed=allowed,
+            limit=int(spec.capacity),
+            remaining=int(level),
+            reset_after=(spec.capacity - level) / spec.rate,
+            retry_after=retry_after,
+            key=spec.key
+        )
+        return decision, stored
+
+
+class InMemoryRateLimiter(RateLimiter):
+    """Process-local buckets; idle buckets are dropped once full again"""
+
+    blocking = False
+
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, buckets: List[BucketSpec], now: Optional[float] = None) -> RateLimitDecision:
+        now = time.time() if now is None else now
+        with self._lock:
+            levels = []
+            for spec in buckets:
+                tokens, updated = self._buckets.get(spec.key, (spec.capacity, now))
+                levels.append(min(spec.capacity, tokens + (now - updated) * spec.rate))
+            decision, stored = self._decide(buckets, levels)
+            for spec, level in zip(buckets, stored):
+                self._buckets[spec.key] = (level, now)
+            if len(self._buckets) > self.max_keys:
+                self._prune_locked(buckets, now)
+        return decision
+
+    def _prune_locked(self, buckets: List[BucketSpec], now: float):
+        # A bucket refills fully within capacity / rate seconds; use the slowest spec as a bound
+        horizon = max(spec.capacity / spec.rate for spec in buckets)
+        self._buckets = {key: value for key, value in self._buckets.items() if now - value[1] < horizon}
+
+
+class SQLiteRateLimiter(RateLimiter):
+    """Buckets in SQLite so several worker processes enforce one limit"""
+
+    # Sweep buckets untouched for IDLE_SECONDS (long since full again) at most this often
+    EVICTION_INTERVAL = 300
+    IDLE_SECONDS = 86400
+
+    def __init__(self, path: str = "jobs.db"):
+        self.path = path
+        self._local = threading.local()
+        self._last_eviction = 0.0
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS rate_buckets (
+                key TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def acquire(self, buckets: List[BucketSpec], now: Optional[float] = None) -> RateLimitDecision:
+        now = time.time() if now is None else now
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            levels = []
+            for spec in buckets:
+                row = conn.execute(
+                    "SELECT tokens, updated_at FROM rate_buckets WHERE key = ?", (spec.key,)
+                ).fetchone()
+                tokens, updated = row if row else (spec.capacity, now)
+                levels.append(min(spec.capacity, tokens + (now - updated) * spec.rate))
+            decision, stored = self._decide(buckets, levels)
+            conn.executemany(
+                "INSERT OR REPLACE INTO rate_buckets (key, tokens, updated_at) VALUES (?, ?, ?)",
+                [(spec.key, level, now) for spec, level in zip(buckets, stored)]
+            )
+            if now - self._last_eviction >= self.EVICTION_INTERVAL:
+                self._last_eviction = now
+                conn.execute("DELETE FROM rate_buckets WHERE updated_at < ?", (now - self.IDLE_SECONDS,))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return decision
+
+
+class RateLimitPolicy:
+    """Per-purchaser and per-wallet limits on job creation"""
+
+    def __init__(self, limiter: RateLimiter, purchaser_burst: float = 20, purchaser_per_minute: float = 10,
+                 wallet_burst: float = 10, wallet_per_minute: float = 5):
+        self.limiter = limiter
+        self.purchaser = (purchaser_burst, purchaser_per_minute / 60)
+        self.wallet = (wallet_burst, wallet_per_minute / 60)
+
+    def check(self, purchaser: str, wallet: str) -> Optional[RateLimitDecision]:
+        """Take a token for this job; None when both limits are disabled"""
+        buckets = []
+        for prefix, identity, (burst, rate) in (("purchaser", purchaser, self.purchaser),
+                                                ("wallet", wallet, self.wallet)):
+            if burst > 0 and rate > 0 and identity:
+                buckets.append(BucketSpec(f"{prefix}:{identity}", burst, rate))
+        if not buckets:
+            return None
+        return self.limiter.acquire(buckets)
+
+    async def check_async(self, purchaser: str, wallet: str) -> Optional[RateLimitDecision]:
+        """check() for async handlers; a blocking limiter runs on a worker thread"""
+        if not self.limiter.blocking:
+            return self.check(purchaser, wallet)
+        return await asyncio.to_thread(self.check, purchaser, wallet)
+
+
+def create_rate_limit_policy() -> RateLimitPolicy:
+    """Limits from RATE_LIMIT_* settings; the backend follows JOB_STORE_BACKEND unless overridden"""
+    backend = os.getenv("RATE_LIMIT_BACKEND") or os.getenv("JOB_STORE_BACKEND", "memory")
+    if backend == "sqlite":
+        limiter = SQLiteRateLimiter(os.getenv("JOB_STORE_PATH", "jobs.db"))
+    elif backend == "memory":
+        limiter = InMemoryRateLimiter()
+    else:
+        raise ValueError(f"Unknown rate limit backend: {backend}")
+
+    return RateLimitPolicy(
+        limiter,
+        purchaser_burst=float(os.getenv("RATE_LIMIT_PURCHASER_BURST", 20)),
+        purchaser_per_minute=float(os.getenv("RATE_LIMIT_PURCHASER_PER_MINUTE", 10)),
+        wallet_burst=float(os.getenv("RATE_LIMIT_WALLET_BURST", 10)),
+        wallet_per_minute=float(os.getenv("RATE_LIMIT_WALLET_PER_MINUTE", 5))
+    )
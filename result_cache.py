@@ -0,0 +1,258 @@
+"""
+Cardano Career Navigator - Result Cache
+LRU cache of finished service results keyed on (service type, wallet, timeline)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+# Seconds a result stays valid, per service type
+DEFAULT_TTLS = {
+    "assessment": 3600,
+    "roadmap": 6 * 3600,
+    "catalyst": 3600,
+    "full_package": 3600
+}
+
+
+class ResultCache:
+    """In-memory LRU cache with per-service TTLs and an optional disk tier.
+
+    Values are stored as serialized JSON so the memory cap is measured in
+    bytes and every hit hands out an independent copy of the result. The
+    disk tier is capped by total bytes and file count; a sweep every
+    ``disk_sweep_interval`` seconds drops expired files, then the least
+    recently used ones (hits refresh a file's mtime). Async handlers use
+    ``get_async``/``put_async`` so disk I/O stays off the event loop.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_bytes: int = 64 * 1024 * 1024,
+                 disk_dir: Optional[str] = None, disk_max_bytes: int = 512 * 1024 * 1024,
+                 disk_max_entries: int = 10000, disk_sweep_interval: float = 60):
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self.disk_max_entries = disk_max_entries
+        self.disk_sweep_interval = disk_sweep_interval
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: "OrderedDict[Tuple, Tuple[float, str, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._last_sweep = 0.0
+
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(service_type: str, user_address: str, timeline: Optional[str] = None,
+                 mode: Optional[str] = None) -> Tuple:
+        return (service_type, user_address, timeline or "", mode or "")
+
+    def get(self, service_type: str, user_address: str, timeline: Optional[str] = None,
+            mode: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Return a cached result, promoting disk hits into memory"""
+        key = self.make_key(service_type, user_address, timeline, mode)
+        now = time.time()
+        payload = self._get_memory(key, now)
+        if payload is None and self.disk_dir:
+            payload = self._promote(key, self._read_disk(key, now))
+        return self._finish_get(payload)
+
+    async def get_async(self, service_type: str, user_address: str, timeline: Optional[str] = None,
+                        mode: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """get() for the event loop: the disk tier is read on a worker thread"""
+        key = self.make_key(service_type, user_address, timeline, mode)
+        now = time.time()
+        payload = self._get_memory(key, now)
+        if payload is None and self.disk_dir:
+            payload = self._promote(key, await asyncio.to_thread(self._read_disk, key, now))
+        return self._finish_get(payload)
+
+    def put(self, service_type: str, user_address: str, timeline: Optional[str], result: Dict[str, Any],
+            mode: Optional[str] = None):
+        """Cache a result for its service's TTL; a TTL of 0 disables caching"""
+        entry = self._put_memory(service_type, user_address, timeline, result, mode)
+        if entry is not None and self.disk_dir:
+            self._write_disk(*entry)
+
+    async def put_async(self, service_type: str, user_address: str, timeline: Optional[str],
+                        result: Dict[str, Any], mode: Optional[str] = None):
+        """put() for the event loop: the disk tier is written on a worker thread"""
+        entry = self._put_memory(service_type, user_address, timeline, result, mode)
+        if entry is not None and self.disk_dir:
+            await asyncio.to_thread(self._write_disk, *entry)
+
+    def _get_memory(self, key: Tuple, now: float) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, payload, _ = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    return payload
+                self._remove_locked(key)
+        return None
+
+    def _promote(self, key: Tuple, entry: Optional[Tuple[float, str]]) -> Optional[str]:
+        if entry is None:
+            return None
+        with self._lock:
+            self._store_locked(key, *entry)
+        return entry[1]
+
+    def _finish_get(self, payload: Optional[str]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(payload)
+
+    def _put_memory(self, service_type: str, user_address: str, timeline: Optional[str], result: Dict[str, Any],
+                    mode: Optional[str]) -> Optional[Tuple[Tuple, float, str]]:
+        ttl = self.ttls.get(service_type, 0)
+        if ttl <= 0:
+            return None
+
+        key = self.make_key(service_type, user_address, timeline, mode)
+        expires_at = time.time() + ttl
+        payload = json.dumps(result)
+
+        with self._lock:
+            self._store_locked(key, expires_at, payload)
+        return key, expires_at, payload
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0
+        }
+
+    def _store_locked(self, key: Tuple, expires_at: float, payload: str):
+        size = len(payload.encode())
+        if size > self.max_bytes:
+            return
+        self._remove_locked(key)
+        self._entries[key] = (expires_at, payload, size)
+        self._bytes += size
+
+        # Evict least recently used entries until under the memory cap
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove_locked(oldest)
+
+    def _remove_locked(self, key: Tuple):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def _disk_path(self, key: Tuple) -> str:
+        digest = hashlib.sha256("|".join(key).encode()).hexdigest()
+        return os.path.join(self.disk_dir, f"{digest}.json")
+
+    def _read_disk(self, key: Tuple, now: float) -> Optional[Tuple[float, str]]:
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry["expires_at"] <= now:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        try:
+            # The sweep evicts least recently used files first
+            os.utime(path)
+        except OSError:
+            pass
+        return entry["expires_at"], entry["payload"]
+
+    def _write_disk(self, key: Tuple, expires_at: float, payload: str):
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"expires_at": expires_at, "payload": payload}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Could not write result cache entry: {e}")
+        if time.time() - self._last_sweep >= self.disk_sweep_interval:
+            self.sweep_disk()
+
+    def sweep_disk(self) -> int:
+        """Drop expired disk entries, then the least recently used until under the caps; returns files removed"""
+        if not self.disk_dir:
+            return 0
+        with self._disk_lock:
+            now = time.time()
+            self._last_sweep = now
+            files: List[Tuple[float, int, str]] = []
+            try:
+                names = os.listdir(self.disk_dir)
+            except OSError:
+                return 0
+            for name in names:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(self.disk_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+            # A file untouched for longer than the longest TTL has certainly expired
+            max_ttl = max(self.ttls.values(), default=0)
+            files.sort()
+            total = sum(size for _, size, _ in files)
+            removed = 0
+            for mtime, size, path in files:
+                over_cap = total > self.disk_max_bytes or len(files) - removed > self.disk_max_entries
+                if not over_cap and mtime + max_ttl > now:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            return removed
+
+
+def create_result_cache() -> ResultCache:
+    """Build the result cache from environment configuration"""
+    ttls = {}
+    for service_type in DEFAULT_TTLS:
+        value = os.getenv(f"RESULT_CACHE_TTL_{service_type.upper()}")
+        if value is not None:
+            ttls[service_type] = float(value)
+
+    return ResultCache(
+        ttls=ttls,
+        max_bytes=int(os.getenv("RESULT_CACHE_MAX_BYTES", 64 * 1024 * 1024)),
+        disk_dir=os.getenv("RESULT_CACHE_DIR") or None,
+        disk_max_bytes=int(os.getenv("RESULT_CACHE_DISK_MAX_BYTES", 512 * 1024 * 1024)),
+        disk_max_entries=int(os.getenv("RESULT_CACHE_DISK_MAX_ENTRIES", 10000))
+    )
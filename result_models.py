@@ -0,0 +1,141 @@
+"""
+Cardano Career Navigator - Result Models
+Typed results for each service and parsing of crew output into them
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Type
+
+from pydantic import BaseModel, Field, ValidationError
+
+
+class WalletProfile(BaseModel):
+    experience_level: str = "beginner"
+    technical_skills: List[str] = Field(default_factory=list)
+    interests: List[str] = Field(default_factory=list)
+    learning_style: Optional[str] = None
+    preferred_path: Optional[str] = None
+    transaction_count: int = 0
+    analysis_timestamp: Optional[float] = None
+
+
+class Insight(BaseModel):
+    type: str
+    message: str
+    recommendation: Optional[str] = None
+
+
+class NextStep(BaseModel):
+    priority: str = "medium"
+    action: str
+    description: Optional[str] = None
+    resource: Optional[str] = None
+    service: Optional[str] = None
+    price: Optional[float] = None
+    estimated_time: Optional[str] = None
+
+
+class BeginWalletTip(BaseModel):
+    category: str
+    title: str
+    description: Optional[str] = None
+    action: Optional[str] = None
+    benefit: Optional[str] = None
+
+
+class Narrative(BaseModel):
+    text: str
+    source: str = "llm"
+
+
+class Milestone(BaseModel):
+    title: str
+    description: Optional[str] = None
+    deadline: Optional[str] = Field(None, description="When the milestone should be reached, e.g. 'Month 2'")
+    skills: List[str] = Field(default_factory=list)
+    resources: List[str] = Field(default_factory=list)
+    verification: Optional[str] = Field(None, description="How completion is proven, e.g. an achievement NFT")
+
+
+class Opportunity(BaseModel):
+    title: str
+    round: Optional[str] = None
+    budget: Optional[str] = None
+    deadline: Optional[str] = None
+    match_reason: Optional[str] = None
+
+
+class AssessmentResult(BaseModel):
+    profile: Optional[WalletProfile] = None
+    insights: List[Insight] = Field(default_factory=list)
+    next_steps: List[NextStep] = Field(default_factory=list)
+    begin_wallet_integration: List[BeginWalletTip] = Field(default_factory=list)
+    recommendations: Dict[str, Any] = Field(default_factory=dict)
+    narrative: Optional[Narrative] = None
+    summary: str = ""
+
+
+class RoadmapResult(BaseModel):
+    timeline: Optional[str] = None
+    preferred_path: Optional[str] = None
+    milestones: List[Milestone] = Field(default_factory=list)
+    learning_resources: List[str] = Field(default_factory=list)
+    opportunities: List[Opportunity] = Field(default_factory=list)
+    begin_wallet_integration: List[BeginWalletTip] = Field(default_factory=list)
+    summary: str = ""
+
+
+class CatalystResult(BaseModel):
+    readiness: Optional[str] = Field(None, description="Readiness for Catalyst participation and why")
+    opportunities: List[Opportunity] = Field(default_factory=list)
+    proposal_structure: List[str] = Field(default_factory=list)
+    budget_guidance: Optional[str] = None
+    engagement_strategies: List[str] = Field(default_factory=list)
+    submission_timeline: List[Milestone] = Field(default_factory=list)
+    begin_wallet_integration: List[BeginWalletTip] = Field(default_factory=list)
+    summary: str = ""
+
+
+class FullPackageResult(BaseModel):
+    assessment: AssessmentResult
+    roadmap: RoadmapResult
+    catalyst: CatalystResult
+    profile: Optional[Dict[str, Any]] = None
+
+
+RESULT_MODELS: Dict[str, Type[BaseModel]] = {
+    "assessment": AssessmentResult,
+    "roadmap": RoadmapResult,
+    "catalyst": CatalystResult
+}
+
+
+def _json_object(text: str) -> Optional[Dict[str, Any]]:
+    """First JSON object embedded in text (LLMs often wrap it in prose or fences)"""
+    start = text.find("{")
+    end = text.rfind("}")
+    if start < 0 or end <= start:
+        return None
+    try:
+        value = json.loads(text[start:end + 1])
+    except ValueError:
+        return None
+    return value if isinstance(value, dict) else None
+
+
+def parse_crew_output(output: Any, model: Type[BaseModel]) -> Dict[str, Any]:
+    """Coerce a CrewOutput (or plain text) into model; unparseable prose lands in summary"""
+    parsed = getattr(output, "pydantic", None)
+    if isinstance(parsed, model):
+        return parsed.model_dump()
+
+    data = getattr(output, "json_dict", None)
+    raw = str(getattr(output, "raw", output))
+    if data is None:
+        data = _json_object(raw)
+    if data is not None:
+        try:
+            return model.model_validate(data).model_dump()
+        except ValidationError:
+            pass
+    return model(summary=raw).model_dump()
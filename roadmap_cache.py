@@ -0,0 +1,142 @@
+"""
+Cardano Career Navigator - Roadmap Skeleton Cache
+Milestone skeletons shared by wallets of the same archetype, personalised per request
+"""
+
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fast_assessment import NarrativeWriter, begin_wallet_tips
+
+# Roadmap fields that depend only on the archetype; everything else is filled per wallet
+SKELETON_FIELDS = ("timeline", "preferred_path", "milestones", "learning_resources")
+
+PERSONALISE_PROMPT = """Write a short introduction (at most {words} words, plain text) to a {timeline}
+Cardano career roadmap for this user. Mention their level, their strongest skills and the first milestones.
+Profile: experience={experience_level}; skills={skills}; interests={interests}; path={preferred_path};
+transactions={transaction_count}. Milestones: {milestones}. Matching Catalyst opportunities: {opportunities}."""
+
+Archetype = Tuple[str, str, str]
+
+
+def normalize_timeline(timeline: Optional[str]) -> str:
+    """'6_months', '6 Months' and '6-month' all become '6-months'"""
+    value = re.sub(r"[\s_]+", "-", (timeline or "6-months").strip().lower())
+    return value + "s" if value.endswith("-month") else value
+
+
+def archetype_key(profile: Dict[str, Any], timeline: Optional[str]) -> Archetype:
+    return (
+        str(profile.get("experience_level") or "beginner").lower(),
+        str(profile.get("preferred_path") or "general").lower(),
+        normalize_timeline(timeline)
+    )
+
+
+def make_skeleton(roadmap: Dict[str, Any]) -> Dict[str, Any]:
+    return {field: roadmap.get(field) for field in SKELETON_FIELDS}
+
+
+def template_roadmap_intro(profile: Dict[str, Any], timeline: str, milestones: str, opportunities: str) -> str:
+    """Roadmap introduction used when the LLM is disabled or unavailable"""
+    skills = ", ".join(profile["technical_skills"][:3]) or "wallet basics"
+    text = (
+        f"A {timeline} {profile['preferred_path']} roadmap for a {profile['experience_level']}-level "
+        f"Cardano user with skills in {skills}. It starts with: {milestones}."
+    )
+    if opportunities:
+        text += f" Catalyst opportunities that match you now: {opportunities}."
+    return text
+
+
+def personalise_roadmap(skeleton: Dict[str, Any], profile: Dict[str, Any], opportunities: List[Dict[str, Any]],
+                        summary: str) -> Dict[str, Any]:
+    """Fill a cached skeleton with this wallet's opportunities, Begin Wallet tips and summary"""
+    return dict(
+        skeleton,
+        opportunities=[
+            {
+                "title": opportunity.get("category") or opportunity.get("title") or opportunity.get("id", ""),
+                "round": opportunity.get("round"),
+                "budget": opportunity.get("budget"),
+                "deadline": opportunity.get("deadline"),
+                "match_reason": opportunity.get("match_reason")
+            }
+            for opportunity in opportunities
+        ],
+        begin_wallet_integration=begin_wallet_tips(profile),
+        summary=summary
+    )
+
+
+class RoadmapSkeletonCache:
+    """LRU of roadmap skeletons per archetype, valid for one Catalyst snapshot version.
+
+    An entry built against an older snapshot is dropped on lookup, so a
+    snapshot refresh invalidates every skeleton without a callback.
+    """
+
+    def __init__(self, ttl_seconds: float = 86400, max_entries: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+        self._entries: "OrderedDict[Archetype, Tuple[float, str, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Archetype, catalyst_version: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, version, skeleton = entry
+                if expires_at > now and version == catalyst_version:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return skeleton
+                del self._entries[key]
+                self.invalidations += 1
+            self.misses += 1
+            return None
+
+    def put(self, key: Archetype, catalyst_version: str, skeleton: Dict[str, Any]):
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl_seconds, catalyst_version, skeleton)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses,
+                    "invalidations": self.invalidations}
+
+
+def create_roadmap_skeleton_cache() -> Optional[RoadmapSkeletonCache]:
+    """Build the cache from the environment, or None when ROADMAP_SKELETON_TTL is 0"""
+    ttl = float(os.getenv("ROADMAP_SKELETON_TTL", 86400))
+    if ttl <= 0:
+        return None
+    return RoadmapSkeletonCache(ttl, max_entries=int(os.getenv("ROADMAP_SKELETON_MAX_ENTRIES", 256)))
+
+
+def create_roadmap_personaliser(default_model: Optional[str] = None,
+                                llm_factory: Optional[Callable[[], Any]] = None) -> NarrativeWriter:
+    """One capped LLM call that introduces a cached roadmap to a specific wallet"""
+    return NarrativeWriter(
+        model=os.getenv("ROADMAP_PERSONALISE_MODEL") or default_model or os.getenv("OPENAI_MODEL_NAME", "gpt-4o-mini"),
+        max_tokens=int(os.getenv("ROADMAP_PERSONALISE_MAX_TOKENS", 200)),
+        enabled=os.getenv("ROADMAP_PERSONALISE_LLM", "true").lower() == "true",
+        llm_factory=llm_factory,
+        prompt=PERSONALISE_PROMPT,
+        fallback=template_roadmap_intro
+    )
+
+
+roadmap_skeleton_cache = create_roadmap_skeleton_cache()
@@ -0,0 +1,119 @@
+"""
+Cardano Career Navigator - Admission Control Tests
+Rejections, Retry-After sizing and runtime estimates
+"""
+
+import asyncio
+import os
+
+os.environ.setdefault("WARMUP_ON_START", "false")
+
+import httpx
+
+import main
+from admission import AdmissionController, RuntimeTracker, format_duration
+
+
+class FakeExecutor:
+    """Executor whose stats() reports a fixed load"""
+
+    def __init__(self, workers=2, max_queue_size=4, busy_workers=0, queue_depth=0):
+        self.load = {"workers": workers, "max_queue_size": max_queue_size,
+                     "busy_workers": busy_workers, "queue_depth": queue_depth}
+
+    def stats(self):
+        return dict(self.load)
+
+
+def controller(executor, **limits):
+    return AdmissionController(executor, RuntimeTracker(defaults={"assessment": 100}), **limits)
+
+
+def test_idle_agent_admits_jobs():
+    admission = controller(FakeExecutor())
+
+    assert admission.check() is None
+    assert admission.estimated_wait() == 0
+    assert admission.rejected == 0
+
+
+def test_full_backlog_is_a_503():
+    executor = FakeExecutor(busy_workers=2, queue_depth=4)
+    admission = controller(executor)
+
+    rejection = admission.check()
+    assert rejection.status_code == 503
+    assert "4 jobs waiting" in rejection.reason
+    # Five jobs ahead (four queued plus this one) over two workers, 100s each
+    assert rejection.retry_after == 250
+    assert admission.rejected == 1
+
+
+def test_in_flight_limit_is_a_429():
+    executor = FakeExecutor(busy_workers=2, queue_depth=1)
+    admission = controller(executor, max_in_flight=3)
+
+    rejection = admission.check()
+    assert rejection.status_code == 429
+    assert rejection.retry_after == 100
+
+    executor.load["queue_depth"] = 0
+    assert admission.check() is None
+    assert admission.rejected == 1
+
+
+def test_limits_are_capped_by_the_executor():
+    admission = controller(FakeExecutor(workers=2, max_queue_size=4), max_queue_depth=10)
+
+    assert admission.max_queue_depth == 4
+    assert admission.max_in_flight == 6
+
+
+def test_check_load_does_not_count_rejections():
+    admission = controller(FakeExecutor())
+    load = dict(admission.load(), queue_depth=4)
+
+    assert admission.check_load(load).status_code == 503
+    assert admission.rejected == 0
+
+
+def test_retry_after_is_at_least_one_second():
+    admission = AdmissionController(FakeExecutor(busy_workers=2, queue_depth=4), RuntimeTracker(defaults={}))
+    assert admission.check().retry_after == 1
+
+
+def test_runtime_tracker_replaces_the_seed_then_averages():
+    runtimes = RuntimeTracker(alpha=0.5, defaults={"roadmap": 240})
+
+    runtimes.record("roadmap", 100)
+    assert runtimes.estimate("roadmap") == 100
+    runtimes.record("roadmap", 200)
+    assert runtimes.estimate("roadmap") == 150
+    assert runtimes.samples("roadmap") == 2
+    assert RuntimeTracker.key("assessment", "fast") == "assessment:fast"
+    assert RuntimeTracker.key("assessment", "crew") == "assessment"
+
+
+def test_format_duration():
+    assert format_duration(0.2) == "1 second"
+    assert format_duration(42) == "42 seconds"
+    assert format_duration(450) == "7.5 minutes"
+
+
+def test_start_job_sends_retry_after_when_saturated(monkeypatch):
+    monkeypatch.setattr(main.admission, "executor", FakeExecutor(busy_workers=2, queue_depth=4))
+    monkeypatch.setattr(main.admission, "max_queue_depth", 4)
+
+    async def scenario():
+        async with main.lifespan(main.app):
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.post("/start_job", json={
+                    "identifier_from_purchaser": "admission-test",
+                    "input_data": {"type": "catalyst", "user_address": "addr_test1admission"}
+                })
+
+    response = asyncio.run(scenario())
+    assert response.status_code == 503
+    assert int(response.headers["Retry-After"]) >= 1
+    assert "backlog is full" in response.json()["detail"]
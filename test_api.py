@@ -59,9 +59,9 @@ def test_api_endpoints():
             if job_id:
                 # Test 5: Check job status
                 print(f"\n5. Testing job status for {job_id}...")
-                time.sleep(1)  # Give it a moment
                 
-                status_response = requests.get(f"{base_url}/status?job_id={job_id}")
+                # Long-poll instead of sleeping and polling
+                status_response = requests.get(f"{base_url}/status?job_id={job_id}&wait=30", timeout=40)
                 print(f"Status: {status_response.status_code}")
                 print(f"Job Status: {json.dumps(status_response.json(), indent=2)}")
         else:
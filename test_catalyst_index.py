@@ -0,0 +1,80 @@
+"""
+Cardano Career Navigator - Catalyst Index Tests
+Opportunity ranking and query filters over a small snapshot
+"""
+
+from datetime import datetime, timezone
+
+from catalyst_index import OpportunityIndex
+
+SNAPSHOT = {
+    "version": "test-1",
+    "rounds": [{
+        "id": "f12",
+        "name": "Fund 12",
+        "timeline": {"proposalSubmission": "2026-03-01T00:00:00Z"},
+        "requirements": {"minExperience": "intermediate"},
+        "categories": [
+            {"id": "dapps", "name": "DApps", "requiredSkills": ["Plutus", "Haskell"],
+             "maxProposalBudget": 4000, "minProposalBudget": 1000},
+            {"id": "edu", "name": "Education", "requiredSkills": ["Teaching"], "budget": 500}
+        ]
+    }],
+    "bounties": [
+        {"id": "b1", "title": "Aiken library", "requiredSkills": ["aiken"], "tags": ["plutus-v3"],
+         "reward": 2000, "deadline": "2026-01-10T00:00:00Z", "difficulty": "beginner"},
+        {"id": "b2", "title": "Closed bounty", "status": "closed", "requiredSkills": ["plutus"], "reward": 9000}
+    ]
+}
+
+
+def at(day: str) -> float:
+    return datetime.fromisoformat(day).replace(tzinfo=timezone.utc).timestamp()
+
+
+NEW_YEAR = at("2026-01-01")
+
+
+def test_exact_tags_outrank_partial_ones():
+    results = OpportunityIndex(SNAPSHOT).match(["plutus"], now=NEW_YEAR)
+
+    # Exact tag 10 + budget bonus 4; substring tag 5 + bonus 2 - 2 for a deadline within 30 days
+    assert [(r["id"], r["score"]) for r in results] == [("f12:dapps", 14.0), ("bounty:b1", 5.0)]
+    assert results[0]["match_reason"] == "plutus skills"
+    assert results[0]["budget"] == "4000 ADA" and results[0]["days_until_deadline"] == 59
+
+
+def test_opportunities_above_the_users_level_are_penalised():
+    results = OpportunityIndex(SNAPSHOT).match(["plutus"], experience_level="Beginner", now=NEW_YEAR)
+
+    assert [(r["id"], r["score"]) for r in results] == [("f12:dapps", 11.0), ("bounty:b1", 5.0)]
+
+
+def test_open_opportunities_come_before_closed_ones():
+    results = OpportunityIndex(SNAPSHOT).match(["aiken", "plutus"], now=at("2026-02-01"))
+
+    assert [(r["id"], r["is_open"]) for r in results] == [("f12:dapps", True), ("bounty:b1", False)]
+    assert results[1]["score"] > results[0]["score"]
+    assert results[1]["match_reason"] == "aiken, plutus skills"
+
+
+def test_budget_and_deadline_filters():
+    index = OpportunityIndex(SNAPSHOT)
+
+    def ids(**filters):
+        return [r["id"] for r in index.match(["plutus", "teaching"], now=NEW_YEAR, **filters)]
+
+    assert ids() == ["f12:dapps", "f12:edu", "bounty:b1"]
+    assert ids(min_budget=3000) == ["f12:dapps"]
+    # A category qualifies when its smallest allowed proposal fits the budget
+    assert ids(max_budget=1500) == ["f12:dapps", "f12:edu"]
+    assert ids(deadline_after=at("2026-02-01")) == ["f12:dapps", "f12:edu"]
+    assert ids(top_k=1) == ["f12:dapps"]
+
+
+def test_skills_are_normalised_and_unknown_ones_match_nothing():
+    index = OpportunityIndex(SNAPSHOT)
+
+    assert index.match(["  PLUTUS ", ""], now=NEW_YEAR) == index.match(["plutus"], now=NEW_YEAR)
+    assert index.match(["cobol"], now=NEW_YEAR) == []
+    assert index.version == "test-1"
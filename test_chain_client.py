@@ -0,0 +1,145 @@
+"""
+Cardano Career Navigator - Chain Data Client Tests
+BlockfrostClient against a local stub of the Blockfrost API
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from chain_client import PAGE_SIZE, BlockfrostClient, ChainDataError
+
+ADDRESS = "addr_test1stub"
+
+# 250 transactions, oldest first, spread over blocks of 10
+TRANSACTIONS = [
+    {"tx_hash": f"tx{i:03d}", "tx_index": i % 10, "block_height": 1000 + i // 10, "block_time": 1700000000 + i}
+    for i in range(250)
+]
+
+
+class StubBlockfrost(BaseHTTPRequestHandler):
+    """Serves /addresses/<addr>/transactions (paged, ordered, "from") and /txs/<hash>[/metadata]"""
+
+    requests = []
+    failing = set()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        StubBlockfrost.requests.append((url.path, params, self.headers.get("project_id")))
+        parts = url.path.strip("/").split("/")
+
+        if parts[:1] == ["addresses"] and parts[2:] == ["transactions"]:
+            if parts[1] != ADDRESS:
+                return self._send(404, {"error": "Not Found"})
+            return self._send(200, self._transactions(params))
+
+        if parts[:1] == ["txs"]:
+            tx_hash = parts[1]
+            if tx_hash in StubBlockfrost.failing:
+                return self._send(400, {"error": "Bad Request"})
+            index = next((i for i, tx in enumerate(TRANSACTIONS) if tx["tx_hash"] == tx_hash), None)
+            if index is None:
+                return self._send(404, {"error": "Not Found"})
+            if parts[2:] == ["metadata"]:
+                return self._send(200, [{"label": "674", "json_metadata": {"msg": [tx_hash]}}])
+            return self._send(200, {
+                "hash": tx_hash,
+                "block_height": TRANSACTIONS[index]["block_height"],
+                "block_time": TRANSACTIONS[index]["block_time"],
+                "slot": index,
+                "output_amount": [{"unit": "lovelace", "quantity": "1000000"}],
+                "delegation_count": 1,
+                "stake_cert_count": 0
+            })
+
+        self._send(404, {"error": "Not Found"})
+
+    @staticmethod
+    def _transactions(params):
+        listing = TRANSACTIONS if params.get("order") == "asc" else TRANSACTIONS[::-1]
+        if "from" in params:
+            height, _, index = params["from"].partition(":")
+            start = (int(height), int(index or 0))
+            listing = [tx for tx in listing if (tx["block_height"], tx["tx_index"]) >= start]
+        page, count = int(params.get("page", 1)), int(params.get("count", 100))
+        return listing[(page - 1) * count:page * count]
+
+    def _send(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def client():
+    StubBlockfrost.requests = []
+    StubBlockfrost.failing = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubBlockfrost)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    chain = BlockfrostClient(f"http://127.0.0.1:{server.server_port}/", "stub-project", max_concurrency=4,
+                             max_retries=0)
+    yield chain
+    chain.close()
+    server.shutdown()
+    server.server_close()
+
+
+def test_paginates_until_a_short_page(client):
+    transactions = client.address_transactions(ADDRESS)
+
+    assert [tx["tx_hash"] for tx in transactions] == [tx["tx_hash"] for tx in TRANSACTIONS[::-1]]
+    pages = [params for path, params, _ in StubBlockfrost.requests if path.endswith("/transactions")]
+    assert [params["page"] for params in pages] == ["1", "2", "3"]
+    assert all(params["count"] == str(PAGE_SIZE) for params in pages)
+    assert all(project_id == "stub-project" for _, _, project_id in StubBlockfrost.requests)
+
+
+def test_max_items_stops_before_later_pages(client):
+    transactions = client.address_transactions(ADDRESS, max_items=PAGE_SIZE + 5, order="asc")
+
+    assert [tx["tx_hash"] for tx in transactions] == [tx["tx_hash"] for tx in TRANSACTIONS[:PAGE_SIZE + 5]]
+    assert len(StubBlockfrost.requests) == 2
+
+
+def test_from_block_starts_the_listing_there(client):
+    transactions = list(client.iter_address_transactions(ADDRESS, order="asc", from_block="1020:5"))
+
+    assert transactions[0]["tx_hash"] == "tx205"
+    assert len(transactions) == 45
+    assert StubBlockfrost.requests[0][1]["from"] == "1020:5"
+
+
+def test_missing_resources_are_none(client):
+    assert client.get("/txs/unknown") is None
+    assert client.address_transactions("addr_test1unknown") == []
+
+
+def test_errors_raise_chain_data_error(client):
+    StubBlockfrost.failing = {"tx001"}
+    with pytest.raises(ChainDataError, match="400"):
+        client.get("/txs/tx001")
+
+
+def test_transaction_details_report_failed_lookups_in_order(client):
+    StubBlockfrost.failing = {"tx003", "tx001"}
+    hashes = ["tx000", "tx001", "tx002", "tx003", "unknown"]
+
+    details, failed = client.fetch_transaction_details(hashes)
+
+    assert [detail["hash"] for detail in details] == ["tx000", "tx002"]
+    assert failed == ["tx001", "tx003"]
+    assert details[0]["metadata"] == {"674": {"msg": ["tx000"]}}
+    assert details[0]["certificate_count"] == 1
+    assert client.transaction_details(hashes) == details
@@ -0,0 +1,159 @@
+"""
+Cardano Career Navigator - Crew Runtime Tests
+The warmup state machine and /readyz, with a stand-in for crew_definition
+"""
+
+import asyncio
+import os
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+os.environ.setdefault("WARMUP_ON_START", "false")
+
+import httpx
+
+import crew_runtime
+import main
+from crew_runtime import CrewWarmup
+
+
+class FakeCrewModule:
+    """What warmup needs from crew_definition; the first ``failures`` builds raise"""
+
+    def __init__(self, failures=0, gate=None):
+        self.failures = failures
+        self.gate = gate
+        self.builds = 0
+        self.crew = object()
+
+    def get_career_navigator_crew(self):
+        self.builds += 1
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.builds <= self.failures:
+            raise RuntimeError(f"build {self.builds} failed")
+        return self.crew
+
+    def get_catalyst_index(self):
+        return None
+
+
+@pytest.fixture
+def crew_module(monkeypatch):
+    module = FakeCrewModule()
+    monkeypatch.setattr(crew_runtime, "importlib", SimpleNamespace(import_module=lambda name: module))
+    return module
+
+
+def join(warmup):
+    warmup._thread.join(5)
+    assert not warmup._thread.is_alive()
+
+
+def test_background_warmup_goes_from_cold_to_ready(crew_module):
+    crew_module.gate = threading.Event()
+    warmup = CrewWarmup()
+    assert (warmup.state, warmup.ready, warmup.serving) == ("cold", False, False)
+
+    warmup.start()
+    assert warmup.state == "warming" and not warmup.serving
+    crew_module.gate.set()
+    join(warmup)
+
+    assert (warmup.state, warmup.ready, warmup.serving) == ("ready", True, True)
+    assert warmup.ensure_ready() is crew_module.crew
+    assert {"crewai_import", "crew_build", "catalyst_index", "total"} <= set(warmup.report()["warmup_phases"])
+    warmup.start()
+    assert crew_module.builds == 1
+
+
+def test_failed_attempts_are_retried(crew_module):
+    crew_module.failures = 2
+    warmup = CrewWarmup(max_attempts=5, retry_seconds=0.01)
+    warmup.start()
+    join(warmup)
+
+    assert warmup.state == "ready" and warmup.error is None
+    assert warmup.attempts == 3
+
+
+def test_warmup_gives_up_after_max_attempts(crew_module):
+    crew_module.failures = 10
+    warmup = CrewWarmup(max_attempts=2, retry_seconds=0.01)
+    warmup.start()
+    join(warmup)
+
+    assert (warmup.state, warmup.attempts, warmup.ready) == ("failed", 2, False)
+    assert warmup.error == "RuntimeError: build 2 failed"
+    assert not warmup.serving
+
+
+def test_deferred_warmup_serves_at_once_and_loads_on_the_first_job(crew_module):
+    warmup = CrewWarmup()
+    warmup.defer()
+    assert (warmup.state, warmup.serving, warmup.ready) == ("deferred", True, False)
+    assert crew_module.builds == 0
+
+    assert warmup.ensure_ready() is crew_module.crew
+    assert warmup.state == "ready" and warmup.report()["deferred"] is True
+
+
+def test_deferred_warmup_that_fails_stops_serving(crew_module):
+    crew_module.failures = 1
+    warmup = CrewWarmup()
+    warmup.defer()
+
+    with pytest.raises(RuntimeError):
+        warmup.ensure_ready()
+    assert (warmup.state, warmup.serving) == ("failed", False)
+    # The next job tries again
+    assert warmup.ensure_ready() is crew_module.crew
+
+
+def test_defer_is_ignored_once_warmup_has_started(crew_module):
+    warmup = CrewWarmup()
+    warmup.start()
+    join(warmup)
+    warmup.defer()
+    assert warmup.state == "ready" and warmup.deferred is False
+
+
+def get_readyz(monkeypatch, warmup):
+    monkeypatch.setattr(main, "warmup", warmup)
+
+    async def scenario():
+        async with main.lifespan(main.app):
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.get("/readyz")
+
+    return asyncio.run(scenario())
+
+
+def test_readyz_is_ready_at_once_with_deferred_warmup(monkeypatch, crew_module):
+    response = get_readyz(monkeypatch, CrewWarmup())
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "deferred"}
+    assert crew_module.builds == 0
+
+
+def test_readyz_asks_to_retry_while_warming_but_not_after_failure(monkeypatch, crew_module):
+    crew_module.gate = threading.Event()
+    warming = CrewWarmup()
+    warming.start()
+    response = get_readyz(monkeypatch, warming)
+    assert response.status_code == 503 and response.headers["Retry-After"] == "5"
+    crew_module.gate.set()
+    join(warming)
+    crew_module.gate = None
+
+    crew_module.failures = crew_module.builds + 1
+    failed = CrewWarmup(max_attempts=1)
+    failed.start()
+    join(failed)
+    response = get_readyz(monkeypatch, failed)
+    assert response.status_code == 503 and "Retry-After" not in response.headers
+    assert response.json() == {"status": "failed", "error": "RuntimeError: build 2 failed"}
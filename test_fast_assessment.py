@@ -0,0 +1,82 @@
+"""
+Cardano Career Navigator - Fast Assessment Tests
+Shape of the rule-based assessment and its narrative fallbacks
+"""
+
+from fast_assessment import NarrativeWriter, build_assessment
+from result_models import AssessmentResult
+
+PROFILE = {
+    "address": "addr_test1fast",
+    "experience_level": "intermediate",
+    "technical_skills": ["nft-creation", "defi-protocols", "smart-contracts", "plutus"],
+    "interests": ["digital-art", "real-world-utility"],
+    "learning_style": "hands-on",
+    "preferred_path": "development",
+    "transaction_count": 12,
+    "analysis_timestamp": 1700000000.0
+}
+
+
+class StubLLM:
+    def __init__(self, reply=None, error=None):
+        self.reply = reply
+        self.error = error
+        self.prompts = []
+
+    def call(self, messages):
+        self.prompts.append(messages[0]["content"])
+        if self.error is not None:
+            raise self.error
+        return self.reply
+
+
+def test_fast_assessment_has_the_crew_result_shape():
+    assessment = build_assessment(PROFILE)
+    result = AssessmentResult(summary=assessment["narrative"]["text"], **assessment).model_dump()
+
+    assert set(result) == set(AssessmentResult.model_fields)
+    # The profile keeps only the fields the result model defines
+    assert result["profile"] == {field: PROFILE[field] for field in result["profile"]}
+    assert [insight["type"] for insight in result["insights"]] == ["experience", "skills", "path"]
+    assert result["narrative"]["source"] == "template"
+    assert result["summary"] == result["narrative"]["text"]
+
+
+def test_next_steps_and_recommendations_follow_the_experience_level():
+    intermediate = build_assessment(PROFILE)
+    beginner = build_assessment(dict(PROFILE, experience_level="beginner", technical_skills=[]))
+
+    assert intermediate["next_steps"][0]["service"] == "roadmap"
+    assert intermediate["next_steps"][-1]["service"] == "catalyst"
+    assert all(step.get("service") != "catalyst" for step in beginner["next_steps"])
+    assert intermediate["recommendations"]["catalyst_service"]["recommended"] is True
+    assert beginner["recommendations"]["catalyst_service"]["recommended"] is False
+    assert [insight["type"] for insight in beginner["insights"]] == ["experience", "path"]
+
+
+def test_begin_wallet_tips_depend_on_the_profile():
+    categories = [tip["category"] for tip in build_assessment(PROFILE)["begin_wallet_integration"]]
+    assert categories == ["progress-tracking", "esim-rewards"]
+
+
+def test_narrative_comes_from_the_llm_when_it_answers():
+    llm = StubLLM(reply="  You are ready to build.  ")
+    narrative, usage = NarrativeWriter("stub", llm_factory=lambda: llm).write(PROFILE)
+
+    assert narrative == {"text": "You are ready to build.", "source": "llm"}
+    assert "experience=intermediate" in llm.prompts[0]
+    assert usage["total_tokens"] == 0
+
+
+def test_narrative_falls_back_to_the_template():
+    failing = NarrativeWriter("stub", llm_factory=lambda: StubLLM(error=TimeoutError("slow")))
+    empty = NarrativeWriter("stub", llm_factory=lambda: StubLLM(reply=""))
+    built = []
+    disabled = NarrativeWriter("stub", enabled=False, llm_factory=lambda: built.append(1))
+
+    for writer in (failing, empty, disabled):
+        narrative, _ = writer.write(PROFILE)
+        assert narrative["source"] == "template"
+        assert "intermediate-level" in narrative["text"]
+    assert built == []
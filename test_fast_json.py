@@ -0,0 +1,39 @@
+"""
+Cardano Career Navigator - Fast JSON Tests
+Response encoding and ?fields= selection of job payloads
+"""
+
+import json
+
+from fast_json import FastJSONResponse, dumps, parse_fields, select_fields
+
+JOB = {
+    "job_id": "job-1",
+    "status": "completed",
+    "result": {"service": "roadmap", "result": {"timeline": "3-months", "milestones": [{"title": "Learn Aiken"}]}}
+}
+
+
+def test_parse_fields_splits_and_trims():
+    assert parse_fields(None) is None
+    assert parse_fields("") is None
+    assert parse_fields(" status, result.result.milestones ,,") == ["status", "result.result.milestones"]
+
+
+def test_select_fields_keeps_only_the_requested_paths():
+    selected = select_fields(JOB, ["status", "result.result.milestones"])
+
+    assert selected == {"status": "completed", "result": {"result": {"milestones": [{"title": "Learn Aiken"}]}}}
+
+
+def test_select_fields_skips_missing_paths():
+    assert select_fields(JOB, ["missing", "status.nested", "result.result.cost"]) == {}
+    assert select_fields(JOB, []) == {}
+
+
+def test_responses_render_compact_utf8_json():
+    body = FastJSONResponse({"status": "ok", "note": "café", 1: "non-string key"}).body
+
+    assert json.loads(body) == {"status": "ok", "note": "café", "1": "non-string key"}
+    assert body == dumps({"status": "ok", "note": "café", 1: "non-string key"})
+    assert b" " not in dumps({"a": [1, 2]})
@@ -0,0 +1,223 @@
+"""
+Cardano Career Navigator - Job Cancellation Tests
+Cancel tokens and checkpoints, run timeouts and /cancel_job for queued, running and coalesced jobs
+"""
+
+import asyncio
+import gc
+import os
+import threading
+
+import pytest
+
+os.environ.setdefault("WARMUP_ON_START", "false")
+
+import httpx
+
+import main
+from job_cancel import CancelToken, JobCancelled, cancel_scope, checkpoint, job_timeout
+
+
+def test_checkpoints_raise_once_the_token_is_cancelled():
+    token = CancelToken()
+    with cancel_scope(token):
+        checkpoint()
+        token.cancel("Stop here")
+        token.cancel("Ignored second reason")
+        with pytest.raises(JobCancelled, match="Stop here"):
+            checkpoint()
+    # Outside a scope checkpoints never fire
+    checkpoint()
+
+
+def test_job_cancelled_escapes_generic_error_handling():
+    token = CancelToken()
+    token.cancel()
+
+    def tool_call():
+        try:
+            token.check()
+        except Exception:
+            return "swallowed"
+
+    with pytest.raises(JobCancelled):
+        tool_call()
+
+
+def test_job_timeouts_come_from_the_environment(monkeypatch):
+    monkeypatch.setenv("JOB_TIMEOUT_ROADMAP", "0")
+    assert job_timeout("roadmap") == 0
+    assert job_timeout("catalyst") == 900
+    assert job_timeout("unknown") == 0
+
+
+def test_await_run_gives_up_the_slot_on_timeout():
+    async def scenario():
+        run = asyncio.get_running_loop().create_future()
+        token = CancelToken()
+        abandoned = main.executor.stats()["abandoned_runs"]
+
+        with pytest.raises(TimeoutError, match="timed out after 0.05 seconds"):
+            await main.await_run(run, token, timeout=0.05)
+        assert token.cancelled
+        assert main.executor.stats()["abandoned_runs"] == abandoned + 1
+
+        # Once the abandoned run stops, it is no longer counted
+        run.set_exception(JobCancelled(token.reason))
+        await asyncio.sleep(0)
+        assert main.executor.stats()["abandoned_runs"] == abandoned
+
+    asyncio.run(scenario())
+
+
+def test_await_run_stops_waiting_when_cancelled():
+    async def scenario():
+        run = asyncio.get_running_loop().create_future()
+        token = CancelToken()
+        asyncio.get_running_loop().call_later(0.05, token.cancel, "Cancelled by request")
+
+        with pytest.raises(JobCancelled, match="Cancelled by request"):
+            await main.await_run(run, token, timeout=10)
+        run.cancel()
+
+        finished = asyncio.get_running_loop().create_future()
+        finished.set_result({"ok": True})
+        assert await main.await_run(finished, CancelToken(), timeout=0) == {"ok": True}
+
+    asyncio.run(scenario())
+
+
+class BlockingRuns:
+    """Stands in for the crew: each run waits for release, checking its cancel token meanwhile"""
+
+    def __init__(self):
+        self.started = threading.Semaphore(0)
+        self.wallets = []
+        self.release = threading.Event()
+        self.cancelled = []
+        self.error = None
+
+    def __call__(self, service_type, user_address, timeline=None, progress=None, mode=None,
+                 cancel_token=None, trace=None):
+        self.wallets.append(user_address)
+        self.started.release()
+        while not self.release.wait(0.01):
+            try:
+                cancel_token.check()
+            except JobCancelled:
+                self.cancelled.append(user_address)
+                raise
+        if self.error is not None:
+            raise self.error
+        return {"wallet": user_address}
+
+    async def wait_started(self, count=1):
+        for _ in range(count):
+            assert await asyncio.to_thread(self.started.acquire, True, 5)
+
+
+def run_app(monkeypatch, scenario):
+    """Run scenario(client, runs) against the app with a blocking stand-in for the crew"""
+    runs = BlockingRuns()
+    monkeypatch.setattr(main, "run_service_request", runs)
+
+    async def runner():
+        async with main.lifespan(main.app):
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                try:
+                    return await scenario(client, runs)
+                finally:
+                    runs.release.set()
+
+    return asyncio.run(runner())
+
+
+async def start(client, wallet):
+    response = await client.post("/start_job", json={
+        "identifier_from_purchaser": f"cancel-test-{wallet}",
+        "input_data": {"type": "catalyst", "user_address": wallet}
+    })
+    assert response.status_code == 200, response.text
+    return response.json()["job_id"]
+
+
+async def status(client, job_id):
+    return (await client.get("/status", params={"job_id": job_id})).json()["status"]
+
+
+async def settled(condition, timeout=5.0):
+    """Poll until condition() is true"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "condition never became true"
+        await asyncio.sleep(0.01)
+
+
+def test_cancelling_a_running_job_stops_it_and_frees_the_worker(monkeypatch):
+    async def scenario(client, runs):
+        job_id = await start(client, "addr_test1running")
+        await runs.wait_started()
+
+        response = await client.post("/cancel_job", params={"job_id": job_id})
+        assert response.json() == {"job_id": job_id, "status": "cancelled"}
+
+        await settled(lambda: main.executor.stats()["busy_workers"] == 0)
+        assert runs.cancelled == ["addr_test1running"]
+        assert await status(client, job_id) == "cancelled"
+        # Cancelling twice is refused
+        assert (await client.post("/cancel_job", params={"job_id": job_id})).status_code == 400
+
+    run_app(monkeypatch, scenario)
+
+
+def test_cancelling_a_queued_job_removes_it_from_the_queue(monkeypatch):
+    async def scenario(client, runs):
+        workers = main.executor.stats()["workers"]
+        for i in range(workers):
+            await start(client, f"addr_test1busy{i}")
+        await runs.wait_started(workers)
+
+        queued = await start(client, "addr_test1queued")
+        assert main.executor.stats()["queue_depth"] == 1
+
+        response = await client.post("/cancel_job", params={"job_id": queued})
+        assert response.json()["status"] == "cancelled"
+        assert main.executor.stats()["queue_depth"] == 0
+
+        runs.release.set()
+        await settled(lambda: main.executor.stats()["busy_workers"] == 0)
+        # The queued job never ran and stays cancelled
+        assert "addr_test1queued" not in runs.wallets
+        assert await status(client, queued) == "cancelled"
+
+    run_app(monkeypatch, scenario)
+
+
+def test_cancelling_a_follower_leaves_the_shared_run_going(monkeypatch):
+    async def scenario(client, runs):
+        errors = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+
+        leader = await start(client, "addr_test1shared")
+        await runs.wait_started()
+        follower = await start(client, "addr_test1shared")
+
+        assert (await client.post("/cancel_job", params={"job_id": follower})).json()["status"] == "cancelled"
+        assert main.executor.stats()["busy_workers"] == 1
+
+        # The leader fails after the follower stopped waiting; its error must not leak from the follower
+        runs.error = RuntimeError("crew failed")
+        runs.release.set()
+        await settled(lambda: main.executor.stats()["busy_workers"] == 0)
+        await asyncio.sleep(0.05)
+        gc.collect()
+        await asyncio.sleep(0)
+
+        assert await status(client, leader) == "failed"
+        assert await status(client, follower) == "cancelled"
+        assert runs.cancelled == []
+        assert not [context for context in errors if "never retrieved" in context.get("message", "")]
+
+    run_app(monkeypatch, scenario)
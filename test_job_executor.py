@@ -0,0 +1,161 @@
+"""
+Cardano Career Navigator - Job Execution Tests
+Priority scheduling, purchaser fairness, aging and single-flight coalescing
+"""
+
+import asyncio
+
+import pytest
+
+from job_executor import JobExecutor, PriorityScheduler, SingleFlight
+
+PRIORITIES = {"catalyst": 0, "roadmap": 1, "assessment": 2}
+
+
+async def noop():
+    pass
+
+
+def drain(scheduler):
+    order = []
+    while len(scheduler):
+        order.append(scheduler.pop().job_id)
+    return order
+
+
+def test_lower_class_runs_first_then_submission_order():
+    scheduler = PriorityScheduler(PRIORITIES, aging_seconds=0)
+    for job_id, service_type in [("a1", "assessment"), ("r1", "roadmap"), ("c1", "catalyst"),
+                                 ("a2", "assessment"), ("c2", "catalyst")]:
+        scheduler.push(job_id, noop, (), service_type, purchaser=job_id)
+
+    assert scheduler.depth_by_priority() == {0: 2, 1: 1, 2: 2}
+    assert drain(scheduler) == ["c1", "c2", "r1", "a1", "a2"]
+
+
+def test_unknown_services_use_the_lowest_class():
+    scheduler = PriorityScheduler(PRIORITIES, aging_seconds=0)
+    scheduler.push("other", noop, (), "something-else")
+    scheduler.push("assessment", noop, (), "assessment")
+    scheduler.push("catalyst", noop, (), "catalyst")
+
+    assert drain(scheduler) == ["catalyst", "other", "assessment"]
+
+
+def test_purchasers_share_a_class_fairly():
+    scheduler = PriorityScheduler(PRIORITIES, aging_seconds=0)
+    for i in range(4):
+        scheduler.push(f"burst{i}", noop, (), "roadmap", purchaser="burst")
+    scheduler.push("other0", noop, (), "roadmap", purchaser="other")
+    scheduler.push("other1", noop, (), "roadmap", purchaser="other")
+
+    assert drain(scheduler) == ["burst0", "other0", "burst1", "other1", "burst2", "burst3"]
+
+
+def test_newcomers_start_at_the_class_clock():
+    scheduler = PriorityScheduler(PRIORITIES, aging_seconds=0)
+    for i in range(3):
+        scheduler.push(f"a{i}", noop, (), "roadmap", purchaser="a")
+    assert scheduler.pop().job_id == "a0"
+    assert scheduler.pop().job_id == "a1"
+
+    # A newcomer starts at the class clock, not at zero, so it interleaves instead of running its backlog first
+    scheduler.push("b0", noop, (), "roadmap", purchaser="b")
+    scheduler.push("b1", noop, (), "roadmap", purchaser="b")
+    assert drain(scheduler) == ["b0", "a2", "b1"]
+
+
+def test_waiting_promotes_a_job_one_class_per_aging_period():
+    scheduler = PriorityScheduler(PRIORITIES, aging_seconds=60)
+    scheduler.push("old-assessment", noop, (), "assessment")
+    scheduler.push("roadmap", noop, (), "roadmap")
+    scheduler.push("catalyst", noop, (), "catalyst")
+
+    # Two aging periods lift the assessment from class 2 to class 0; the native catalyst job still wins ties
+    scheduler._jobs[0].enqueued_at -= 125
+    assert drain(scheduler) == ["catalyst", "old-assessment", "roadmap"]
+
+
+def test_remove_drops_only_queued_jobs():
+    scheduler = PriorityScheduler(PRIORITIES)
+    scheduler.push("keep", noop, (), "roadmap")
+    scheduler.push("drop", noop, (), "roadmap")
+
+    assert scheduler.remove("drop") is True
+    assert scheduler.remove("drop") is False
+    assert drain(scheduler) == ["keep"]
+
+
+def test_dispatcher_survives_a_job_that_raises(capsys):
+    async def broken():
+        raise RuntimeError("handler bug")
+
+    async def scenario():
+        executor = JobExecutor(max_workers=1)
+        await executor.start()
+        done = asyncio.Event()
+
+        async def after():
+            done.set()
+
+        executor.submit("broken", broken)
+        executor.submit("after", after)
+        await asyncio.wait_for(done.wait(), timeout=5)
+        await executor.shutdown()
+
+    asyncio.run(scenario())
+    err = capsys.readouterr()
+    assert "Job broken raised outside its handler: handler bug" in err.out
+    assert "Traceback" in err.err and "handler bug" in err.err
+
+
+def test_single_flight_followers_share_the_leader_result():
+    async def scenario():
+        flights = SingleFlight()
+        leader, is_leader = flights.acquire(("roadmap", "addr1"))
+        follower, follower_is_leader = flights.acquire(("roadmap", "addr1"))
+        other, other_is_leader = flights.acquire(("roadmap", "addr2"))
+
+        assert (is_leader, follower_is_leader, other_is_leader) == (True, False, True)
+        assert follower is leader and other is not leader
+        assert flights.attached(("roadmap", "addr1")) == 2
+        assert len(flights) == 2
+
+        flights.resolve(("roadmap", "addr1"), result={"ok": True})
+        assert await follower == {"ok": True}
+        assert len(flights) == 1
+
+        # A resolved key starts a new flight
+        _, is_leader = flights.acquire(("roadmap", "addr1"))
+        assert is_leader
+
+    asyncio.run(scenario())
+
+
+def test_single_flight_errors_reach_every_follower():
+    async def scenario():
+        flights = SingleFlight()
+        leader, _ = flights.acquire("key")
+        follower, _ = flights.acquire("key")
+
+        flights.resolve("key", error=RuntimeError("crew failed"))
+        for future in (leader, follower):
+            with pytest.raises(RuntimeError, match="crew failed"):
+                await future
+        # Resolving twice is a no-op
+        flights.resolve("key", result="late")
+
+    asyncio.run(scenario())
+
+
+def test_single_flight_detach_reports_the_last_job():
+    async def scenario():
+        flights = SingleFlight()
+        flights.acquire("key")
+        flights.acquire("key")
+
+        assert flights.detach("key") is False
+        assert flights.detach("key") is True
+        assert flights.detach("missing") is False
+
+    asyncio.run(scenario())
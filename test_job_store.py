@@ -0,0 +1,96 @@
+"""
+Cardano Career Navigator - Job Store Tests
+Retention and size-cap eviction for the in-memory and SQLite stores
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from job_store import InMemoryJobStore, SQLiteJobStore
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_store(request, tmp_path):
+    def make(retention_seconds=3600, max_jobs=100):
+        if request.param == "sqlite":
+            return SQLiteJobStore(str(tmp_path / "jobs.db"), retention_seconds=retention_seconds, max_jobs=max_jobs)
+        return InMemoryJobStore(retention_seconds=retention_seconds, max_jobs=max_jobs)
+    return make
+
+
+def test_update_merges_and_missing_jobs_are_none(make_store):
+    store = make_store()
+    store.create("job", {"job_id": "job", "status": "pending"})
+
+    assert store.update("job", status="completed", result={"ok": True}) == {
+        "job_id": "job", "status": "completed", "result": {"ok": True}
+    }
+    assert store.get("job")["result"] == {"ok": True}
+    assert store.update("missing", status="failed") is None
+    assert "missing" not in store
+
+
+def test_finished_jobs_expire_after_retention(make_store):
+    store = make_store(retention_seconds=0.05)
+    store.create("running", {"status": "processing"})
+    store.create("done", {"status": "pending"})
+    store.update("done", status="completed")
+
+    time.sleep(0.1)
+    assert store.evict_expired() == 1
+    assert "done" not in store
+    # Unfinished jobs are never evicted, however old
+    assert store.get("running") == {"status": "processing"}
+
+
+def test_size_cap_drops_the_oldest_finished_jobs(make_store):
+    store = make_store(max_jobs=3)
+    store.create("active", {"status": "processing"})
+    for job_id in ("first", "second", "third"):
+        store.create(job_id, {"status": "pending"})
+        store.update(job_id, status="completed")
+        time.sleep(0.01)
+
+    store.evict_expired()
+    assert "first" not in store
+    assert "active" in store
+    assert "second" in store and "third" in store
+
+
+def test_traces_are_kept_apart_and_evicted_with_the_job(make_store):
+    store = make_store(retention_seconds=0.05)
+    store.create("job", {"status": "pending"})
+    store.set_trace("job", {"spans": [], "breakdown": {}})
+    store.update("job", status="completed")
+
+    assert "trace" not in store.get("job")
+    assert store.get_trace("job") == {"spans": [], "breakdown": {}}
+
+    time.sleep(0.1)
+    store.evict_expired()
+    assert store.get_trace("job") is None
+
+
+def test_finished_status_is_final(make_store):
+    store = make_store()
+    store.create("job", {"status": "pending"})
+    store.update("job", status="cancelled")
+
+    record = store.update("job", status="processing", partial={"steps": []})
+    assert record["status"] == "cancelled"
+    assert record["partial"] == {"steps": []}
+    assert store.update("job", status="failed")["status"] == "failed"
+
+
+def test_async_variants_match_the_sync_calls(make_store):
+    store = make_store()
+
+    async def scenario():
+        await store.create_async("job", {"status": "pending"})
+        await store.update_async("job", status="completed")
+        await store.set_trace_async("job", {"spans": []})
+        return await store.get_async("job"), await store.get_trace_async("job")
+
+    assert asyncio.run(scenario()) == ({"status": "completed"}, {"spans": []})
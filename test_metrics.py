@@ -0,0 +1,96 @@
+"""
+Cardano Career Navigator - Metrics Tests
+Prometheus text rendering of counters, gauges and histograms
+"""
+
+import asyncio
+import os
+
+import pytest
+
+os.environ.setdefault("WARMUP_ON_START", "false")
+
+import httpx
+
+import main
+from metrics import MetricsRegistry, hit_ratio
+
+
+def test_counters_render_as_total_families():
+    registry = MetricsRegistry()
+    jobs = registry.counter("jobs", "Jobs by service", ("service",))
+    jobs.inc("roadmap")
+    jobs.inc("roadmap", amount=2)
+    jobs.inc('quo"te\\new\nline')
+
+    assert registry.render().splitlines() == [
+        "# HELP jobs_total Jobs by service",
+        "# TYPE jobs_total counter",
+        'jobs_total{service="roadmap"} 3',
+        'jobs_total{service="quo\\"te\\\\new\\nline"} 1'
+    ]
+    assert jobs.value("roadmap") == 3
+
+
+def test_gauges_are_read_at_scrape_time_and_skip_missing_values():
+    registry = MetricsRegistry()
+    depth = {"value": 1}
+    registry.gauge("depth", "Queue depth", lambda: depth["value"])
+    registry.gauge("ratio", "Hit ratio", lambda: {("result",): 0.25, ("tool",): None}, ("cache",))
+
+    depth["value"] = 4
+    lines = registry.render().splitlines()
+    assert "# TYPE depth gauge" in lines
+    assert "depth 4" in lines
+    assert 'ratio{cache="result"} 0.25' in lines
+    assert not any(line.startswith('ratio{cache="tool"}') for line in lines)
+
+
+def test_histograms_render_cumulative_buckets():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency", ("tool",), buckets=(0.1, 1))
+    for value in (0.05, 0.1, 0.5, 5):
+        latency.observe(value, "wallet")
+
+    assert registry.render().splitlines()[2:] == [
+        'latency_seconds_bucket{tool="wallet",le="0.1"} 2',
+        'latency_seconds_bucket{tool="wallet",le="1"} 3',
+        'latency_seconds_bucket{tool="wallet",le="+Inf"} 4',
+        'latency_seconds_sum{tool="wallet"} 5.65',
+        'latency_seconds_count{tool="wallet"} 4'
+    ]
+
+
+def test_registration_and_label_errors():
+    registry = MetricsRegistry()
+    jobs = registry.counter("jobs", "Jobs", ("service",))
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.counter("jobs", "Jobs again")
+    with pytest.raises(ValueError, match="expects labels"):
+        jobs.inc()
+    assert hit_ratio(0, 0) is None
+    assert hit_ratio(3, 1) == 0.75
+
+
+def test_metrics_endpoint_counts_admission_rejections(monkeypatch):
+    monkeypatch.setattr(main.admission, "max_queue_depth", 0)
+
+    async def scenario():
+        async with main.lifespan(main.app):
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                before = main.admission_rejections.value("503")
+                rejected = await client.post("/start_job", json={
+                    "identifier_from_purchaser": "metrics-test",
+                    "input_data": {"type": "catalyst", "user_address": "addr_test1metrics"}
+                })
+                assert rejected.status_code == 503
+                return before, await client.get("/metrics")
+
+    before, response = asyncio.run(scenario())
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    lines = response.text.splitlines()
+    assert "# TYPE career_admission_rejections_total counter" in lines
+    assert f'career_admission_rejections_total{{status="503"}} {before + 1:g}' in lines
+    assert "# TYPE career_job_queue_depth gauge" in lines
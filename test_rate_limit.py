@@ -0,0 +1,107 @@
+"""
+Cardano Career Navigator - Rate Limiting Tests
+Token bucket refill and all-or-nothing acquisition for both backends
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from rate_limit import BucketSpec, InMemoryRateLimiter, RateLimitPolicy, SQLiteRateLimiter
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def limiter(request, tmp_path):
+    if request.param == "sqlite":
+        return SQLiteRateLimiter(str(tmp_path / "rate.db"))
+    return InMemoryRateLimiter()
+
+
+def test_burst_then_refill(limiter):
+    bucket = [BucketSpec("purchaser:p", capacity=3, rate=0.5)]
+
+    results = [limiter.acquire(bucket, now=100.0).allowed for _ in range(4)]
+    assert results == [True, True, True, False]
+
+    denied = limiter.acquire(bucket, now=100.0)
+    assert denied.remaining == 0
+    assert denied.retry_after == pytest.approx(2.0)
+    assert denied.headers()["Retry-After"] == "2"
+
+    # Half a token per second: one token after two seconds, never more than capacity
+    assert limiter.acquire(bucket, now=101.0).allowed is False
+    assert limiter.acquire(bucket, now=102.0).allowed is True
+    assert limiter.acquire(bucket, now=1000.0).remaining == 2
+
+
+def test_denied_request_takes_from_no_bucket(limiter):
+    purchaser = BucketSpec("purchaser:p", capacity=5, rate=0.001)
+    wallet = BucketSpec("wallet:w", capacity=1, rate=0.001)
+
+    assert limiter.acquire([purchaser, wallet], now=0.0).allowed is True
+    denied = limiter.acquire([purchaser, wallet], now=0.0)
+    assert denied.allowed is False
+    assert denied.key == "wallet:w"
+
+    # The purchaser still has all four remaining tokens for other wallets
+    decisions = [limiter.acquire([purchaser, BucketSpec(f"wallet:{i}", 1, 0.001)], now=0.0) for i in range(5)]
+    assert [decision.allowed for decision in decisions] == [True, True, True, True, False]
+
+
+def test_concurrent_acquires_never_overdraw(limiter):
+    bucket = [BucketSpec("purchaser:shared", capacity=50, rate=0.000001)]
+    allowed = []
+    lock = threading.Lock()
+
+    def hammer():
+        for _ in range(25):
+            decision = limiter.acquire(bucket, now=10.0)
+            with lock:
+                allowed.append(decision.allowed)
+
+    threads = [threading.Thread(target=hammer) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert allowed.count(True) == 50
+    assert len(allowed) == 200
+
+
+def test_sqlite_buckets_are_shared_between_limiters(tmp_path):
+    path = str(tmp_path / "shared.db")
+    first, second = SQLiteRateLimiter(path), SQLiteRateLimiter(path)
+    bucket = [BucketSpec("wallet:w", capacity=2, rate=0.001)]
+
+    assert first.acquire(bucket, now=0.0).allowed is True
+    assert second.acquire(bucket, now=0.0).allowed is True
+    assert first.acquire(bucket, now=0.0).allowed is False
+
+
+def test_policy_skips_disabled_limits():
+    policy = RateLimitPolicy(InMemoryRateLimiter(), purchaser_burst=0, wallet_burst=0)
+    assert policy.check("p", "w") is None
+
+    policy = RateLimitPolicy(InMemoryRateLimiter(), purchaser_burst=2, purchaser_per_minute=1, wallet_burst=0)
+    assert [policy.check("p", f"w{i}").allowed for i in range(3)] == [True, True, False]
+
+
+def test_check_async_keeps_blocking_limiters_off_the_event_loop(limiter):
+    threads = []
+    acquire = limiter.acquire
+
+    def recording_acquire(buckets, now=None):
+        threads.append(threading.current_thread())
+        return acquire(buckets, now)
+
+    limiter.acquire = recording_acquire
+    policy = RateLimitPolicy(limiter, purchaser_burst=1, purchaser_per_minute=1, wallet_burst=0)
+
+    async def scenario():
+        return [(await policy.check_async("p", "w")).allowed for _ in range(2)]
+
+    assert asyncio.run(scenario()) == [True, False]
+    on_loop_thread = [thread is threading.main_thread() for thread in threads]
+    assert on_loop_thread == [not limiter.blocking] * 2
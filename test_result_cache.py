@@ -0,0 +1,99 @@
+"""
+Cardano Career Navigator - Result Cache Tests
+Byte-capped LRU, per-service TTLs and the disk tier
+"""
+
+import asyncio
+import json
+import os
+import time
+
+from result_cache import ResultCache
+
+ADDRESS = "addr_test1cache"
+
+
+def payload_size(result):
+    return len(json.dumps(result).encode())
+
+
+def test_hits_return_independent_copies():
+    cache = ResultCache()
+    cache.put("assessment", ADDRESS, None, {"skills": ["plutus"]})
+
+    first = cache.get("assessment", ADDRESS)
+    first["skills"].append("mutated")
+    assert cache.get("assessment", ADDRESS) == {"skills": ["plutus"]}
+    assert cache.get("assessment", "other") is None
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 1
+
+
+def test_keys_include_timeline_and_mode():
+    cache = ResultCache()
+    cache.put("roadmap", ADDRESS, "3-months", {"months": 3})
+    cache.put("assessment", ADDRESS, None, {"mode": "fast"}, mode="fast")
+
+    assert cache.get("roadmap", ADDRESS, "6-months") is None
+    assert cache.get("roadmap", ADDRESS, "3-months") == {"months": 3}
+    assert cache.get("assessment", ADDRESS) is None
+    assert cache.get("assessment", ADDRESS, mode="fast") == {"mode": "fast"}
+
+
+def test_entries_expire_and_zero_ttl_disables_caching():
+    cache = ResultCache(ttls={"assessment": 0.05, "catalyst": 0})
+    cache.put("assessment", ADDRESS, None, {"ok": True})
+    cache.put("catalyst", ADDRESS, None, {"ok": True})
+
+    assert cache.get("catalyst", ADDRESS) is None
+    assert cache.get("assessment", ADDRESS) == {"ok": True}
+    time.sleep(0.1)
+    assert cache.get("assessment", ADDRESS) is None
+    assert cache.stats()["entries"] == 0 and cache.stats()["bytes"] == 0
+
+
+def test_least_recently_used_entries_go_first_under_the_byte_cap():
+    result = {"data": "x" * 100}
+    cache = ResultCache(max_bytes=3 * payload_size(result))
+    for wallet in ("a", "b", "c"):
+        cache.put("assessment", wallet, None, result)
+
+    # Touch "a" so "b" is the least recently used
+    assert cache.get("assessment", "a") is not None
+    cache.put("assessment", "d", None, result)
+
+    assert cache.get("assessment", "b") is None
+    assert all(cache.get("assessment", wallet) is not None for wallet in ("a", "c", "d"))
+    assert cache.stats()["bytes"] == 3 * payload_size(result)
+
+
+def test_results_larger_than_the_cap_are_not_cached():
+    cache = ResultCache(max_bytes=50)
+    cache.put("assessment", "small", None, {"ok": True})
+    cache.put("assessment", "big", None, {"data": "x" * 100})
+
+    assert cache.get("assessment", "big") is None
+    assert cache.get("assessment", "small") == {"ok": True}
+
+
+def test_disk_tier_survives_a_restart(tmp_path):
+    first = ResultCache(disk_dir=str(tmp_path))
+    asyncio.run(first.put_async("roadmap", ADDRESS, "6-months", {"months": 6}))
+
+    second = ResultCache(disk_dir=str(tmp_path))
+    assert asyncio.run(second.get_async("roadmap", ADDRESS, "6-months")) == {"months": 6}
+    # The disk hit was promoted into memory
+    assert second.stats()["entries"] == 1
+
+
+def test_disk_sweep_enforces_the_entry_cap_oldest_first(tmp_path):
+    cache = ResultCache(disk_dir=str(tmp_path), disk_max_entries=2, disk_sweep_interval=3600)
+    now = time.time()
+    for i, wallet in enumerate(("a", "b", "c")):
+        cache.put("assessment", wallet, None, {"wallet": wallet})
+        path = cache._disk_path(cache.make_key("assessment", wallet))
+        os.utime(path, (now - 10 + i, now - 10 + i))
+
+    assert cache.sweep_disk() == 1
+    fresh = ResultCache(disk_dir=str(tmp_path))
+    assert fresh.get("assessment", "a") is None
+    assert fresh.get("assessment", "c") == {"wallet": "c"}
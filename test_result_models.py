@@ -0,0 +1,43 @@
+"""
+Cardano Career Navigator - Result Model Tests
+Coercing crew output into the typed service results
+"""
+
+from types import SimpleNamespace
+
+from result_models import AssessmentResult, CatalystResult, RoadmapResult, parse_crew_output
+
+
+def crew_output(raw, pydantic=None, json_dict=None):
+    """The attributes of a crewai CrewOutput that parse_crew_output reads"""
+    return SimpleNamespace(raw=raw, pydantic=pydantic, json_dict=json_dict)
+
+
+def test_typed_output_is_used_as_is():
+    roadmap = RoadmapResult(timeline="3-months", milestones=[{"title": "Learn Aiken"}])
+    result = parse_crew_output(crew_output("ignored", pydantic=roadmap), RoadmapResult)
+
+    assert result == roadmap.model_dump()
+
+
+def test_json_dict_is_validated_against_the_model():
+    result = parse_crew_output(crew_output("ignored", json_dict={"timeline": "6-months"}), RoadmapResult)
+
+    assert result["timeline"] == "6-months" and result["milestones"] == []
+
+
+def test_json_wrapped_in_prose_or_fences_is_extracted():
+    raw = 'Here is the plan:\n```json\n{"summary": "Apply to Fund 13", "readiness": "ready"}\n```\nGood luck!'
+    result = parse_crew_output(crew_output(raw), CatalystResult)
+
+    assert result["summary"] == "Apply to Fund 13"
+    assert set(result) == set(CatalystResult.model_fields)
+
+
+def test_unparseable_output_lands_in_the_summary():
+    for raw in ("Just some advice, no JSON", '{"insights": "not a list"}', "{broken"):
+        result = parse_crew_output(crew_output(raw), AssessmentResult)
+        assert result == AssessmentResult(summary=raw).model_dump()
+
+    # Plain strings are accepted too
+    assert parse_crew_output("plain text", AssessmentResult)["summary"] == "plain text"
@@ -0,0 +1,92 @@
+"""
+Cardano Career Navigator - Roadmap Skeleton Cache Tests
+Archetype keys, hits, misses, TTL and snapshot invalidation, and personalisation
+"""
+
+import time
+
+from roadmap_cache import (RoadmapSkeletonCache, archetype_key, make_skeleton, normalize_timeline,
+                           personalise_roadmap, template_roadmap_intro)
+
+PROFILE = {
+    "experience_level": "Intermediate",
+    "preferred_path": "development",
+    "technical_skills": ["plutus", "smart-contracts"],
+    "interests": ["real-world-utility"],
+    "transaction_count": 12
+}
+
+SKELETON = {"timeline": "6-months", "preferred_path": "development",
+            "milestones": [{"title": "Learn Aiken"}], "learning_resources": ["Aiken docs"]}
+
+KEY = ("intermediate", "development", "6-months")
+
+
+def test_timelines_and_profiles_map_to_one_archetype():
+    assert [normalize_timeline(t) for t in ("6_months", "6 Months", "6-month", None)] == ["6-months"] * 4
+    assert archetype_key(PROFILE, "6 months") == KEY
+    assert archetype_key({}, "3-months") == ("beginner", "general", "3-months")
+
+
+def test_skeletons_keep_only_archetype_fields():
+    roadmap = dict(SKELETON, summary="Hi addr1", opportunities=[{"title": "Fund 13"}])
+    assert make_skeleton(roadmap) == SKELETON
+
+
+def test_hits_and_misses_are_counted():
+    cache = RoadmapSkeletonCache()
+    assert cache.get(KEY, "v1") is None
+    cache.put(KEY, "v1", SKELETON)
+
+    assert cache.get(KEY, "v1") == SKELETON
+    assert cache.get(("advanced", "development", "6-months"), "v1") is None
+    assert cache.stats() == {"entries": 1, "hits": 1, "misses": 2, "invalidations": 0}
+
+
+def test_a_new_catalyst_snapshot_invalidates_the_skeleton():
+    cache = RoadmapSkeletonCache()
+    cache.put(KEY, "v1", SKELETON)
+
+    assert cache.get(KEY, "v2") is None
+    # Dropped, so the old snapshot no longer matches either
+    assert cache.get(KEY, "v1") is None
+    assert cache.stats() == {"entries": 0, "hits": 0, "misses": 2, "invalidations": 1}
+
+
+def test_entries_expire_after_the_ttl():
+    cache = RoadmapSkeletonCache(ttl_seconds=0.05)
+    cache.put(KEY, "v1", SKELETON)
+    assert cache.get(KEY, "v1") == SKELETON
+
+    time.sleep(0.1)
+    assert cache.get(KEY, "v1") is None
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_least_recently_used_archetypes_go_first():
+    cache = RoadmapSkeletonCache(max_entries=2)
+    keys = [("beginner", path, "6-months") for path in ("design", "community", "research")]
+    cache.put(keys[0], "v1", SKELETON)
+    cache.put(keys[1], "v1", SKELETON)
+    assert cache.get(keys[0], "v1") is not None
+    cache.put(keys[2], "v1", SKELETON)
+
+    assert cache.get(keys[1], "v1") is None
+    assert cache.get(keys[0], "v1") is not None and cache.get(keys[2], "v1") is not None
+
+
+def test_personalising_fills_the_wallet_specific_fields():
+    opportunities = [{"id": "f13:dapps", "category": "DApps", "round": "Fund 13", "budget": "4000 ADA",
+                      "deadline": None, "match_reason": "plutus skills", "score": 14.0}]
+    profile = dict(PROFILE, experience_level="intermediate")
+    roadmap = personalise_roadmap(SKELETON, profile, opportunities, "Welcome")
+
+    assert roadmap["milestones"] == SKELETON["milestones"]
+    assert roadmap["opportunities"] == [{"title": "DApps", "round": "Fund 13", "budget": "4000 ADA",
+                                         "deadline": None, "match_reason": "plutus skills"}]
+    assert [tip["category"] for tip in roadmap["begin_wallet_integration"]] == ["progress-tracking", "esim-rewards"]
+    assert roadmap["summary"] == "Welcome"
+    assert "opportunities" not in SKELETON
+
+    intro = template_roadmap_intro(profile, "6-months", "Learn Aiken", "")
+    assert intro.startswith("A 6-months development roadmap") and "Catalyst" not in intro
@@ -0,0 +1,90 @@
+"""
+Cardano Career Navigator - Tool Cache Tests
+Per-job memoization, the shared cross-job tier and versioned keys
+"""
+
+import time
+
+from tool_cache import SharedToolCache, memoized_run, tool_cache_scope
+
+
+class DoublingTool:
+    """Stands in for a crewai BaseTool; memoized_run only needs its name"""
+
+    name = "doubling_tool"
+
+    def __init__(self):
+        self.calls = 0
+
+    @memoized_run
+    def _run(self, value: int) -> int:
+        self.calls += 1
+        return value * 2
+
+
+def test_tools_run_uncached_outside_a_scope():
+    tool = DoublingTool()
+    assert tool._run(2) == tool._run(2) == 4
+    assert tool.calls == 2
+
+
+def test_repeated_calls_in_a_job_are_hits():
+    tool = DoublingTool()
+    with tool_cache_scope(shared=None) as cache:
+        assert tool._run(2) == 4
+        assert tool._run(value=2) == 4
+        assert tool._run(2) == 4
+        assert tool._run(3) == 6
+
+    # Positional and keyword spellings are different keys
+    assert tool.calls == 3
+    assert cache.stats() == {"doubling_tool": {"hits": 1, "shared_hits": 0, "misses": 3}}
+
+
+def test_jobs_share_results_until_the_ttl_expires():
+    tool = DoublingTool()
+    shared = SharedToolCache(ttl_seconds=0.05)
+    with tool_cache_scope(shared):
+        tool._run(2)
+    with tool_cache_scope(shared) as cache:
+        tool._run(2)
+    assert tool.calls == 1
+    assert cache.stats()["doubling_tool"]["shared_hits"] == 1
+
+    time.sleep(0.1)
+    with tool_cache_scope(shared) as cache:
+        tool._run(2)
+    assert tool.calls == 2
+    assert cache.stats()["doubling_tool"]["misses"] == 1
+
+
+def test_shared_tier_drops_least_recently_used_entries():
+    shared = SharedToolCache(max_entries=2)
+    shared.put(("tool", "a"), 1)
+    shared.put(("tool", "b"), 2)
+    assert shared.get(("tool", "a")) == (True, 1)
+    shared.put(("tool", "c"), 3)
+
+    assert shared.get(("tool", "b")) == (False, None)
+    assert shared.get(("tool", "a")) == (True, 1)
+
+
+def test_a_new_data_version_is_a_miss():
+    data = {"version": "v1"}
+
+    class SnapshotTool(DoublingTool):
+        name = "snapshot_tool"
+
+        @memoized_run(version=lambda: data["version"])
+        def _run(self, value: int) -> int:
+            self.calls += 1
+            return value * 2
+
+    tool = SnapshotTool()
+    shared = SharedToolCache()
+    with tool_cache_scope(shared):
+        tool._run(2)
+        tool._run(2)
+        data["version"] = "v2"
+        tool._run(2)
+    assert tool.calls == 2
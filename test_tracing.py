@@ -0,0 +1,144 @@
+"""
+Cardano Career Navigator - Job Tracing Tests
+Span nesting across contexts and threads, LLM call pairing and JSON lines export
+"""
+
+import asyncio
+import contextvars
+import json
+import os
+import threading
+
+import pytest
+
+os.environ.setdefault("WARMUP_ON_START", "false")
+
+import httpx
+
+import main
+from tracing import JobTrace, export_trace, span, trace_scope, trace_to_jsonl
+
+
+def by_name(trace):
+    return {s["name"]: s for s in trace.spans()}
+
+
+def test_spans_nest_under_the_innermost_open_span():
+    trace = JobTrace("job-1")
+    with trace_scope(trace):
+        with span("task", "task", agent="analyst"):
+            with span("tool_call", "tool", tool="wallet") as attrs:
+                attrs["cached"] = True
+            with span("llm", "llm"):
+                pass
+        with span("after", "task"):
+            pass
+
+    spans = by_name(trace)
+    assert spans["task"]["parent"] is None
+    assert spans["tool_call"]["parent"] == spans["task"]["id"]
+    assert spans["llm"]["parent"] == spans["task"]["id"]
+    assert spans["after"]["parent"] is None
+    assert spans["tool_call"]["attrs"] == {"tool": "wallet", "cached": True}
+    assert [s["name"] for s in trace.spans()][0] == "task"
+
+
+def test_spans_record_errors_and_do_nothing_outside_a_scope():
+    trace = JobTrace("job-1")
+    with trace_scope(trace):
+        with pytest.raises(ValueError):
+            with span("tool_call", "tool"):
+                raise ValueError("bad input")
+    assert by_name(trace)["tool_call"]["attrs"] == {"error": "ValueError"}
+
+    with span("untraced", "task") as attrs:
+        attrs["ignored"] = True
+    assert len(trace.spans()) == 1
+
+
+def test_worker_threads_nest_under_the_span_that_started_them():
+    trace = JobTrace("job-1")
+
+    def tool():
+        with span("tool_call", "tool"):
+            pass
+
+    with trace_scope(trace), span("task", "task"):
+        thread = threading.Thread(target=contextvars.copy_context().run, args=(tool,))
+        thread.start()
+        thread.join()
+
+    spans = by_name(trace)
+    assert spans["tool_call"]["parent"] == spans["task"]["id"]
+
+
+def test_llm_events_pair_in_either_order():
+    trace = JobTrace("job-1", started_at=100.0)
+    trace.llm_call("a", "started", 101.0, model="gpt", parent=7)
+    trace.llm_call("a", "completed", 103.5, completion_tokens=40)
+    trace.llm_call("b", "failed", 105.0, error="timeout")
+    trace.llm_call("b", "started", 104.0, model="gpt")
+
+    first, second = trace.spans()
+    assert (first["start"], first["duration"], first["parent"]) == (1.0, 2.5, 7)
+    assert first["attrs"] == {"status": "completed", "model": "gpt", "completion_tokens": 40}
+    assert second["attrs"]["status"] == "failed" and second["attrs"]["error"] == "timeout"
+    assert trace.to_dict()["breakdown"] == {"llm": {"count": 2, "seconds": 3.5}}
+
+
+def test_spans_beyond_the_cap_are_counted_not_kept():
+    trace = JobTrace("job-1", started_at=0.0, max_spans=2)
+    for i in range(5):
+        trace.add("step", "step", i, i + 1)
+
+    data = trace.to_dict()
+    assert len(data["spans"]) == 2
+    assert data["dropped_spans"] == 3
+    assert data["duration"] == 2.0
+
+
+def test_jsonl_export_has_one_tagged_span_per_line(tmp_path, monkeypatch):
+    trace = JobTrace("job-9", started_at=0.0)
+    trace.add("queue_wait", "queue", 0.0, 0.5)
+    trace.add("run", "run", 0.5, 2.0, service="roadmap")
+    data = trace.to_dict()
+
+    lines = [json.loads(line) for line in trace_to_jsonl(data).splitlines()]
+    assert [(line["name"], line["job_id"]) for line in lines] == [("queue_wait", "job-9"), ("run", "job-9")]
+    assert lines[1]["attrs"] == {"service": "roadmap"}
+
+    path = tmp_path / "traces.jsonl"
+    assert export_trace(data, str(path)) is True
+    assert export_trace(data, str(path)) is True
+    assert len(path.read_text().splitlines()) == 4
+
+    monkeypatch.delenv("TRACE_EXPORT_PATH", raising=False)
+    assert export_trace(data) is False
+
+
+def test_trace_endpoint_exports_a_finished_job(monkeypatch):
+    def fake_run(service_type, user_address, timeline=None, progress=None, mode=None, cancel_token=None, trace=None):
+        with trace_scope(trace), span("task", "task", agent="advisor"):
+            with span("tool_call", "tool", tool="catalyst_opportunity_tool"):
+                pass
+        return {"service": service_type}
+
+    monkeypatch.setattr(main, "run_service_request", fake_run)
+
+    async def scenario():
+        async with main.lifespan(main.app):
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                job_id = (await client.post("/start_job", json={
+                    "identifier_from_purchaser": "trace-test",
+                    "input_data": {"type": "catalyst", "user_address": "addr_test1trace"}
+                })).json()["job_id"]
+                status = (await client.get("/status", params={"job_id": job_id, "wait": 5})).json()
+                assert status["status"] == "completed"
+                return await client.get("/trace", params={"job_id": job_id})
+
+    response = asyncio.run(scenario())
+    assert response.headers["content-type"] == "application/x-ndjson"
+    spans = {line["name"]: line for line in map(json.loads, response.text.splitlines())}
+    assert {"queue_wait", "task", "tool_call", "run"} <= set(spans)
+    assert spans["tool_call"]["parent"] == spans["task"]["id"]
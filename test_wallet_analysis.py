@@ -0,0 +1,91 @@
+"""
+Cardano Career Navigator - Wallet Analysis Tests
+Incremental wallet aggregates, their cursor and the profile store
+"""
+
+from wallet_analysis import WalletAnalyzer, WalletProfileStore, new_aggregate
+
+
+def chain_tx(i, kind="transfer"):
+    """Listing entry plus transaction detail for the i-th transaction of a wallet"""
+    listing = {"tx_hash": f"tx{i}", "tx_index": 0, "block_height": 100 + i}
+    assets = [{"unit": "lovelace", "quantity": "1000000"}]
+    if kind == "nft":
+        assets.append({"unit": "f0ff48bbb7bbe9d59a40f1ce90e9e9d0ff5002ec48f232b49ca0fb9a4e4654", "quantity": "1"})
+    detail = {"hash": f"tx{i}", "block_height": 100 + i, "assets": assets, "metadata": {}, "certificate_count": 0}
+    return listing, detail
+
+
+class FakeChain:
+    """The slice of BlockfrostClient the analyzer uses, over an in-memory wallet history"""
+
+    max_concurrency = 4
+
+    def __init__(self, transactions, failing=()):
+        self.transactions = transactions
+        self.failing = set(failing)
+
+    def iter_address_transactions(self, address, max_items=None, order="desc", from_block=None):
+        listing = [listing for listing, _ in self.transactions]
+        if order == "desc":
+            listing = listing[::-1]
+        if from_block is not None:
+            height = int(from_block.split(":")[0])
+            listing = [tx for tx in listing if tx["block_height"] >= height]
+        return iter(listing[:max_items] if max_items is not None else listing)
+
+    def fetch_transaction_details(self, tx_hashes):
+        details = {detail["hash"]: detail for _, detail in self.transactions}
+        failed = [tx_hash for tx_hash in tx_hashes if tx_hash in self.failing]
+        return [details[tx_hash] for tx_hash in tx_hashes if tx_hash not in self.failing], failed
+
+
+def test_refresh_folds_only_new_transactions():
+    chain = FakeChain([chain_tx(i) for i in range(3)])
+    analyzer = WalletAnalyzer(chain, refresh_seconds=0)
+
+    assert sum(analyzer.refresh("addr")["type_counts"].values()) == 3
+    chain.transactions += [chain_tx(i) for i in range(3, 5)]
+    aggregate = analyzer.refresh("addr")
+
+    assert aggregate["new_transactions"] == 2
+    assert sum(aggregate["type_counts"].values()) == 5
+    assert aggregate["cursor"]["tx_hash"] == "tx4"
+
+
+def test_cursor_stops_before_the_first_failed_lookup():
+    chain = FakeChain([chain_tx(i) for i in range(2)])
+    analyzer = WalletAnalyzer(chain, refresh_seconds=0)
+    analyzer.refresh("addr")
+
+    chain.transactions += [chain_tx(i) for i in range(2, 6)]
+    chain.failing = {"tx3"}
+    aggregate = analyzer.refresh("addr")
+    assert aggregate["cursor"]["tx_hash"] == "tx2"
+    assert aggregate["stale"] is True
+
+    # The failed transaction and everything after it are picked up once the lookup works
+    chain.failing = set()
+    aggregate = analyzer.refresh("addr")
+    assert aggregate["new_transactions"] == 3
+    assert sum(aggregate["type_counts"].values()) == 6
+    assert "stale" not in aggregate
+
+
+def test_memory_profile_store_drops_least_recently_used_wallets():
+    store = WalletProfileStore(max_entries=2)
+    store.put("a", new_aggregate())
+    store.put("b", new_aggregate())
+    assert store.get("a") is not None
+    store.put("c", new_aggregate())
+
+    assert store.get("b") is None
+    assert store.get("a") is not None and store.get("c") is not None
+
+
+def test_sqlite_profile_store_round_trips(tmp_path):
+    store = WalletProfileStore(str(tmp_path / "profiles.db"))
+    aggregate = dict(new_aggregate(), type_counts={"nft": 2}, updated_at=1.0)
+    store.put("addr", aggregate)
+
+    assert WalletProfileStore(str(tmp_path / "profiles.db")).get("addr") == aggregate
@@ -0,0 +1,200 @@
+"""
+Cardano Career Navigator - Batch Wallet Scoring Tests
+Parity of the vectorised scorer with a line-by-line port of src/analyzer.js
+"""
+
+import random
+from typing import Dict, Iterable, List
+
+from chain_client import ChainDataError
+from test_wallet_analysis import FakeChain, chain_tx
+from wallet_analysis import TRANSACTION_TYPES, WalletAnalyzer
+from wallet_scoring import PROTOCOL_SKILLS, score_aggregates, score_many
+
+# Reference implementation: the scalar analyzer.js port the batch scorer must agree with
+
+COMPLEX_TYPES = {"defi", "governance", "nft"}
+
+
+def determine_experience_level(type_counts: Dict[str, int]) -> str:
+    """Determine experience level from transaction type counts"""
+    tx_count = sum(type_counts.values())
+    unique_types = sum(1 for count in type_counts.values() if count > 0)
+    has_complex_tx = any(type_counts.get(tx_type, 0) > 0 for tx_type in COMPLEX_TYPES)
+
+    if tx_count >= 20 and unique_types >= 4 and has_complex_tx:
+        return "advanced"
+    if tx_count >= 5 and (unique_types >= 2 or has_complex_tx):
+        return "intermediate"
+    return "beginner"
+
+
+def extract_technical_skills(type_counts: Dict[str, int], protocol_skills: Iterable[str] = ()) -> List[str]:
+    """Extract technical skills from transaction type counts"""
+    skills: Dict[str, None] = {}  # insertion-ordered set
+
+    def add(*names):
+        for name in names:
+            skills[name] = None
+
+    if type_counts.get("nft"):
+        add("nft", "dapp-interaction")
+    if type_counts.get("defi"):
+        add("defi", "dapp-interaction", *sorted(protocol_skills))
+    if type_counts.get("governance"):
+        add("governance", "drep", "catalyst")
+    if type_counts.get("begin-wallet"):
+        add("begin-wallet", "metadata-interaction", "dapp-discovery")
+    if type_counts.get("staking"):
+        add("staking", "delegation")
+
+    tx_count = sum(type_counts.values())
+    if tx_count >= 1:
+        add("wallet-management")
+    if tx_count >= 10:
+        add("transaction-analysis")
+
+    return list(skills)
+
+
+def extract_interests(type_counts: Dict[str, int]) -> List[str]:
+    """Extract user interests from transaction type counts"""
+    interests = []
+
+    if type_counts.get("nft", 0) >= 2:
+        interests += ["collecting", "art", "digital-assets"]
+    if type_counts.get("defi", 0) >= 2:
+        interests += ["trading", "yield-farming", "financial-innovation"]
+    if type_counts.get("governance", 0) >= 1:
+        interests += ["governance", "community-building", "decentralization"]
+    if type_counts.get("staking", 0) >= 1:
+        interests += ["passive-income", "network-security"]
+    if type_counts.get("begin-wallet", 0) >= 1:
+        interests += ["real-world-utility", "travel", "mobile-integration"]
+
+    # Default interests for new users
+    if not interests:
+        interests = ["learning", "blockchain-technology"]
+
+    return interests
+
+
+def determine_learning_style(type_counts: Dict[str, int]) -> str:
+    """Determine learning style from transaction type counts"""
+    tx_count = sum(type_counts.values())
+    unique_types = sum(1 for count in type_counts.values() if count > 0)
+
+    if tx_count >= 10 and unique_types >= 3:
+        return "experiential"
+    if type_counts.get("nft", 0) > 0 or unique_types >= 2:
+        return "visual"
+    return "theoretical"
+
+
+def determine_preferred_path(transaction_count: int, technical_skills: List[str], interests: List[str]) -> str:
+    """Determine preferred career path from skills and interests"""
+    scores = {"development": 0, "design": 0, "community": 0, "research": 0}
+
+    if "defi" in technical_skills: scores["development"] += 3
+    if "dapp-interaction" in technical_skills: scores["development"] += 2
+    if "metadata-interaction" in technical_skills: scores["development"] += 2
+    if "financial-innovation" in interests: scores["development"] += 2
+
+    if "nft" in technical_skills: scores["design"] += 3
+    if "art" in interests: scores["design"] += 3
+    if "digital-assets" in interests: scores["design"] += 2
+    if "collecting" in interests: scores["design"] += 1
+
+    if "governance" in technical_skills: scores["community"] += 3
+    if "catalyst" in technical_skills: scores["community"] += 2
+    if "community-building" in interests: scores["community"] += 3
+    if "decentralization" in interests: scores["community"] += 2
+
+    if transaction_count < 3: scores["research"] += 1
+    if "blockchain-technology" in interests and len(interests) == 1: scores["research"] += 1
+    if "transaction-analysis" in technical_skills: scores["research"] += 1
+
+    # Same tie-breaking as the JS reduce: later paths win ties
+    top_path = "development"
+    for path in scores:
+        if not scores[top_path] > scores[path]:
+            top_path = path
+
+    return top_path if max(scores.values()) > 0 else "development"
+
+
+def reference_profile(type_counts: Dict[str, int], protocol_skills: Iterable[str] = ()) -> Dict:
+    transaction_count = sum(type_counts.values())
+    technical_skills = extract_technical_skills(type_counts, protocol_skills)
+    interests = extract_interests(type_counts)
+    return {
+        "experience_level": determine_experience_level(type_counts),
+        "technical_skills": sorted(technical_skills),
+        "interests": interests,
+        "learning_style": determine_learning_style(type_counts),
+        "preferred_path": determine_preferred_path(transaction_count, technical_skills, interests),
+        "transaction_count": transaction_count
+    }
+
+
+def comparable(profile: Dict) -> Dict:
+    """The fields analyzer.js defines; skills compared as a set (the batch scorer uses a fixed order)"""
+    return {
+        "experience_level": profile["experience_level"],
+        "technical_skills": sorted(profile["technical_skills"]),
+        "interests": profile["interests"],
+        "learning_style": profile["learning_style"],
+        "preferred_path": profile["preferred_path"],
+        "transaction_count": profile["transaction_count"]
+    }
+
+
+def random_aggregates(count: int, seed: int = 7) -> List[Dict]:
+    rng = random.Random(seed)
+    aggregates = []
+    for _ in range(count):
+        type_counts = {tx_type: rng.choice([0, 0, 1, 2, 3, 12]) for tx_type in TRANSACTION_TYPES}
+        type_counts = {tx_type: n for tx_type, n in type_counts.items() if n}
+        protocols = sorted(rng.sample(PROTOCOL_SKILLS, rng.randint(0, 2))) if type_counts.get("defi") else []
+        aggregates.append({"type_counts": type_counts, "protocol_skills": protocols})
+    return aggregates
+
+
+def test_batch_scores_match_the_reference_port():
+    aggregates = random_aggregates(2000)
+    profiles = score_aggregates([f"addr{i}" for i in range(len(aggregates))], aggregates)
+
+    for aggregate, profile in zip(aggregates, profiles):
+        assert comparable(profile) == reference_profile(aggregate["type_counts"], aggregate["protocol_skills"])
+
+
+def test_score_many_matches_the_reference_for_chain_wallets():
+    kinds = ["transfer", "nft", "nft", "transfer", "nft"]
+    analyzer = WalletAnalyzer(FakeChain([chain_tx(i, kind) for i, kind in enumerate(kinds)]), refresh_seconds=0)
+
+    profile = score_many(["addr"], analyzer)[0]
+    assert comparable(profile) == reference_profile({"transfer": 2, "nft": 3})
+    # Transfers move one asset, NFT transactions two
+    assert profile["asset_histogram"] == [2, 3, 0, 0, 0]
+    assert analyzer.analyze("addr")["preferred_path"] == profile["preferred_path"]
+
+
+def test_score_many_keeps_order_and_isolates_failures():
+    class PartlyDownChain(FakeChain):
+        def iter_address_transactions(self, address, *args, **kwargs):
+            if address == "broken":
+                raise ChainDataError("chain down")
+            return super().iter_address_transactions(address, *args, **kwargs)
+
+    analyzer = WalletAnalyzer(PartlyDownChain([chain_tx(0)]), refresh_seconds=0)
+    profiles = score_many(["a", "broken", "a"], analyzer, concurrency=4)
+
+    assert [profile["address"] for profile in profiles] == ["a", "broken", "a"]
+    assert profiles[1]["is_default"] is True and "chain down" in profiles[1]["error_message"]
+    assert profiles[0]["transaction_count"] == profiles[2]["transaction_count"] == 1
+
+
+def test_demo_profiles_without_a_chain_client():
+    profiles = score_many(["a", "b"], WalletAnalyzer(None))
+    assert [profile["is_demo"] for profile in profiles] == [True, True]
+    assert [profile["address"] for profile in profiles] == ["a", "b"]
@@ -0,0 +1,148 @@
+"""
+Cardano Career Navigator - Tool Call Memoization
+Per-job (and optionally cross-job) caching of crew tool results
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from metrics import tool_latency
+from tracing import span
+
+
+class SharedToolCache:
+    """Cross-job LRU of tool results with a time-to-live"""
+
+    def __init__(self, ttl_seconds: float = 300, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str]) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def put(self, key: Tuple[str, str], value: Any):
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class ToolCallCache:
+    """Tool results memoized for the duration of one job"""
+
+    def __init__(self, shared: Optional[SharedToolCache] = None):
+        self.shared = shared
+        self._results: Dict[Tuple[str, str], Any] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def call(self, tool_name: str, key: str, compute: Callable[[], Any]) -> Any:
+        """Return the memoized result for (tool_name, key), computing it on a miss"""
+        cache_key = (tool_name, key)
+        with self._lock:
+            if cache_key in self._results:
+                self._count(tool_name, "hits")
+                return self._results[cache_key]
+
+        if self.shared is not None:
+            found, value = self.shared.get(cache_key)
+            if found:
+                with self._lock:
+                    self._results[cache_key] = value
+                    self._count(tool_name, "shared_hits")
+                return value
+
+        value = compute()
+        with self._lock:
+            self._results[cache_key] = value
+            self._count(tool_name, "misses")
+        if self.shared is not None:
+            self.shared.put(cache_key, value)
+        return value
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {tool: dict(counts) for tool, counts in self._stats.items()}
+
+    def _count(self, tool_name: str, outcome: str):
+        counts = self._stats.setdefault(tool_name, {"hits": 0, "shared_hits": 0, "misses": 0})
+        counts[outcome] += 1
+
+
+# Cache of the job running in the current context (crewai copies contexts into its threads)
+_current_cache: ContextVar[Optional[ToolCallCache]] = ContextVar("tool_call_cache", default=None)
+
+
+def create_shared_tool_cache() -> Optional[SharedToolCache]:
+    """Build the cross-job tier from the environment, or None when its TTL is 0"""
+    ttl = float(os.getenv("TOOL_CACHE_SHARED_TTL", 300))
+    if ttl <= 0:
+        return None
+    return SharedToolCache(ttl, max_entries=int(os.getenv("TOOL_CACHE_SHARED_MAX_ENTRIES", 10000)))
+
+
+shared_tool_cache = create_shared_tool_cache()
+
+
+@contextmanager
+def tool_cache_scope(shared: Optional[SharedToolCache] = shared_tool_cache) -> Iterator[ToolCallCache]:
+    """Memoize tool calls made inside the block (one block per job)"""
+    cache = ToolCallCache(shared)
+    token = _current_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _current_cache.reset(token)
+
+
+def memoized_run(run: Optional[Callable[..., Any]] = None, *,
+                 version: Optional[Callable[[], str]] = None) -> Callable[..., Any]:
+    """Decorate a BaseTool._run so repeated calls with the same arguments are served from cache.
+
+    ``version`` names the data the tool reads (e.g. a snapshot version) and
+    is part of the key, so a data refresh is never answered from the old
+    results. Outside a tool_cache_scope the tool runs uncached.
+    """
+    if run is None:
+        return functools.partial(memoized_run, version=version)
+
+    @functools.wraps(run)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        with span("tool_call", "tool", tool=self.name) as attrs:
+            attrs["cached"] = True
+
+            def timed_run() -> Any:
+                attrs["cached"] = False
+                started = time.monotonic()
+                try:
+                    return run(self, *args, **kwargs)
+                finally:
+                    tool_latency.observe(time.monotonic() - started, self.name)
+
+            cache = _current_cache.get()
+            if cache is None:
+                return timed_run()
+            key_parts = [args, kwargs] if version is None else [args, kwargs, version()]
+            key = json.dumps(key_parts, sort_keys=True, default=str)
+            return cache.call(self.name, key, timed_run)
+
+    return wrapper
@@ -0,0 +1,161 @@
+"""
+Cardano Career Navigator - Job Tracing
+Span timings for queue wait, agent steps, tool calls and LLM calls, per job
+"""
+
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+# Spans kept per job; later spans are counted but dropped
+MAX_SPANS = 500
+
+
+class JobTrace:
+    """Spans recorded for one job, with start offsets relative to the job's submission"""
+
+    def __init__(self, job_id: str, started_at: Optional[float] = None, max_spans: int = MAX_SPANS):
+        self.job_id = job_id
+        self.started_at = time.time() if started_at is None else started_at
+        self.max_spans = max_spans
+        self.dropped = 0
+
+        self._spans: List[Dict[str, Any]] = []
+        self._ids = itertools.count(1)
+        # LLM start/completion events may be handled in either order
+        self._open_calls: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def next_id(self) -> int:
+        return next(self._ids)
+
+    def add(self, name: str, kind: str, start: float, end: float, span_id: Optional[int] = None,
+            parent: Optional[int] = None, **attrs: Any) -> int:
+        """Record a finished span from wall-clock start/end times"""
+        span_id = span_id or self.next_id()
+        span = {
+            "id": span_id,
+            "parent": parent,
+            "name": name,
+            "kind": kind,
+            "start": round(start - self.started_at, 6),
+            "duration": round(max(end - start, 0.0), 6)
+        }
+        if attrs:
+            span["attrs"] = attrs
+        with self._lock:
+            if len(self._spans) < self.max_spans:
+                self._spans.append(span)
+            else:
+                self.dropped += 1
+        return span_id
+
+    def llm_call(self, call_id: str, phase: str, timestamp: float, **attrs: Any):
+        """Pair LLM call started/completed/failed events into one span"""
+        event = dict(attrs, phase=phase, timestamp=timestamp)
+        with self._lock:
+            other = self._open_calls.pop(call_id, None)
+            if other is None:
+                self._open_calls[call_id] = event
+                return
+        started, finished = (other, event) if other["phase"] == "started" else (event, other)
+        merged = {key: value for key, value in dict(started, **finished).items()
+                  if value is not None and key not in ("phase", "timestamp", "parent")}
+        self.add("llm_call", "llm", started["timestamp"], finished["timestamp"],
+                 parent=started.get("parent"), status=finished["phase"], **merged)
+
+    def spans(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return sorted(self._spans, key=lambda span: span["start"])
+
+    def breakdown(self) -> Dict[str, Dict[str, float]]:
+        """Span count and total seconds per kind (nested kinds overlap their parents)"""
+        totals: Dict[str, Dict[str, float]] = {}
+        for span in self.spans():
+            entry = totals.setdefault(span["kind"], {"count": 0, "seconds": 0.0})
+            entry["count"] += 1
+            entry["seconds"] = round(entry["seconds"] + span["duration"], 6)
+        return totals
+
+    def to_dict(self) -> Dict[str, Any]:
+        spans = self.spans()
+        return {
+            "job_id": self.job_id,
+            "started_at": self.started_at,
+            "duration": round(max((s["start"] + s["duration"] for s in spans), default=0.0), 6),
+            "breakdown": self.breakdown(),
+            "spans": spans,
+            "dropped_spans": self.dropped
+        }
+
+
+def trace_to_jsonl(trace: Dict[str, Any]) -> str:
+    """One JSON object per span, each tagged with its job id"""
+    return "".join(
+        json.dumps(dict(span, job_id=trace["job_id"]), separators=(",", ":"), default=str) + "\n"
+        for span in trace.get("spans", [])
+    )
+
+
+def export_trace(trace: Dict[str, Any], path: Optional[str] = None) -> bool:
+    """Append a finished trace to TRACE_EXPORT_PATH as JSON lines; False when export is off"""
+    path = path or os.getenv("TRACE_EXPORT_PATH")
+    if not path:
+        return False
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.write(trace_to_jsonl(trace))
+    return True
+
+
+# Trace and innermost open span of the job running in the current context
+_current_trace: ContextVar[Optional[JobTrace]] = ContextVar("job_trace", default=None)
+_current_span: ContextVar[Optional[int]] = ContextVar("job_span", default=None)
+
+
+def current_trace() -> Optional[JobTrace]:
+    return _current_trace.get()
+
+
+def current_span() -> Optional[int]:
+    return _current_span.get()
+
+
+@contextmanager
+def trace_scope(trace: Optional[JobTrace]) -> Iterator[Optional[JobTrace]]:
+    """Make trace the one spans are recorded into inside the block"""
+    reset = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(reset)
+
+
+@contextmanager
+def span(name: str, kind: str, **attrs: Any) -> Iterator[Dict[str, Any]]:
+    """Time the block as a child of the current span; a no-op outside a trace_scope.
+
+    Yields a dict whose items are added to the span's attributes.
+    """
+    trace = _current_trace.get()
+    extra: Dict[str, Any] = {}
+    if trace is None:
+        yield extra
+        return
+
+    span_id = trace.next_id()
+    parent = _current_span.get()
+    reset = _current_span.set(span_id)
+    start = time.time()
+    try:
+        yield extra
+    except BaseException as e:
+        extra["error"] = type(e).__name__
+        raise
+    finally:
+        _current_span.reset(reset)
+        trace.add(name, kind, start, time.time(), span_id=span_id, parent=parent, **attrs, **extra)
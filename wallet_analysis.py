@@ -0,0 +1,299 @@
+"""
+Cardano Career Navigator - Wallet Analysis
+Transaction classification ported from src/analyzer.js and incremental per-wallet aggregates
+"""
+
+import bisect
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import requests
+
+from chain_client import BlockfrostClient, ChainDataError, create_chain_client
+
+TRANSACTION_TYPES = ("transfer", "nft", "defi", "governance", "begin-wallet", "staking")
+
+# Substrings of asset units that identify DeFi protocols, checked in order
+DEFI_PROTOCOL_MARKERS = (
+    (("sundae",), "sundaeswap"),
+    (("liqwid", "lq"), "liqwid"),
+    (("minswap", "min"), "minswap"),
+    (("muesli",), "muesliswap"),
+    (("djed", "shen"), "djed-stablecoin")
+)
+
+# Upper bounds of the per-transaction asset-count histogram bins (1, 2, 3, 4-5, 6+)
+ASSET_HISTOGRAM_BOUNDS = (1, 2, 3, 5)
+
+# Profile returned when no chain API is configured (demo mode)
+DEMO_PROFILE = {
+    "experience_level": "intermediate",
+    "transaction_count": 45,
+    "technical_skills": ["staking", "defi", "nft-trading", "begin-wallet"],
+    "interests": ["real-world-utility", "travel", "governance"],
+    "preferred_path": "development",
+    "learning_style": "hands-on"
+}
+
+
+def classify_transaction(tx: Dict[str, Any]) -> str:
+    """Classify transaction type based on assets and metadata"""
+    assets = tx.get("assets") or []
+    metadata = tx.get("metadata") or {}
+
+    # NFT transactions move a single unit of a native asset
+    if any(asset["unit"] != "lovelace" and str(asset["quantity"]) == "1" for asset in assets):
+        return "nft"
+
+    # DeFi transactions move several assets at once
+    if len(assets) > 2:
+        return "defi"
+
+    # Governance metadata labels (CIP-36 voting)
+    if "61284" in metadata or "61285" in metadata:
+        return "governance"
+
+    # Begin Wallet progress metadata (label 100)
+    if "100" in metadata:
+        return "begin-wallet"
+
+    if "staking" in metadata or tx.get("certificate_count", 0) > 0:
+        return "staking"
+
+    return "transfer"
+
+
+def extract_defi_protocol_skills(assets: Iterable[Dict[str, Any]]) -> Set[str]:
+    """Extract DeFi protocol-specific skills from the assets of a transaction"""
+    skills = set()
+    for asset in assets:
+        unit = asset["unit"].lower()
+        for markers, skill in DEFI_PROTOCOL_MARKERS:
+            if any(marker in unit for marker in markers):
+                skills.add(skill)
+                break
+    return skills
+
+
+def default_profile(address: str, error_message: Optional[str] = None) -> Dict[str, Any]:
+    """Profile for new wallets or when analysis fails"""
+    return {
+        "address": address,
+        "experience_level": "beginner",
+        "technical_skills": ["wallet-management"],
+        "interests": ["learning", "blockchain-technology"],
+        "learning_style": "theoretical",
+        "preferred_path": "development",
+        "transaction_count": 0,
+        "analysis_timestamp": time.time(),
+        "is_default": True,
+        "error_message": error_message
+    }
+
+
+def new_aggregate() -> Dict[str, Any]:
+    """Empty per-address aggregate that transactions are folded into"""
+    return {
+        "type_counts": {},
+        "protocol_skills": [],
+        "asset_histogram": [0] * (len(ASSET_HISTOGRAM_BOUNDS) + 1),
+        "cursor": None,
+        "updated_at": 0.0
+    }
+
+
+def fold_transactions(aggregate: Dict[str, Any], transactions: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Add classified transactions to an aggregate in place"""
+    type_counts = Counter(aggregate["type_counts"])
+    protocol_skills = set(aggregate["protocol_skills"])
+    histogram = aggregate.get("asset_histogram") or [0] * (len(ASSET_HISTOGRAM_BOUNDS) + 1)
+
+    for tx in transactions:
+        tx_type = classify_transaction(tx)
+        type_counts[tx_type] += 1
+        if tx_type == "defi":
+            protocol_skills |= extract_defi_protocol_skills(tx["assets"])
+        histogram[bisect.bisect_left(ASSET_HISTOGRAM_BOUNDS, len(tx.get("assets") or []))] += 1
+
+    aggregate["type_counts"] = dict(type_counts)
+    aggregate["protocol_skills"] = sorted(protocol_skills)
+    aggregate["asset_histogram"] = histogram
+    return aggregate
+
+
+class WalletProfileStore:
+    """Per-address aggregates, in memory (least recently used beyond max_entries dropped) or in a SQLite (WAL) file"""
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 10000):
+        self.path = path
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        if self.path:
+            conn = self._connection()
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS wallet_profiles (
+                    address TEXT PRIMARY KEY,
+                    aggregate TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def get(self, address: str) -> Optional[Dict[str, Any]]:
+        if not self.path:
+            with self._lock:
+                payload = self._memory.get(address)
+                if payload is not None:
+                    self._memory.move_to_end(address)
+        else:
+            row = self._connection().execute(
+                "SELECT aggregate FROM wallet_profiles WHERE address = ?", (address,)
+            ).fetchone()
+            payload = row[0] if row else None
+        return json.loads(payload) if payload else None
+
+    def put(self, address: str, aggregate: Dict[str, Any]):
+        payload = json.dumps(aggregate)
+        if not self.path:
+            with self._lock:
+                self._memory[address] = payload
+                self._memory.move_to_end(address)
+                while len(self._memory) > self.max_entries:
+                    # A dropped wallet is rebuilt from the chain on its next analysis
+                    self._memory.popitem(last=False)
+            return
+        self._connection().execute(
+            "INSERT OR REPLACE INTO wallet_profiles (address, aggregate, updated_at) VALUES (?, ?, ?)",
+            (address, payload, aggregate["updated_at"])
+        )
+
+
+class WalletAnalyzer:
+    """Profiles wallets incrementally from the chain API.
+
+    Each address keeps an aggregate (type counts, DeFi protocol skills and a
+    cursor at the newest transaction folded in). Repeat analyses page forward
+    from the cursor and classify transactions that are new since then. The
+    cursor only moves past transactions that were actually folded, so a
+    failed lookup or a capped batch is picked up by the next refresh.
+    """
+
+    def __init__(self, client: Optional[BlockfrostClient], max_transactions: int = 1000,
+                 profiles: Optional[WalletProfileStore] = None, refresh_seconds: float = 60):
+        self.client = client
+        self.max_transactions = max_transactions
+        self.profiles = profiles or WalletProfileStore()
+        self.refresh_seconds = refresh_seconds
+
+    def analyze(self, address: str) -> Dict[str, Any]:
+        """Analyze one wallet address into a career profile (wallet_scoring.score_many for one)"""
+        from wallet_scoring import score_many
+        return score_many([address], self)[0]
+
+    def refresh(self, address: str) -> Dict[str, Any]:
+        """Bring an address's aggregate up to date with the chain.
+
+        Raises the chain error only when nothing is stored for the address
+        yet; otherwise the last known aggregate is returned marked stale.
+        """
+        aggregate = self.profiles.get(address) or new_aggregate()
+        if time.time() - aggregate["updated_at"] < self.refresh_seconds:
+            return aggregate
+
+        try:
+            new_transactions, complete = self._transactions_since(address, aggregate["cursor"])
+            details, failed = self.client.fetch_transaction_details([tx["tx_hash"] for tx in new_transactions])
+        except (requests.RequestException, ChainDataError) as e:
+            print(f"Transaction analysis failed for {address[:20]}...: {e}")
+            if aggregate["cursor"] is None:
+                raise
+            # Fall back to what we already know about this wallet
+            return dict(aggregate, stale=True)
+
+        # Fold the oldest transactions up to the first failed lookup; the rest are retried next time
+        failed = set(failed)
+        folded = next((new_transactions[:i] for i, tx in enumerate(new_transactions) if tx["tx_hash"] in failed),
+                      new_transactions)
+        if failed and not folded and aggregate["cursor"] is None:
+            raise ChainDataError(f"Could not fetch any of {len(failed)} transactions")
+        folded_hashes = {tx["tx_hash"] for tx in folded}
+        fold_transactions(aggregate, [detail for detail in details if detail["hash"] in folded_hashes])
+        if folded:
+            newest = folded[-1]
+            aggregate["cursor"] = {
+                "tx_hash": newest["tx_hash"],
+                "block_height": newest["block_height"],
+                "tx_index": newest.get("tx_index", 0)
+            }
+        caught_up = complete and not failed
+        if caught_up:
+            aggregate["updated_at"] = time.time()
+        if folded or caught_up:
+            self.profiles.put(address, aggregate)
+
+        result = dict(aggregate, new_transactions=len(folded))
+        if not caught_up:
+            # Known to be behind the chain; the next analysis continues from the cursor
+            result["stale"] = True
+        return result
+
+    def _transactions_since(self, address: str,
+                            cursor: Optional[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], bool]:
+        """Oldest-first transactions after the cursor (at most max_transactions), and whether that is all of them.
+
+        A wallet seen for the first time is profiled from its newest
+        max_transactions; after that the listing starts at the cursor and
+        pages forward, so a capped batch leaves no gap.
+        """
+        if cursor is None:
+            newest = list(self.client.iter_address_transactions(address, max_items=self.max_transactions))
+            return newest[::-1], True
+
+        position = (cursor["block_height"], cursor["tx_index"])
+        transactions = []
+        listing = self.client.iter_address_transactions(
+            address, order="asc", from_block=f"{cursor['block_height']}:{cursor['tx_index']}"
+        )
+        for tx in listing:
+            if (tx["block_height"], tx.get("tx_index", 0)) <= position:
+                continue
+            if len(transactions) >= self.max_transactions:
+                return transactions, False
+            transactions.append(tx)
+        return transactions, True
+
+
+_wallet_analyzer: Optional[WalletAnalyzer] = None
+_wallet_analyzer_lock = threading.Lock()
+
+
+def get_wallet_analyzer() -> WalletAnalyzer:
+    """Shared analyzer built from the environment on first use"""
+    global _wallet_analyzer
+    with _wallet_analyzer_lock:
+        if _wallet_analyzer is None:
+            _wallet_analyzer = WalletAnalyzer(
+                create_chain_client(),
+                max_transactions=int(os.getenv("WALLET_MAX_TRANSACTIONS", 1000)),
+                profiles=WalletProfileStore(
+                    os.getenv("WALLET_PROFILE_DB") or None,
+                    max_entries=int(os.getenv("WALLET_PROFILE_MAX_ENTRIES", 10000))
+                ),
+                refresh_seconds=float(os.getenv("WALLET_PROFILE_REFRESH_SECONDS", 60))
+            )
+        return _wallet_analyzer
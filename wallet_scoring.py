@@ -0,0 +1,274 @@
+"""
+Cardano Career Navigator - Batch Wallet Scoring
+Vectorised (NumPy) port of the src/analyzer.js profile heuristics, scoring many wallet aggregates at once
+"""
+
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import compress
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import requests
+
+from chain_client import ChainDataError
+from wallet_analysis import (
+    ASSET_HISTOGRAM_BOUNDS,
+    DEFI_PROTOCOL_MARKERS,
+    DEMO_PROFILE,
+    TRANSACTION_TYPES,
+    WalletAnalyzer,
+    default_profile,
+    get_wallet_analyzer
+)
+
+# Column indexes into the type-count matrix
+T = {tx_type: i for i, tx_type in enumerate(TRANSACTION_TYPES)}
+
+PROTOCOL_SKILLS = sorted(skill for _, skill in DEFI_PROTOCOL_MARKERS)
+
+EXPERIENCE_LEVELS = ("beginner", "intermediate", "advanced")
+LEARNING_STYLES = ("theoretical", "visual", "experiential")
+PATHS = ("development", "design", "community", "research")
+
+# Skill columns in output order, each enabled by a non-zero transaction type
+TYPE_SKILLS = (
+    ("nft", "nft"),
+    ("dapp-interaction", "nft"),
+    ("dapp-interaction", "defi"),
+    ("defi", "defi"),
+    ("governance", "governance"),
+    ("drep", "governance"),
+    ("catalyst", "governance"),
+    ("begin-wallet", "begin-wallet"),
+    ("metadata-interaction", "begin-wallet"),
+    ("dapp-discovery", "begin-wallet"),
+    ("staking", "staking"),
+    ("delegation", "staking")
+)
+
+# Interest groups with the transaction type and minimum count that unlock them
+INTEREST_RULES = (
+    (("collecting", "art", "digital-assets"), "nft", 2),
+    (("trading", "yield-farming", "financial-innovation"), "defi", 2),
+    (("governance", "community-building", "decentralization"), "governance", 1),
+    (("passive-income", "network-security"), "staking", 1),
+    (("real-world-utility", "travel", "mobile-integration"), "begin-wallet", 1)
+)
+DEFAULT_INTERESTS = ("learning", "blockchain-technology")
+
+
+class FeatureMatrix:
+    """Array-backed features for a batch of wallet aggregates"""
+
+    def __init__(self, type_counts: np.ndarray, asset_histogram: np.ndarray, protocol_mask: np.ndarray):
+        self.type_counts = type_counts          # (n, len(TRANSACTION_TYPES)) int32
+        self.asset_histogram = asset_histogram  # (n, len(ASSET_HISTOGRAM_BOUNDS) + 1) int32
+        self.protocol_mask = protocol_mask      # (n, len(PROTOCOL_SKILLS)) bool
+
+    def __len__(self) -> int:
+        return self.type_counts.shape[0]
+
+
+def encode_aggregates(aggregates: List[Dict[str, Any]]) -> FeatureMatrix:
+    """Pack wallet aggregates into compact feature matrices"""
+    n = len(aggregates)
+    type_counts = np.zeros((n, len(TRANSACTION_TYPES)), dtype=np.int32)
+    histogram = np.zeros((n, len(ASSET_HISTOGRAM_BOUNDS) + 1), dtype=np.int32)
+    protocol_mask = np.zeros((n, len(PROTOCOL_SKILLS)), dtype=bool)
+    protocol_index = {skill: i for i, skill in enumerate(PROTOCOL_SKILLS)}
+
+    for row, aggregate in enumerate(aggregates):
+        for tx_type, count in aggregate["type_counts"].items():
+            type_counts[row, T[tx_type]] = count
+        if aggregate.get("asset_histogram"):
+            histogram[row] = aggregate["asset_histogram"]
+        for skill in aggregate["protocol_skills"]:
+            protocol_mask[row, protocol_index[skill]] = True
+
+    return FeatureMatrix(type_counts, histogram, protocol_mask)
+
+
+def score_features(features: FeatureMatrix) -> Dict[str, np.ndarray]:
+    """Compute experience, skills, interests, learning style and path scores for every row.
+
+    Skills come out in a fixed column order; analyzer.js lists the same
+    skills in the order their transaction types were first seen.
+    """
+    counts = features.type_counts
+    present = counts > 0
+    tx_count = counts.sum(axis=1)
+    unique_types = present.sum(axis=1)
+    has_complex = present[:, [T["defi"], T["governance"], T["nft"]]].any(axis=1)
+
+    experience = np.select(
+        [(tx_count >= 20) & (unique_types >= 4) & has_complex,
+         (tx_count >= 5) & ((unique_types >= 2) | has_complex)],
+        [2, 1],
+        default=0
+    )
+
+    # Boolean skill matrix: type-driven skills, protocol skills, then activity skills
+    skill_names = []
+    skill_columns = []
+    for skill, tx_type in TYPE_SKILLS:
+        if skill in skill_names:
+            skill_columns[skill_names.index(skill)] |= present[:, T[tx_type]]
+            continue
+        skill_names.append(skill)
+        skill_columns.append(present[:, T[tx_type]].copy())
+    for i, skill in enumerate(PROTOCOL_SKILLS):
+        skill_names.append(skill)
+        skill_columns.append(features.protocol_mask[:, i] & present[:, T["defi"]])
+    skill_names += ["wallet-management", "transaction-analysis"]
+    skill_columns += [tx_count >= 1, tx_count >= 10]
+    skills = np.column_stack(skill_columns)
+
+    interest_names = []
+    interest_columns = []
+    for names, tx_type, threshold in INTEREST_RULES:
+        unlocked = counts[:, T[tx_type]] >= threshold
+        for name in names:
+            interest_names.append(name)
+            interest_columns.append(unlocked)
+    interests = np.column_stack(interest_columns)
+
+    learning = np.select(
+        [(tx_count >= 10) & (unique_types >= 3), present[:, T["nft"]] | (unique_types >= 2)],
+        [2, 1],
+        default=0
+    )
+
+    def skill(name):
+        return skills[:, skill_names.index(name)]
+
+    def interest(name):
+        return interests[:, interest_names.index(name)]
+
+    path_scores = np.column_stack([
+        3 * skill("defi") + 2 * skill("dapp-interaction") + 2 * skill("metadata-interaction")
+        + 2 * interest("financial-innovation"),
+        3 * skill("nft") + 3 * interest("art") + 2 * interest("digital-assets") + interest("collecting"),
+        3 * skill("governance") + 2 * skill("catalyst") + 3 * interest("community-building")
+        + 2 * interest("decentralization"),
+        # analyzer.js also scores a lone 'blockchain-technology' interest, which
+        # never happens since the default interests come as a pair
+        (tx_count < 3).astype(np.int32) + skill("transaction-analysis")
+    ]).astype(np.int32)
+
+    # Later paths win ties (matches the JS reduce); all-zero rows default to development
+    reversed_best = np.argmax(path_scores[:, ::-1], axis=1)
+    best_path = np.where(path_scores.max(axis=1) > 0, len(PATHS) - 1 - reversed_best, 0)
+
+    return {
+        "transaction_count": tx_count,
+        "experience": experience,
+        "skills": skills,
+        "skill_names": np.array(skill_names),
+        "interests": interests,
+        "interest_names": np.array(interest_names),
+        "learning_style": learning,
+        "path_scores": path_scores,
+        "preferred_path": best_path,
+        "asset_histogram": features.asset_histogram
+    }
+
+
+def score_aggregates(addresses: List[str], aggregates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Score a batch of aggregates into career profiles, one per address"""
+    if not aggregates:
+        return []
+
+    scores = score_features(encode_aggregates(aggregates))
+    now = time.time()
+
+    # Convert to Python lists once; per-element NumPy indexing dominates otherwise
+    skill_names = scores["skill_names"].tolist()
+    interest_names = scores["interest_names"].tolist()
+    columns = zip(
+        scores["experience"].tolist(),
+        scores["skills"].tolist(),
+        scores["interests"].tolist(),
+        scores["learning_style"].tolist(),
+        scores["preferred_path"].tolist(),
+        scores["path_scores"].tolist(),
+        scores["transaction_count"].tolist(),
+        scores["asset_histogram"].tolist()
+    )
+
+    profiles = []
+    for address, aggregate, (experience, skills, interests, learning, path, path_scores, tx_count, histogram) in zip(
+        addresses, aggregates, columns
+    ):
+        profiles.append({
+            "address": address,
+            "experience_level": EXPERIENCE_LEVELS[experience],
+            "technical_skills": list(compress(skill_names, skills)),
+            "interests": list(compress(interest_names, interests)) or list(DEFAULT_INTERESTS),
+            "learning_style": LEARNING_STYLES[learning],
+            "preferred_path": PATHS[path],
+            "path_scores": dict(zip(PATHS, path_scores)),
+            "transaction_count": tx_count,
+            "type_counts": dict(aggregate["type_counts"]),
+            "asset_histogram": histogram,
+            "analysis_timestamp": now
+        })
+    return profiles
+
+
+def score_many(addresses: Iterable[str], analyzer: Optional[WalletAnalyzer] = None,
+               concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Refresh and score many wallet addresses, returning one profile per address.
+
+    Distinct addresses are refreshed concurrently (``concurrency`` at a time,
+    default WALLET_SCORE_CONCURRENCY or the chain client's connection pool
+    size) over the analyzer's shared client.
+    """
+    analyzer = analyzer or get_wallet_analyzer()
+    addresses = list(addresses)
+
+    if analyzer.client is None:
+        return [dict(DEMO_PROFILE, address=address, is_demo=True) for address in addresses]
+
+    def refresh(address: str) -> Any:
+        try:
+            return analyzer.refresh(address)
+        except (requests.RequestException, ChainDataError) as e:
+            return e
+
+    unique = list(dict.fromkeys(addresses))
+    concurrency = concurrency or int(os.getenv("WALLET_SCORE_CONCURRENCY", 0)) or analyzer.client.max_concurrency
+    if len(unique) <= 1 or concurrency <= 1:
+        refreshed = dict(zip(unique, map(refresh, unique)))
+    else:
+        # A separate pool: each refresh fans its transaction lookups out on the client's own pool
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(unique)), thread_name_prefix="wallet-score") as pool:
+            refreshed = dict(zip(unique, pool.map(refresh, unique)))
+
+    profiles: List[Optional[Dict[str, Any]]] = [None] * len(addresses)
+    scored_rows, scored_aggregates = [], []
+    for row, address in enumerate(addresses):
+        outcome = refreshed[address]
+        if isinstance(outcome, Exception):
+            profiles[row] = default_profile(address, str(outcome))
+        else:
+            scored_aggregates.append(outcome)
+            scored_rows.append(row)
+
+    scored = score_aggregates([addresses[row] for row in scored_rows], scored_aggregates)
+    for row, aggregate, profile in zip(scored_rows, scored_aggregates, scored):
+        for flag in ("stale", "new_transactions"):
+            if flag in aggregate:
+                profile[flag] = aggregate[flag]
+        profiles[row] = profile
+    return profiles
+
+
+if __name__ == "__main__":
+    # Offline re-scoring: addresses as arguments or one per line on stdin, JSON lines out
+    addresses = sys.argv[1:] or [line.strip() for line in sys.stdin if line.strip()]
+    for profile in score_many(addresses):
+        print(json.dumps(profile))